@@ -9,6 +9,11 @@ terminal (so every library believes it is attached to a TTY and actually draws):
      for the libraries whose API supports it (us per rendered update).
   C. Import time ...................... cold `import` cost in a fresh interpreter
      (ms), interpreter-startup baseline subtracted.
+  D. Memory per bar ................... bytes kept alive per finished bar
+     (tracemalloc), for code that holds on to many bars, e.g. one per file.
+  E. Manual next() overhead ........... `next(bar)` per item on a bar that
+     wraps the iterable (ns added per item); progressbar2 only, the other
+     libraries' bars are not iterators themselves.
 
 Results are written to results.json for the reporting step to consume.
 """
@@ -37,6 +42,8 @@ ITER_REPEATS: int = 7
 N_RENDER: int = 30_000  # scenario B: forced-render loop length
 RENDER_REPEATS: int = 5
 IMPORT_RUNS: int = 9  # scenario C: cold-import subprocess runs
+N_BARS: int = 1_000  # scenario D: bars kept alive per measurement
+N_NEXT: int = 1_000_000  # scenario E: manual next() calls
 
 TERM_COLS: int = 80
 TERM_ROWS: int = 24
@@ -245,6 +252,103 @@ def time_import(stmt: str, runs: int) -> float:
     return min(samples)
 
 
+# --- Scenario E: manual next() overhead ----------------------------------
+
+
+def next_baseline(n: int) -> None:
+    iterator = iter(range(n))
+    for _ in range(n):
+        next(iterator)
+
+
+def next_progressbar2(f: typing.TextIO, n: int) -> None:
+    # Hand-rolled loops that pull items with `next(bar)`, e.g. to consume
+    # the stream from several places. Goes through the same integer gate
+    # as `for item in bar`.
+    import progressbar
+
+    bar = progressbar.ProgressBar(fd=f)(range(n))
+    for _ in range(n):
+        next(bar)
+    bar.finish()
+
+
+def next_progressbar2_fast(f: typing.TextIO, n: int) -> None:
+    import progressbar
+
+    bar = progressbar.FastProgressBar(fd=f)(range(n))
+    for _ in range(n):
+        next(bar)
+    bar.finish()
+
+
+NEXT_LIBS: dict[str, typing.Callable[[typing.TextIO, int], None]] = {
+    'progressbar2': next_progressbar2,
+    'progressbar2-fast': next_progressbar2_fast,
+}
+
+
+# --- Scenario D: memory per bar -------------------------------------------
+
+# Each snippet defines `make()`, returning one bar that has been used. They
+# run in a fresh interpreter each, so the bars of one case don't share
+# CPython's per-class instance key tables with another.
+MEMORY_SETUPS: dict[str, str] = {
+    'progressbar2': """
+import io, progressbar
+def make():
+    bar = progressbar.ProgressBar(fd=io.StringIO(), max_value=100)
+    bar.start(); bar.update(50); bar.finish()
+    return bar
+""",
+    'progressbar2-fast': """
+import io, progressbar
+def make():
+    bar = progressbar.FastProgressBar(fd=io.StringIO(), max_value=100)
+    bar.start(); bar.update(50); bar.finish()
+    return bar
+""",
+    'progressbar2 MultiBar child': """
+import io, itertools, progressbar
+multibar = progressbar.MultiBar(fd=io.StringIO())
+keys = itertools.count()
+def make():
+    bar = multibar[str(next(keys))]
+    bar.start(); bar.update(50)
+    return bar
+""",
+    'tqdm': """
+import io
+from tqdm import tqdm
+def make():
+    bar = tqdm(total=100, file=io.StringIO())
+    bar.update(50); bar.close()
+    return bar
+""",
+}
+
+MEMORY_MEASURE: str = """
+import gc, tracemalloc
+make()
+gc.collect()
+tracemalloc.start()
+bars = [make() for _ in range({n})]
+gc.collect()
+print(tracemalloc.get_traced_memory()[0] / {n})
+"""
+
+
+def measure_memory(setup: str, n: int) -> float:
+    """Return the bytes per bar for ``n`` bars made by ``setup``'s make()."""
+    result = subprocess.run(
+        [sys.executable, '-c', setup + MEMORY_MEASURE.format(n=n)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(result.stdout)
+
+
 ITER_LIBS: dict[str, typing.Callable[[typing.TextIO, int], None]] = {
     'progressbar2[fast]': iter_progressbar2_fast,
     'progressbar2': iter_progressbar2,
@@ -287,6 +391,8 @@ def main() -> None:
             'n_render': N_RENDER,
             'render_repeats': RENDER_REPEATS,
             'import_runs': IMPORT_RUNS,
+            'n_bars': N_BARS,
+            'n_next': N_NEXT,
             'term': f'{TERM_COLS}x{TERM_ROWS}',
         },
     }
@@ -348,6 +454,28 @@ def main() -> None:
                 'line changes); no force-every-update API',
             },
         }
+
+        # Scenario E ----------------------------------------------------
+        print('[E] manual next() overhead', file=sys.stderr)
+        base_next = time_call(lambda: next_baseline(N_NEXT), ITER_REPEATS)
+        next_results: dict[str, typing.Any] = {}
+        for name, fn in NEXT_LIBS.items():
+            res = time_call(lambda f=fn: f(sink.file, N_NEXT), ITER_REPEATS)
+            overhead_ns = (res['min'] - base_next['min']) / N_NEXT * 1e9
+            next_results[name] = {
+                'total_min_s': res['min'],
+                'total_median_s': res['median'],
+                'overhead_ns_per_iter': overhead_ns,
+            }
+            print(
+                f'    {name:16} {res["min"] * 1e3:8.2f} ms  '
+                f'({overhead_ns:8.1f} ns/item)',
+                file=sys.stderr,
+            )
+        results['scenario_e_manual_next'] = {
+            'baseline_min_s': base_next['min'],
+            'libs': next_results,
+        }
     finally:
         sink.close()
 
@@ -368,6 +496,15 @@ def main() -> None:
         'libs': import_results,
     }
 
+    # Scenario D --------------------------------------------------------
+    print('[D] memory per bar', file=sys.stderr)
+    memory_results: dict[str, typing.Any] = {}
+    for name, setup in MEMORY_SETUPS.items():
+        per_bar = measure_memory(setup, N_BARS)
+        memory_results[name] = {'bytes_per_bar': per_bar}
+        print(f'    {name:28} {per_bar:8.0f} B', file=sys.stderr)
+    results['scenario_d_memory_per_bar'] = {'libs': memory_results}
+
     out = os.path.join(
         os.path.dirname(os.path.abspath(__file__)), 'results.json'
     )
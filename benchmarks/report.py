@@ -312,6 +312,49 @@ def make_report(data: dict[str, typing.Any], chart_name: str) -> str:
         w(f'| {bold}{name}{bold} | {vv["net_ms"]:.1f} ms |')
     w('')
 
+    # Scenario D -------------------------------------------------------
+    d = data.get('scenario_d_memory_per_bar')
+    if d:
+        w('## D. Memory per bar')
+        w('')
+        w(
+            f'Memory kept alive per bar, measured with `tracemalloc` over '
+            f'**{meta["n_bars"]:,}** bars that have each been started, '
+            f'updated and finished, in a fresh interpreter per case. Matters '
+            f'when a program holds many bars at once, e.g. a `MultiBar` with '
+            f'one bar per file. Lower is lighter.'
+        )
+        w('')
+        w('| Bar | Bytes per bar |')
+        w('|---|--:|')
+        for name, v in _sorted(
+            {k: vv['bytes_per_bar'] for k, vv in d['libs'].items()}
+        ):
+            bold = '**' if name.startswith('progressbar2') else ''
+            w(f'| {bold}{name}{bold} | {v:,.0f} B |')
+        w('')
+
+    # Scenario E -------------------------------------------------------
+    e = data.get('scenario_e_manual_next')
+    if e:
+        w('## E. Manual `next()` overhead')
+        w('')
+        w(
+            f'Items pulled one at a time with `next(bar)` from a bar wrapping '
+            f'the iterable, over **{meta["n_next"]:,}** items. Overhead = '
+            f'(loop time - bare `next(iterator)` loop time) / items. Only '
+            f'`{SUBJECT}` is measured: the other libraries\' bars are not '
+            f'iterators themselves. Lower is faster.'
+        )
+        w('')
+        w('| Bar | Overhead/item |')
+        w('|---|--:|')
+        for name, v in _sorted(
+            {k: vv['overhead_ns_per_iter'] for k, vv in e['libs'].items()}
+        ):
+            w(f'| **{name}** | {v:.1f} ns |')
+        w('')
+
     # Takeaways --------------------------------------------------------
     a_rank = _sorted(
         {k: vv['overhead_ns_per_iter'] for k, vv in a['libs'].items()}
@@ -52,7 +52,7 @@ if typing.TYPE_CHECKING:
     from .base import UnknownLength
     from .fast import FastProgressBar
     from .multi import MultiBar, SortKey
-    from .shortcuts import progressbar
+    from .shortcuts import aprogressbar, progressbar
     from .terminal.stream import LineOffsetStreamWrapper
     from .utils import len_color, streams
     from .widgets import (
@@ -124,6 +124,7 @@ _NAME_TO_MODULE: dict[str, str] = {
     'process_map': '_parallel',
     'starmap': '_parallel',
     'thread_map': '_parallel',
+    'aprogressbar': 'shortcuts',
     'progressbar': 'shortcuts',
     'LineOffsetStreamWrapper': 'terminal.stream',
     'len_color': 'utils',
@@ -248,6 +249,7 @@ __all__ = [
     'VariableMixin',
     '__author__',
     '__version__',
+    'aprogressbar',
     'current_task_bar',
     'len_color',
     'parallel',
@@ -20,9 +20,16 @@ from .. import (
     base,
 )
 
+if typing.TYPE_CHECKING:
+    from . import _shared
+
 #: One zipped argument tuple, i.e. one call's positional arguments.
 ItemArgs = tuple[typing.Any, ...]
 
+#: What `current_task_bar` hands a worker: the task's own bar, or its
+#: shared-memory stand-in inside process and interpreter workers.
+TaskBar = typing.Union[bar_module.ProgressBar, '_shared.SharedTaskBar']
+
 T = typing.TypeVar('T')
 
 #: Chunk sizing targets ~16 chunks per worker so completion events stay
@@ -35,21 +42,22 @@ _WINDOWS_PER_WORKER: int = 4
 _MIN_BUFFERSIZE: int = 16
 
 #: The bar owned by the currently executing task, set by `with_task_bar`
-#: around each worker invocation under ``bar='multi'``. Workers read it
-#: through `current_task_bar`.
-_task_bar_var: contextvars.ContextVar[bar_module.ProgressBar | None] = (
-    contextvars.ContextVar('current_task_bar', default=None)
+#: (or `_shared.run_with_slot` in process workers) around each worker
+#: invocation under ``bar='multi'``. Workers read it through
+#: `current_task_bar`.
+_task_bar_var: contextvars.ContextVar[TaskBar | None] = contextvars.ContextVar(
+    'current_task_bar', default=None
 )
 
 
-def current_task_bar() -> bar_module.ProgressBar | None:
+def current_task_bar() -> TaskBar | None:
     """Return the calling task's own progress bar, if it has one.
 
     Inside a function executed by `progressbar.map`/`amap` with
     ``bar='multi'`` this returns the per-task bar so the worker can
-    report sub-progress (``current_task_bar().update(i)``). Anywhere
-    else -- including process-pool workers, which cannot share a bar
-    object with the parent in v1 -- it returns `None`.
+    report sub-progress (``current_task_bar().update(i)``). Process and
+    interpreter workers get a `SharedTaskBar` with the same reporting
+    methods, backed by shared memory. Anywhere else it returns `None`.
     """
     return _task_bar_var.get()
 
@@ -61,9 +69,7 @@ def with_task_bar(
     """Wrap `inner` so `current_task_bar` returns `task_bar` inside it."""
 
     def _bound() -> T:
-        token: contextvars.Token[bar_module.ProgressBar | None] = (
-            _task_bar_var.set(task_bar)
-        )
+        token: contextvars.Token[TaskBar | None] = _task_bar_var.set(task_bar)
         try:
             return inner()
         finally:
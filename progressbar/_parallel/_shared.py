@@ -0,0 +1,188 @@
+"""Shared-memory task progress for process and interpreter workers.
+
+A `ProgressBar` does not survive pickling, so under ``bar='multi'`` a
+process (or interpreter) worker cannot update its task bar directly.
+Instead the coordinator owns one `multiprocessing.shared_memory` block
+with a slot per in-flight task, and `current_task_bar()` inside the
+worker returns a `SharedTaskBar` that writes the task's progress into
+its slot with a plain store. The coordinator copies the slots onto the
+real task bars once per poll interval, so reporting progress costs no
+IPC message per update.
+"""
+
+from __future__ import annotations
+
+import sys
+import typing
+
+from .. import base
+from . import _common
+
+if typing.TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+    from .. import bar as bar_module
+
+T = typing.TypeVar('T')
+
+#: One C double per slot, so both counts and fractional progress fit.
+_SLOT_FORMAT: typing.Final = 'd'
+_SLOT_SIZE: int = 8
+
+
+def _slot_view(memory: shared_memory.SharedMemory) -> memoryview[float]:
+    """Return the block's slots as an array of doubles."""
+    buffer = memory.buf
+    assert buffer is not None
+    return buffer.cast(_SLOT_FORMAT)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open the coordinator's block from a worker."""
+    # Deferred import: only runs that hand out shared slots pay for it
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):  # pragma: no cover - version gate
+        # The coordinator owns (and unlinks) the block; an attaching
+        # worker must not register it with the resource tracker too
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedSlots:
+    """The coordinator's side: a shared block and its free slots.
+
+    Sized to the run's submission window, which bounds the number of
+    in-flight tasks, so `acquire` always finds a free slot.
+    """
+
+    memory: shared_memory.SharedMemory
+    values: memoryview[float]
+    _free: list[int]
+
+    def __init__(self, size: int) -> None:
+        """Create a zeroed block of `size` slots."""
+        from multiprocessing import shared_memory
+
+        self.memory = shared_memory.SharedMemory(
+            create=True, size=max(size, 1) * _SLOT_SIZE
+        )
+        self.values = _slot_view(self.memory)
+        self._free = list(reversed(range(size)))
+
+    @property
+    def name(self) -> str:
+        """The block's system-wide name, passed on to the workers."""
+        return self.memory.name
+
+    def acquire(self) -> int:
+        """Reserve a slot for a new task, starting at zero."""
+        slot: int = self._free.pop()
+        self.values[slot] = 0
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Return the slot of a finished task."""
+        self._free.append(slot)
+
+    def read(self, slot: int) -> int | float:
+        """Return the progress in `slot`, as an int when it is whole."""
+        value: float = self.values[slot]
+        return int(value) if value.is_integer() else value
+
+    def close(self) -> None:
+        """Unmap and remove the block."""
+        self.values.release()
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SharedTaskBar:
+    """Stand-in for the task's bar inside a process or interpreter worker.
+
+    Offers the reporting half of the `ProgressBar` API -- `update`,
+    `increment` (and ``+=``), `value` and `counter` -- so the same worker
+    code runs on every pool kind. Each call is one store into the task's
+    shared slot; `update` keyword arguments such as variables are not
+    shared and are ignored.
+    """
+
+    def __init__(self, values: memoryview[float], slot: int) -> None:
+        """Write into `slot` of the shared `values`."""
+        self._values = values
+        self._slot = slot
+
+    @property
+    def value(self) -> float:
+        """The progress reported so far."""
+        return self._values[self._slot]
+
+    def update(
+        self,
+        value: float | None = None,
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> None:
+        """Report `value` as the task's progress."""
+        if value is not None:
+            self._values[self._slot] = value
+
+    def increment(
+        self, value: float = 1, *args: typing.Any, **kwargs: typing.Any
+    ) -> SharedTaskBar:
+        """Advance the task's progress by `value`."""
+        self._values[self._slot] += value
+        return self
+
+    def __iadd__(self, value: float) -> SharedTaskBar:
+        """Advance the task's progress by `value`."""
+        return self.increment(value)
+
+    def add(self, value: float = 1) -> None:
+        """Advance the task's progress by `value`, like a `ShardedCounter`."""
+        self.increment(value)
+
+    def counter(self) -> SharedTaskBar:
+        """Return this bar: a task's slot has a single writer already."""
+        return self
+
+
+def run_with_slot(name: str, slot: int, inner: typing.Callable[[], T]) -> T:
+    """Run `inner` in a worker with `current_task_bar()` on `slot`.
+
+    Top-level so process pools can pickle it.
+
+    Args:
+        name: The coordinator's `SharedSlots.name`.
+        slot: The slot reserved for this task.
+        inner: The task itself.
+    """
+    memory = _attach(name)
+    values: memoryview[float] = _slot_view(memory)
+    task_bar: SharedTaskBar = SharedTaskBar(values, slot)
+    token = _common._task_bar_var.set(task_bar)
+    try:
+        return inner()
+    finally:
+        _common._task_bar_var.reset(token)
+        values.release()
+        memory.close()
+
+
+def copy_progress(
+    slots: SharedSlots,
+    task_slots: dict[int, tuple[int, bar_module.ProgressBar]],
+) -> None:
+    """Move each running task's bar to the progress in its slot.
+
+    A worker can report anything, so the value is clamped to the bar's
+    range first: an out-of-range `update()` would raise right here, in
+    the coordinator, and abort the whole run.
+    """
+    for slot, task_bar in task_slots.values():
+        value = max(slots.read(slot), task_bar.min_value)
+        max_value = task_bar.max_value
+        if max_value is not None and max_value is not base.UnknownLength:
+            value = min(value, max_value)
+        if value != task_bar.value:
+            task_bar.update(value)
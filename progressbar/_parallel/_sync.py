@@ -20,6 +20,7 @@ import typing
 from . import (
     _common,
     _display,
+    _shared,
 )
 
 #: One completion event: (item index, argument tuple, ok, result/error).
@@ -39,6 +40,14 @@ def _pool_kind(pool: typing.Any) -> str:
         return pool
     if isinstance(pool, concurrent.futures.ProcessPoolExecutor):
         return 'process'
+    # Checked before falling back to 'thread': on 3.14+ the interpreter
+    # pool subclasses ThreadPoolExecutor but shares no objects with us.
+    # `()` matches nothing on older versions.
+    interpreter_pool: typing.Any = getattr(
+        concurrent.futures, 'InterpreterPoolExecutor', ()
+    )
+    if isinstance(pool, interpreter_pool):  # pragma: no cover - 3.14+
+        return 'interpreter'
     return 'thread'
 
 
@@ -236,6 +245,12 @@ class _Run:
     ]
     chunk_source: typing.Iterator[tuple[int, list[_common.ItemArgs]]]
     seq: int
+    #: Shared progress slots for process/interpreter task bars, created
+    #: with the first such task
+    slots: _shared.SharedSlots | None
+    #: Task seq -> (slot, task bar) for the tasks reporting via `slots`
+    task_slots: dict[int, tuple[int, typing.Any]]
+    next_progress_read: float
 
     def __init__(
         self,
@@ -309,6 +324,9 @@ class _Run:
         self.in_flight = {}
         self.chunk_source = _indexed_chunks(iterables, chunksize)
         self.seq = 0
+        self.slots = None
+        self.task_slots = {}
+        self.next_progress_read = 0.0
 
     def completions(self) -> typing.Iterator[Completion]:
         """Drive the run, yielding per-item events in completion order."""
@@ -317,6 +335,7 @@ class _Run:
             pass
         while self.in_flight:
             self._check_deadline()
+            self._read_task_progress()
             future = self._next_done()
             if future is not None:
                 yield from self._handle(future)
@@ -337,10 +356,13 @@ class _Run:
         )
         if task_bar is not None and self.kind == 'thread':
             # Threads share our address space, so the worker can update
-            # its sub-bar through `current_task_bar()`. Process (and
-            # interpreter) workers cannot -- the bar object does not
-            # survive pickling; see the phase-2 note in the docs.
+            # its sub-bar through `current_task_bar()`.
             inner = _common.with_task_bar(task_bar, inner)
+        elif task_bar is not None:
+            # Process (and interpreter) workers cannot -- the bar object
+            # does not survive pickling -- so they report into a shared
+            # slot that `_read_task_progress` copies onto the bar.
+            inner = self._with_shared_slot(task_bar, inner)
         future: concurrent.futures.Future[typing.Any] = self.executor.submit(
             inner
         )
@@ -348,6 +370,27 @@ class _Run:
         future.add_done_callback(self.done.put)
         return True
 
+    def _with_shared_slot(
+        self,
+        task_bar: typing.Any,
+        inner: typing.Callable[[], list[tuple[bool, typing.Any]]],
+    ) -> typing.Callable[[], list[tuple[bool, typing.Any]]]:
+        """Reserve a shared slot for the task being submitted."""
+        if self.slots is None:
+            self.slots = _shared.SharedSlots(self.window)
+        slot: int = self.slots.acquire()
+        self.task_slots[self.seq] = slot, task_bar
+        return functools.partial(
+            _shared.run_with_slot, self.slots.name, slot, inner
+        )
+
+    def _read_task_progress(self) -> None:
+        """Copy the shared task progress onto the task bars, once a poll."""
+        now: float = time.monotonic()
+        if self.slots is not None and now >= self.next_progress_read:
+            self.next_progress_read = now + self.poll_interval
+            _shared.copy_progress(self.slots, self.task_slots)
+
     def _next_done(
         self,
     ) -> concurrent.futures.Future[typing.Any] | None:
@@ -370,6 +413,12 @@ class _Run:
     ) -> typing.Iterator[Completion]:
         """Turn one finished future into per-item completion events."""
         start_index, chunk, chunk_seq = self.in_flight.pop(future)
+        shared: tuple[int, typing.Any] | None = self.task_slots.pop(
+            chunk_seq, None
+        )
+        if shared is not None:
+            assert self.slots is not None
+            self.slots.release(shared[0])
         error: BaseException | None = future.exception()
         if error is not None:
             # Fail-fast fn errors (catch=False), machinery errors (e.g.
@@ -391,6 +440,8 @@ class _Run:
             future.cancel()
         if self.owned:
             self.executor.shutdown(wait=not interrupted, cancel_futures=True)
+        if self.slots is not None:
+            self.slots.close()
         self.display.finish(success=success)
 
 
@@ -7,11 +7,16 @@ start out biased toward zero before enough samples have arrived. Both
 ignore -- it's part of the `SmoothingAlgorithm` contract (for algorithms
 that might weight by time rather than call count) but neither
 implementation here uses it.
+
+`SampleRing` is the rolling window of `(time, value)` samples behind
+`SamplesMixin` (`AdaptiveETA`, `AdaptiveTransferSpeed`).
 """
 
 from __future__ import annotations
 
 import abc
+import array
+import bisect
 import typing
 from datetime import timedelta
 
@@ -110,3 +115,102 @@ class DoubleExponentialMovingAverage(SmoothingAlgorithm):
             self.ema2 = self.alpha * self.ema1 + (1 - self.alpha) * self.ema2
 
         return 2 * self.ema1 - self.ema2
+
+
+class SampleRing:
+    """A ring buffer of `(time, value)` samples, oldest first.
+
+    The times are float seconds in non-decreasing order, stored in an
+    `array` so a long window costs 8 bytes per time instead of a
+    `datetime` object. With a `capacity`, appending to a full ring drops
+    the oldest sample. Without one the ring doubles its storage as needed,
+    and `trim` drops the samples older than a time window, found by binary
+    search rather than by popping them one by one.
+
+    >>> ring = SampleRing(capacity=2)
+    >>> for time in range(3):
+    ...     ring.append(time, time * 10)
+    >>> len(ring), ring.time(0), ring.value(-1)
+    (2, 1.0, 20)
+    """
+
+    __slots__ = ('_capacity', '_head', '_size', '_times', '_values')
+
+    def __init__(self, capacity: int | None = None) -> None:
+        """Create an empty ring.
+
+        Args:
+            capacity: The number of samples to keep, or `None` to keep
+                everything until `trim` drops it.
+        """
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+        self._times = array.array('d', bytes(8 * (capacity or 8)))
+        # The values keep their type (`int` progress stays exact)
+        self._values: list[typing.Any] = [None] * len(self._times)
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._size
+
+    def _index(self, index: int) -> int:
+        """Map a logical `index` (negative counts from the end) to a slot."""
+        if not -self._size <= index < self._size:
+            raise IndexError('sample index out of range')
+        return (self._head + index % self._size) % len(self._times)
+
+    def time(self, index: int) -> float:
+        """Return the time of the sample at `index`."""
+        return self._times[self._index(index)]
+
+    def value(self, index: int) -> typing.Any:
+        """Return the value of the sample at `index`."""
+        return self._values[self._index(index)]
+
+    def times(self) -> list[float]:
+        """Return the times, oldest first."""
+        return [self._times[self._index(i)] for i in range(self._size)]
+
+    def values(self) -> list[typing.Any]:
+        """Return the values, oldest first."""
+        return [self._values[self._index(i)] for i in range(self._size)]
+
+    def append(self, time: float, value: typing.Any) -> None:
+        """Add a sample, which must not be older than the newest one."""
+        slots = len(self._times)
+        if self._size == slots:
+            if self._capacity is None:
+                self._grow()
+                slots = len(self._times)
+            else:
+                # Full: the new sample takes the oldest one's slot
+                self._head = (self._head + 1) % slots
+                self._size -= 1
+
+        slot = (self._head + self._size) % slots
+        self._times[slot] = time
+        self._values[slot] = value
+        self._size += 1
+
+    def _grow(self) -> None:
+        """Double the storage, moving the samples to the front."""
+        times = array.array('d', self.times())
+        times.extend(times)
+        values = self.values()
+        self._times = times
+        self._values = values + values
+        self._head = 0
+
+    def trim(self, minimum: float, keep: int = 2) -> None:
+        """Drop the samples that are no longer needed for a window.
+
+        That is every sample before the newest one older than `minimum`,
+        so the window still reaches back to `minimum`, but never the
+        newest `keep` samples.
+        """
+        newer = bisect.bisect_left(range(self._size), minimum, key=self.time)
+        drop = min(newer - 1, self._size - keep)
+        if drop > 0:
+            self._head = (self._head + drop) % len(self._times)
+            self._size -= drop
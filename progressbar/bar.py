@@ -18,10 +18,11 @@ import importlib
 import itertools
 import logging
 import math
+import operator
 import os
 import sys
+import threading
 import time
-import timeit
 import typing
 import warnings
 import weakref
@@ -77,6 +78,241 @@ ValueT = NumberT | type[base.UnknownLength] | None
 
 T = typing.TypeVar('T')
 
+#: `diff_redraw` rewrites a gap of unchanged columns between two changed
+#: runs when it is shorter than this, rather than spend a cursor escape
+#: (``ESC [ n G``, five bytes from column 10 onwards) to skip it
+_DIFF_GAP = 5
+
+
+class _DataSnapshot(dict[str, typing.Any]):
+    """The mapping `ProgressBar.data()` hands to the widgets.
+
+    A real `dict` (widgets read, add and overwrite keys freely), but only
+    the plain attribute copies are filled in up front. The derived fields
+    -- the `datetime` timestamps, the elapsed-time breakdown and
+    `percentage` -- are computed by `__missing__` on first read and then
+    stored like any other key, so a layout that never shows a timer never
+    builds a `datetime`. The elapsed-time fields are integer arithmetic on
+    the bar's nanosecond timestamps. Anything that needs every key
+    (iteration, `copy()`, `**data`, `repr()`, pickling) computes the rest
+    first.
+
+    The redraw path keeps one snapshot per bar and `refresh()`es it, so
+    the dict itself is reused instead of rebuilt on every frame.
+    """
+
+    __slots__ = ('_bar',)
+
+    #: Fields copied from the bar by `refresh()`
+    FIELDS: typing.ClassVar[frozenset[str]] = frozenset(
+        (
+            'max_value',
+            'value',
+            'previous_value',
+            'updates',
+            'unit',
+            'unit_scale',
+            'variables',
+            'dynamic_messages',
+        )
+    )
+    #: Fields computed on first read
+    LAZY: typing.ClassVar[
+        dict[str, collections.abc.Callable[[_DataSnapshot], typing.Any]]
+    ] = {
+        'start_time': lambda data: data.bar.start_time,
+        'end_time': lambda data: data.bar.end_time,
+        'last_update_time': lambda data: data.bar.last_update_time,
+        'total_seconds_elapsed': lambda data: data.elapsed_us / 1e6,
+        'seconds_elapsed': lambda data: (
+            (data.elapsed_us // 1000000 % 60)
+            + (data.elapsed_us % 1000000 / 1000000.0)
+        ),
+        'minutes_elapsed': lambda data: (
+            (data.elapsed_us // 1000000 % 86400 / 60) % 60
+        ),
+        'hours_elapsed': lambda data: (
+            (data.elapsed_us // 1000000 % 86400 / (60 * 60)) % 24
+        ),
+        'days_elapsed': lambda data: data.elapsed_us / 1e6 / (60 * 60 * 24),
+        'time_elapsed': lambda data: timedelta(microseconds=data.elapsed_us),
+        'percentage': lambda data: data.bar.percentage,
+        # Read by the colored widgets, which skip the escapes when falsy
+        'enable_colors': lambda data: data.bar.enable_colors,
+        # The color steps a gradient can show, see `ColorGradient.wrap`
+        'term_width': lambda data: data.bar.term_width,  # type: ignore
+    }
+
+    def __init__(self, bar: ProgressBar, weak: bool = False) -> None:
+        """Create an empty snapshot of `bar`, see `refresh()`.
+
+        Args:
+            bar: The bar to read from.
+            weak: Only keep a weak reference to `bar`. Used for the
+                snapshot the bar keeps for itself, which would otherwise
+                form a reference cycle and delay `__del__`.
+        """
+        super().__init__()
+        self._bar: collections.abc.Callable[[], ProgressBar | None]
+        if weak:
+            self._bar = weakref.ref(bar)
+        else:
+            self._bar = lambda: bar
+
+    @property
+    def bar(self) -> ProgressBar:
+        """The bar this is a snapshot of."""
+        bar = self._bar()
+        if bar is None:  # pragma: no cover
+            raise ReferenceError('the progressbar no longer exists')
+        return bar
+
+    @property
+    def elapsed_us(self) -> int:
+        """Microseconds from `start_time` to `last_update_time`."""
+        bar = self.bar
+        elapsed = bar._last_update_ns - bar._start_ns  # type: ignore[operator]
+        return elapsed // 1000
+
+    def refresh(self) -> _DataSnapshot:
+        """Copy the bar's current state in, dropping last frame's keys."""
+        if dict.__len__(self) > len(self.FIELDS):
+            # Drop the computed fields and whatever the widgets added, so
+            # nothing from the previous frame leaks into this one
+            fields = self.FIELDS
+            stale = [key for key in dict.__iter__(self) if key not in fields]
+            for key in stale:
+                del self[key]
+
+        bar = self.bar
+        self['max_value'] = bar.max_value
+        self['value'] = bar.value
+        self['previous_value'] = bar.previous_value
+        self['updates'] = bar.updates
+        self['unit'] = bar.unit
+        self['unit_scale'] = bar.unit_scale
+        self['variables'] = bar.variables
+        # Deprecated alias for `variables`, deliberately the same object.
+        self['dynamic_messages'] = bar.variables
+        return self
+
+    def materialize(self) -> _DataSnapshot:
+        """Compute every field that has not been read yet."""
+        for key in self.LAZY:
+            if not dict.__contains__(self, key):
+                self[key] = self.LAZY[key](self)
+        return self
+
+    def __missing__(self, key: str) -> typing.Any:
+        """Compute (and store) a derived field on first read."""
+        try:
+            compute = self.LAZY[key]
+        except KeyError:
+            raise KeyError(key) from None
+
+        value = self[key] = compute(self)
+        return value
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """Return `self[key]`, computing derived fields, else `default`."""
+        if dict.__contains__(self, key) or key in self.LAZY:
+            return self[key]
+        else:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        """Derived fields count as present even before they are read."""
+        return dict.__contains__(self, key) or key in self.LAZY
+
+    def __iter__(self) -> collections.abc.Iterator[str]:
+        return dict.__iter__(self.materialize())
+
+    def __len__(self) -> int:
+        return dict.__len__(self.materialize())
+
+    def keys(self) -> collections.abc.KeysView[str]:  # type: ignore[override]
+        return dict.keys(self.materialize())
+
+    def values(  # type: ignore[override]
+        self,
+    ) -> collections.abc.ValuesView[typing.Any]:
+        return dict.values(self.materialize())
+
+    def items(  # type: ignore[override]
+        self,
+    ) -> collections.abc.ItemsView[str, typing.Any]:
+        return dict.items(self.materialize())
+
+    def copy(self) -> dict[str, typing.Any]:
+        """Return a plain `dict` with every field computed."""
+        return dict(dict.items(self.materialize()))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _DataSnapshot):
+            other = other.materialize()
+        return dict.__eq__(self.materialize(), other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self.materialize())
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return dict, (self.copy(),)
+
+
+class _ClockTime:
+    """A `datetime` view of an integer `time.perf_counter_ns()` timestamp.
+
+    The bars keep their timestamps on that one clock, so stamping a redraw
+    is a single clock read and the elapsed time a subtraction. The
+    `datetime` is only built when the attribute is read, and is reused
+    until the timestamp changes. Assigning a `datetime` (or `None`) stores
+    the matching timestamp.
+    """
+
+    def __init__(self, attribute: str) -> None:
+        #: Name of the instance attribute holding the nanosecond timestamp
+        self.attribute = attribute
+        self.view = f'{attribute}_view'
+
+    @typing.overload
+    def __get__(self, instance: None, owner: type) -> _ClockTime: ...
+
+    @typing.overload
+    def __get__(
+        self, instance: ProgressBarMixinBase, owner: type
+    ) -> datetime | None: ...
+
+    def __get__(
+        self, instance: ProgressBarMixinBase | None, owner: type
+    ) -> _ClockTime | datetime | None:
+        if instance is None:
+            return self
+
+        ns: int | None = getattr(instance, self.attribute)
+        if ns is None:
+            return None
+
+        view: tuple[int, datetime] | None = getattr(instance, self.view, None)
+        if view is None or view[0] != ns:
+            view = ns, instance._ns_to_datetime(ns)
+            setattr(instance, self.view, view)
+        return view[1]
+
+    def __set__(
+        self, instance: ProgressBarMixinBase, value: datetime | None
+    ) -> None:
+        if value is None:
+            setattr(instance, self.attribute, None)
+        else:
+            ns = instance._datetime_to_ns(value)
+            setattr(instance, self.attribute, ns)
+            setattr(instance, self.view, (ns, value))
+
 
 class ProgressBarMixinBase(abc.ABC):
     """Shared state and cooperative no-op interface for progress-bar mixins.
@@ -89,7 +325,19 @@ class ProgressBarMixinBase(abc.ABC):
 
     _started = False
     _finished = False
-    _last_update_time: float | None = None
+    #: `time.perf_counter_ns()` timestamps behind `start_time`, `end_time`
+    #: and `last_update_time`
+    _start_ns: int | None = None
+    _end_ns: int | None = None
+    _last_update_ns: int | None = None
+    #: `time.time_ns()` minus `time.perf_counter_ns()`, to convert the
+    #: timestamps to wall-clock time. Refreshed by `ProgressBar.init()`.
+    _wall_offset_ns: int = time.time_ns() - time.perf_counter_ns()
+    #: Cached widget layout, rebuilt by `_format_widgets` when `None`
+    _layout: _LayoutPlan | None = None
+    #: The line on screen as far as `diff_redraw` knows, `None` forces the
+    #: next redraw to rewrite the whole line
+    _last_line: str | None = None
 
     #: The terminal width. This should be automatically detected but will
     #: fall back to 80 if auto detection is not possible.
@@ -121,6 +369,13 @@ class ProgressBarMixinBase(abc.ABC):
     #: The minimum interval to poll for updates in seconds even if there are
     #: no updates
     min_poll_interval: float
+    #: The largest fraction of the time between redraws that a redraw may
+    #: take, `None` to never slow down for a slow `fd`
+    max_render_share: float | None
+    #: The time between redraws that keeps the measured cost of a redraw
+    #: within `max_render_share`, in seconds. Rises as soon as a redraw is
+    #: slow and decays by half per measurement once the sink catches up.
+    _draw_floor: float = 0.0
 
     #: Deprecated: The number of intervals that can fit on the screen with a
     #: minimum of 100
@@ -143,9 +398,11 @@ class ProgressBarMixinBase(abc.ABC):
     max_value: ValueT
     #: The time the progressbar reached `max_value` or when `finish()` was
     #: called.
-    end_time: datetime | None
+    end_time: _ClockTime = _ClockTime('_end_ns')
     #: The time `start()` was called or iteration started.
-    start_time: datetime | None
+    start_time: _ClockTime = _ClockTime('_start_ns')
+    #: The time of the last redraw
+    last_update_time: _ClockTime = _ClockTime('_last_update_ns')
     #: Seconds between `start_time` and last call to `update()`
     seconds_elapsed: float
 
@@ -157,19 +414,27 @@ class ProgressBarMixinBase(abc.ABC):
 
     def get_last_update_time(self) -> datetime | None:
         """Return `last_update_time` as a `datetime`, or `None` if unset."""
-        if self._last_update_time:
-            return datetime.fromtimestamp(self._last_update_time)
-        else:
-            return None
+        return self.last_update_time
 
     def set_last_update_time(self, value: datetime | None) -> None:
-        """Store `value` as the `last_update_time` epoch timestamp."""
-        if value:
-            self._last_update_time = time.mktime(value.timetuple())
-        else:
-            self._last_update_time = None
+        """Store `value` as the `last_update_time` timestamp."""
+        self.last_update_time = value
+
+    def _ns_to_datetime(self, ns: int) -> datetime:
+        """Convert a `time.perf_counter_ns()` timestamp to a `datetime`."""
+        seconds, ns = divmod(ns + self._wall_offset_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds) + timedelta(
+            microseconds=ns // 1000
+        )
 
-    last_update_time = property(get_last_update_time, set_last_update_time)
+    def _datetime_to_ns(self, value: datetime) -> int:
+        """Convert a `datetime` to a `time.perf_counter_ns()` timestamp."""
+        seconds = int(value.replace(microsecond=0).timestamp())
+        return (
+            seconds * 1_000_000_000
+            + value.microsecond * 1000
+            - self._wall_offset_ns
+        )
 
     def __init__(self, **kwargs: typing.Any) -> None:  # noqa: B027
         """Do nothing: concrete state is set up by subclasses/mixins."""
@@ -198,8 +463,34 @@ class ProgressBarMixinBase(abc.ABC):
                 pass
 
     def __getstate__(self) -> collections.abc.Mapping[str, typing.Any]:
-        """Return the instance `__dict__` for pickling."""
-        return self.__dict__
+        """Return the instance `__dict__` for pickling.
+
+        The background render thread and the reused data snapshot are
+        runtime helpers that are recreated on demand, so they are left out.
+        """
+        state = self.__dict__.copy()
+        state.pop('_renderer', None)
+        state.pop('_data_snapshot', None)
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        """Restore a pickled bar onto this process's clock.
+
+        `time.perf_counter_ns()` has an arbitrary origin per process, so the
+        timestamps are shifted to keep the same wall-clock times.
+        """
+        self.__dict__.update(state)
+        offset = time.time_ns() - time.perf_counter_ns()
+        shift = self._wall_offset_ns - offset
+        for name in ('_start_ns', '_end_ns', '_last_update_ns'):
+            ns = getattr(self, name)
+            if ns is not None:
+                setattr(self, name, ns + shift)
+        self._wall_offset_ns = offset
+
+    def _redraw_data(self) -> dict[str, typing.Any]:  # pragma: no cover
+        """Return the data to render the widgets with, see `data()`."""
+        return self.data()
 
     def data(self) -> dict[str, typing.Any]:  # pragma: no cover
         """Return the widget-facing data dict (see `ProgressBar.data`)."""
@@ -274,6 +565,16 @@ class DefaultFdMixin(ProgressBarMixinBase):
     #: For 256 color support you can use `TERM=xterm-256color`.
     #: For 16 colorsupport you can use `TERM=xterm`.
     enable_colors: progressbar.env.ColorSupport = progressbar.env.COLOR_SUPPORT
+    #: Redraw by rewriting only the columns that changed since the last
+    #: redraw instead of the whole line. Saves bandwidth on slow links
+    #: (SSH, serial consoles), see `_diff_redraw` for the details.
+    diff_redraw: bool = False
+    #: The writer thread's mailbox created for `write_thread=True`, stopped
+    #: (after writing everything queued) by `finish()`
+    _writer: progressbar.terminal.stream.FrameMailboxStream | None = None
+    #: Writes the lines to `fd`'s descriptor directly when `fd` is a
+    #: terminal, see `RawFdWriter`. Bypassed once `fd` is replaced.
+    _raw_writer: progressbar.terminal.stream.RawFdWriter | None = None
 
     def __init__(
         self,
@@ -282,6 +583,8 @@ class DefaultFdMixin(ProgressBarMixinBase):
         line_breaks: bool | None = None,
         enable_colors: progressbar.env.ColorSupport | None = None,
         line_offset: int = 0,
+        diff_redraw: bool = False,
+        write_thread: bool = False,
         **kwargs: typing.Any,
     ) -> None:
         """Resolve `fd`/ANSI/color state for this bar.
@@ -299,6 +602,11 @@ class DefaultFdMixin(ProgressBarMixinBase):
             enable_colors: Color support override. `None` autodetects.
             line_offset: Number of lines to offset the bar from the current
                 line, via a `LineOffsetStreamWrapper` around `fd`.
+            diff_redraw: Rewrite only the changed columns on each redraw,
+                see `diff_redraw`. Ignored with `line_breaks`.
+            write_thread: Write to `fd` from a background thread through
+                a `FrameMailboxStream`, dropping bar lines the thread
+                didn't get to before the next one.
             **kwargs: Forwarded to `super().__init__()`.
         """
         if fd is sys.stdout:
@@ -307,11 +615,21 @@ class DefaultFdMixin(ProgressBarMixinBase):
             fd = utils.streams.original_stderr
 
         fd = self._apply_line_offset(fd, line_offset)
+        if write_thread:
+            # Outermost, so every bar line goes through `write_frame`
+            fd = self._writer = progressbar.terminal.stream.FrameMailboxStream(
+                fd
+            )
         self.fd = fd
+        raw_writer = progressbar.terminal.stream.RawFdWriter.for_stream(fd)
+        if raw_writer is not None:
+            self._raw_writer = raw_writer
         self.is_ansi_terminal = progressbar.env.is_ansi_terminal(fd)
         self.is_terminal = progressbar.env.is_terminal(fd, is_terminal)
         self.line_breaks = self._determine_line_breaks(line_breaks)
         self.enable_colors = self._determine_enable_colors(enable_colors)
+        if diff_redraw:
+            self.diff_redraw = diff_redraw
 
         super().__init__(**kwargs)
 
@@ -390,6 +708,7 @@ class DefaultFdMixin(ProgressBarMixinBase):
 
     def print(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         """Print to `self.fd` instead of `sys.stdout`."""
+        self._last_line = None
         print(*args, file=self.fd, **kwargs)
 
     def start(self, **kwargs: typing.Any) -> None:
@@ -403,9 +722,32 @@ class DefaultFdMixin(ProgressBarMixinBase):
 
         line: str = converters.to_unicode(self._format_line())
         if not self.enable_colors:
+            # The widgets skip their own colors (see `enable_colors` in
+            # `data()`), this only strips escapes from e.g. a colored
+            # `prefix`. Without an escape it is a plain substring check.
             line = utils.no_color(line)
 
-        line = line.rstrip() + '\n' if self.line_breaks else '\r' + line
+        if self.line_breaks:
+            line = line.rstrip() + '\n'
+        elif self.diff_redraw:
+            line = self._diff_redraw(line)
+            if not line:
+                return
+        else:
+            line = '\r' + line
+
+        fd = self.fd
+        if line[0] == '\r' and isinstance(
+            fd, progressbar.terminal.stream.FrameMailboxStream
+        ):
+            # A full redraw supersedes a line the writer hasn't written yet
+            fd.write_frame(line)
+            return
+
+        raw_writer = self._raw_writer
+        if raw_writer is not None and raw_writer.stream is fd:
+            raw_writer.write(line)
+            return
 
         try:  # pragma: no cover
             self.fd.write(line)
@@ -415,6 +757,50 @@ class DefaultFdMixin(ProgressBarMixinBase):
             # back. Writing the raw bytes here would raise ``TypeError``.
             self.fd.write(line.encode('ascii', 'replace').decode('ascii'))
 
+    def _diff_redraw(self, line: str) -> str:
+        """Return the output that turns the line on screen into `line`.
+
+        Each run of changed columns is written behind a Cursor Character
+        Absolute escape (see `terminal.base.COLUMN`), and unchanged gaps
+        shorter than such an escape are rewritten as part of the run. The
+        whole line is rewritten instead when that is shorter, or when the
+        screen is not known: on the first redraw, after a resize or
+        `print()`, when the width changed, or when the line holds escape
+        codes or non-ASCII text, whose column count isn't its length.
+        Returns an empty string if nothing changed.
+        """
+        previous = self._last_line
+        self._last_line = (
+            line if line.isascii() and '\x1b' not in line else None
+        )
+        if previous is None or len(previous) != len(line):
+            return '\r' + line
+        elif previous == line:
+            return ''
+
+        runs: list[str] = []
+        size = len(line)
+        column = 0
+        while column < size:
+            if line[column] == previous[column]:
+                column += 1
+                continue
+
+            start = end = column
+            column += 1
+            while column < size and column - end <= _DIFF_GAP:
+                if line[column] != previous[column]:
+                    end = column
+                column += 1
+
+            runs.append(f'\x1b[{start + 1}G{line[start : end + 1]}')
+            column = end + 1
+
+        output = ''.join(runs)
+        if len(output) > size:
+            return '\r' + line
+        return output
+
     def finish(
         self,
         *args: typing.Any,
@@ -433,72 +819,81 @@ class DefaultFdMixin(ProgressBarMixinBase):
             self.fd.write(end)
 
         self.fd.flush()
+        if self._writer is not None:
+            self._writer.stop()
 
     def _format_line(self) -> str:
         """Join the formatted widgets and justify to `term_width`."""
         widgets = ''.join(self._to_unicode(self._format_widgets()))
 
+        if widgets.isascii():
+            if self.left_justify:
+                return widgets.ljust(self.term_width)
+            else:
+                return widgets.rjust(self.term_width)
+
+        # Wide characters take two columns and combining marks none, so pad
+        # by the measured width rather than by the number of code points
+        padding = ' ' * (self.term_width - self.custom_len(widgets))
         if self.left_justify:
-            return widgets.ljust(self.term_width)
+            return widgets + padding
         else:
-            return widgets.rjust(self.term_width)
+            return padding + widgets
 
     def _format_widgets(self) -> list[str]:
         """Render `self.widgets` to strings, splitting width in two passes.
 
-        Pass 1 walks `self.widgets` in order. A widget failing
-        `check_size` is skipped entirely (no width, no output). A plain
-        `str` has its length subtracted from the shared `width` budget
-        immediately. An `AutoWidthWidgetBase` is deferred (its index is
-        pushed onto `expanding`, so that list ends up in *reverse* index
-        order) rather than rendered yet. Anything else (a fixed-width
-        widget) is rendered right away and its length subtracted from
-        `width`.
-
-        Pass 2 divides whatever `width` remains among the deferred
-        auto-width widgets. `expanding` holds them in reverse index
-        order and `pop()` takes from the end, so they are processed
-        front-to-back: the earliest auto-width widget in the bar is
-        sized first. Each gets `ceil(remaining_width /
+        The layout itself (which widgets fit, where the plain strings go,
+        which slots auto-size) comes from the cached `_LayoutPlan`, so a
+        redraw only calls the widgets themselves.
+
+        Pass 1 renders the fixed-width widgets in order and subtracts
+        their length from the `width` left over after the plan's
+        pre-measured plain strings. A widget declaring its `data_fields`
+        is only called again once one of those changed. Otherwise its
+        previous output is reused.
+
+        Pass 2 divides whatever `width` remains among the auto-width
+        widgets, front-to-back: the earliest auto-width widget in the bar
+        is sized first. Each gets `ceil(remaining_width /
         remaining_count)`, floored at 0, so an uneven split gives the
-        larger share to the earlier widgets. Its rendered length is
-        then subtracted from `width` before the next widget's share is
+        larger share to the earlier widgets. Its rendered length is then
+        subtracted from `width` before the next widget's share is
         computed, so a widget rendering shorter or longer than its
         allocation shifts the rest.
         """
-        widgets = _load_widgets()
-
-        result = []
-        expanding = []
-        width = self.term_width
-        data = self.data()
-
-        for index, widget in enumerate(self.widgets):
-            if isinstance(
-                widget,
-                widgets.WidgetBase,
-            ) and not widget.check_size(self):
-                continue
-            elif isinstance(widget, widgets.AutoWidthWidgetBase):
-                result.append(widget)
-                expanding.insert(0, index)
-            elif isinstance(widget, str):
-                result.append(widget)
-                width -= self.custom_len(widget)  # type: ignore
+        layout = self._layout
+        if layout is None or not layout.matches(self):
+            layout = self._layout = _LayoutPlan.compile(self)
+
+        result = layout.template.copy()
+        width = layout.free_width
+        data = self._redraw_data()
+        custom_len = self.custom_len
+
+        memo = layout.memo
+        for index, widget, memoize in layout.fixed:
+            if memoize:
+                key = _field_values(data, widget.data_fields)
+                cached = memo[index]
+                if key is not None and cached is not None and cached[0] == key:
+                    widget_output = cached[1]
+                else:
+                    widget_output = converters.to_unicode(widget(self, data))
+                    memo[index] = None if key is None else (key, widget_output)
             else:
                 widget_output = converters.to_unicode(widget(self, data))
-                result.append(widget_output)
-                width -= self.custom_len(widget_output)  # type: ignore
 
-        count = len(expanding)
-        while expanding:
+            result[index] = widget_output
+            width -= custom_len(widget_output)  # type: ignore
+
+        count = len(layout.expanding)
+        for index, widget in layout.expanding:
             portion = max(math.ceil(width / count), 0)
-            index = expanding.pop()
-            widget = result[index]
             count -= 1
 
             widget_output = widget(self, data, portion)
-            width -= self.custom_len(widget_output)  # type: ignore
+            width -= custom_len(widget_output)  # type: ignore
             result[index] = widget_output
 
         return result
@@ -512,6 +907,117 @@ class DefaultFdMixin(ProgressBarMixinBase):
             yield converters.to_unicode(arg)
 
 
+def _field_values(
+    data: dict[str, typing.Any], fields: tuple[str, ...]
+) -> list[typing.Any] | None:
+    """Return the memo key for a widget's `data_fields`, see `_LayoutPlan`.
+
+    Pairs each value with its type, since e.g. `1` and `1.0` compare equal
+    but render differently, and copies containers so that changing one in
+    place still counts as a change. Returns `None` when a field is missing.
+    """
+    values: list[typing.Any] = []
+    try:
+        for field in fields:
+            name, _, variable = field.partition('.')
+            value = data[name]
+            if variable:
+                value = value[variable]
+            if isinstance(value, (dict, list, set)):
+                value = value.copy()
+            values.append((type(value), value))
+    except KeyError:
+        return None
+    return values
+
+
+class _LayoutPlan(typing.NamedTuple):
+    """The redraw-invariant part of `DefaultFdMixin._format_widgets`.
+
+    Which widgets pass `check_size`, the width of the plain strings and the
+    slots of the fixed and auto-width widgets only change with the widget
+    list or the terminal width, so they are worked out once instead of on
+    every redraw. `matches` detects a stale plan, and `_handle_resize` and
+    `start()` drop it outright.
+    """
+
+    #: The `bar.widgets` list (by identity) and length this plan was built
+    #: from
+    widgets: collections.abc.MutableSequence[typing.Any]
+    widget_count: int
+    term_width: int
+    custom_len: collections.abc.Callable[[str], int]
+    #: The output line with the plain strings filled in and empty
+    #: placeholders for the widgets
+    template: list[str]
+    #: `term_width` minus the width of the plain strings
+    free_width: int
+    #: `(slot, widget, memoize)` for the fixed-width widgets, in order.
+    #: `memoize` is set for widgets declaring their `data_fields`.
+    fixed: tuple[tuple[int, typing.Any, bool], ...]
+    #: `(slot, widget)` pairs for the auto-width widgets, in order
+    expanding: tuple[tuple[int, typing.Any], ...]
+    #: Per slot, the `data_fields` values and output of the last render of
+    #: a memoized widget
+    memo: list[tuple[list[typing.Any], str] | None]
+
+    @classmethod
+    def compile(cls, bar: DefaultFdMixin) -> _LayoutPlan:
+        """Build the plan for `bar`'s current widgets and terminal width."""
+        widgets = _load_widgets()
+
+        template: list[str] = []
+        fixed: list[tuple[int, typing.Any, bool]] = []
+        expanding: list[tuple[int, typing.Any]] = []
+        width = bar.term_width
+        for widget in bar.widgets:
+            if isinstance(
+                widget,
+                widgets.WidgetBase,
+            ) and not widget.check_size(bar):
+                continue
+            elif isinstance(widget, widgets.AutoWidthWidgetBase):
+                expanding.append((len(template), widget))
+                template.append('')
+            elif isinstance(widget, str):
+                template.append(widget)
+                width -= bar.custom_len(widget)  # type: ignore
+            else:
+                memoize = (
+                    isinstance(widget, widgets.WidgetBase)
+                    and widget.get_data_fields() is not None
+                )
+                fixed.append((len(template), widget, memoize))
+                template.append('')
+
+        return cls(
+            widgets=bar.widgets,
+            widget_count=len(bar.widgets),
+            term_width=bar.term_width,
+            custom_len=bar.custom_len,
+            template=template,
+            free_width=width,
+            fixed=tuple(fixed),
+            expanding=tuple(expanding),
+            memo=[None] * len(template),
+        )
+
+    def matches(self, bar: DefaultFdMixin) -> bool:
+        """Whether this plan is still valid for `bar`.
+
+        A cheap guard against changes made behind the bar's back, such as
+        `MultiBar` inserting its label widget or a direct `term_width`
+        assignment. Replacing an item of `bar.widgets` in place is not
+        detected. Reset `bar._layout` to `None` after doing that.
+        """
+        return (
+            self.widgets is bar.widgets
+            and self.widget_count == len(bar.widgets)
+            and self.term_width == bar.term_width
+            and self.custom_len == bar.custom_len
+        )
+
+
 class _ResizeRegistry:
     """Shared SIGWINCH handling for all resizable progressbars.
 
@@ -581,6 +1087,145 @@ class _ResizeRegistry:
             bar._handle_resize(signum, frame)
 
 
+class _RenderThread:
+    """Daemon thread that redraws a single bar at a fixed rate.
+
+    Used by `ProgressBar(render_thread=True)`: the caller's `update()`
+    only stores the new value and this thread formats and writes the line
+    every `min_poll_interval` seconds, so a slow `fd` or an expensive
+    widget never stalls the loop being measured. The thread only holds a
+    weak reference to the bar, so an abandoned bar can still be collected
+    (and `__del__` can still finish it).
+    """
+
+    def __init__(self, bar: ProgressBar) -> None:
+        #: Serializes the thread's redraws with forced redraws made from
+        #: the caller's thread (`update(force=True)`)
+        self.lock = threading.RLock()
+        #: Set by `update()` when a variable changed, so the next tick
+        #: redraws even if `value` did not move
+        self.dirty = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(weakref.ref(bar), bar.min_poll_interval),
+            name=f'progressbar-render-{bar.index}',
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        """Start redrawing in the background."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and wait for an in-progress redraw to finish."""
+        self._stop.set()
+        # The last reference to the bar can be dropped on the render thread
+        # itself, in which case `__del__` -> `finish()` lands here
+        if self._thread is not threading.current_thread():  # pragma: no branch
+            self._thread.join()
+
+    def _run(
+        self, bar_ref: weakref.ReferenceType[ProgressBar], interval: float
+    ) -> None:
+        while not self._stop.wait(interval):
+            bar = bar_ref()
+            if bar is None:  # pragma: no cover
+                return
+
+            with self.lock:
+                if self._stop.is_set():  # pragma: no cover
+                    return
+                elif self.dirty or bar._render_due():
+                    self.dirty = False
+                    value = bar.value
+                    bar._update_parents(value)
+                    bar._last_drawn_value = value
+
+            # A slow `fd` stretches the time between redraws
+            interval = bar._redraw_interval()
+            # Don't keep the bar alive while sleeping
+            del bar
+
+
+class ShardedCounter:
+    """Progress counter that many threads can bump without locking.
+
+    Returned by `ProgressBar.counter()`. Every thread calling `add()` gets
+    its own shard, a one-item list only that thread writes to, so producers
+    never race on the bar's `value` or wait on each other. Once every
+    `min_poll_interval` seconds one of them sums the shards and advances
+    the bar by the difference, so the redraw path runs at the bar's own
+    rate instead of once per `add()`. `ProgressBar.finish()` folds in
+    whatever is left.
+
+    The counters of one bar fold one at a time, but a fold is not
+    serialized with `update()` or `increment()` calls on the bar itself:
+    while its counters are in use, advance the bar through them only.
+    """
+
+    def __init__(self, bar: ProgressBar) -> None:
+        """Count for `bar`; use `ProgressBar.counter()` to create one."""
+        #: The bar advanced by this counter
+        self.bar = bar
+        #: One ``[count]`` shard per thread that called `add()`
+        self._shards: list[list[NumberT]] = []
+        self._local = threading.local()
+        #: Held by the thread folding shards into the bar, shared by all
+        #: counters of the bar
+        counters = bar._counters
+        self._fold_lock: threading.Lock = (
+            counters[0]._fold_lock if counters else threading.Lock()
+        )
+        #: Sum of the shards at the last fold, already added to the bar
+        self._folded: NumberT = 0
+        self._next_fold_ns = 0
+
+    def add(self, value: NumberT = 1) -> None:
+        """Count `value` more items for the calling thread."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = [0]
+            self._shards.append(shard)
+
+        shard[0] += value
+        if time.perf_counter_ns() >= self._next_fold_ns:
+            self.fold()
+
+    def __iadd__(self, value: NumberT) -> ShardedCounter:
+        """Count `value` more items, like `add()`."""
+        self.add(value)
+        return self
+
+    @property
+    def value(self) -> NumberT:
+        """The number of items counted so far, across all threads."""
+        return sum(shard[0] for shard in self._shards)
+
+    def fold(self, blocking: bool = False) -> None:
+        """Advance the bar by what the shards counted since the last fold.
+
+        Args:
+            blocking: Wait for a fold running on another thread instead of
+                leaving the work to it.
+        """
+        if not self._fold_lock.acquire(blocking):
+            return
+
+        try:
+            total = self.value
+            delta = total - self._folded
+            self._folded = total
+            self._next_fold_ns = time.perf_counter_ns() + int(
+                self.bar.min_poll_interval * 1e9
+            )
+            if delta:
+                self.bar.increment(delta)
+        finally:
+            self._fold_lock.release()
+
+
 class ResizableMixin(ProgressBarMixinBase):
     """Keeps `term_width` current via a shared `SIGWINCH` handler.
 
@@ -591,13 +1236,15 @@ class ResizableMixin(ProgressBarMixinBase):
     swallowed, leaving `term_width` at its class default.
     """
 
+    #: Whether this bar is registered with `_ResizeRegistry`
+    signal_set: bool = False
+
     def __init__(
         self, term_width: int | None = None, **kwargs: typing.Any
     ) -> None:
         """Fix `term_width`, or autodetect it and track further resizes."""
         super().__init__(**kwargs)
 
-        self.signal_set = False
         if term_width:
             self.term_width = term_width
         else:  # pragma: no cover
@@ -612,6 +1259,8 @@ class ResizableMixin(ProgressBarMixinBase):
         """Try to catch resize signals sent from the terminal."""
         w, _h = utils.get_terminal_size()
         self.term_width = w
+        self._layout = None
+        self._last_line = None
 
     def finish(self) -> None:  # pragma: no cover
         """Unregister from `_ResizeRegistry` if this bar was registered."""
@@ -693,8 +1342,13 @@ class StdRedirectMixin(DefaultFdMixin):
         cleared = not self.line_breaks and utils.streams.needs_clear()
         if cleared:
             self.fd.write('\r' + ' ' * self.term_width + '\r')
+            self._last_line = None
 
-        utils.streams.flush()
+        if self._writer is None:
+            utils.streams.flush()
+        else:
+            # Queued behind the cleared line instead of waiting for it
+            utils.streams.flush(self._writer.write_to)
         if cleared and self.redirect_blank_line:
             # Keep a blank line between the redirected output and the bar
             self.fd.write('\n')
@@ -718,6 +1372,120 @@ class StdRedirectMixin(DefaultFdMixin):
                 utils.streams.unwrap_stderr()
 
 
+class _BarState:
+    """The per-bar state read and written by the update path.
+
+    A slotted record instead of instance attributes: the attribute loads in
+    `update()` and the iterators become slot reads on a local, and the
+    bar's own `__dict__` stays below CPython's shared-key limit (30 keys),
+    which saves about 1 KB per bar. `ProgressBar` keeps the old
+    attribute names working through `_state_field` properties.
+    """
+
+    __slots__ = (
+        '_async_iterable',
+        '_counters',
+        '_data_snapshot',
+        '_draw_floor',
+        '_end_ns',
+        '_end_ns_view',
+        '_finished',
+        '_gate_enabled',
+        '_gate_step',
+        '_iterable',
+        '_last_drawn_value',
+        '_last_line',
+        '_last_update_ns',
+        '_last_update_ns_view',
+        '_layout',
+        '_next_update',
+        '_renderer',
+        '_rollup',
+        '_start_ns',
+        '_start_ns_view',
+        '_started',
+        '_wake',
+        '_wall_offset_ns',
+        'initial_start_time',
+        'max_render_share',
+        'max_value',
+        'min_poll_interval',
+        'min_value',
+        'num_intervals',
+        'paused',
+        'poll_interval',
+        'previous_value',
+        'term_width',
+        'updates',
+        'value',
+    )
+
+    def __init__(self) -> None:
+        """Start with the class defaults of `ProgressBar` and its mixins."""
+        self._async_iterable: (
+            collections.abc.AsyncIterator[typing.Any] | None
+        ) = None
+        self._counters: list[ShardedCounter] = []
+        self._data_snapshot: _DataSnapshot | None = None
+        self._draw_floor = 0.0
+        self._end_ns: int | None = None
+        self._end_ns_view: tuple[int, datetime] | None = None
+        self._finished = False
+        self._gate_enabled = True
+        self._gate_step = 1
+        self._iterable: collections.abc.Iterator[typing.Any] | None = None
+        self._last_drawn_value: NumberT | None = None
+        self._last_update_ns: int | None = None
+        self._last_update_ns_view: tuple[int, datetime] | None = None
+        self._last_line: str | None = None
+        self._layout: _LayoutPlan | None = None
+        self._next_update: NumberT = 0
+        self._renderer: _RenderThread | None = None
+        self._rollup: collections.abc.Callable[[_BarState], None] | None = None
+        self._start_ns: int | None = None
+        self._start_ns_view: tuple[int, datetime] | None = None
+        self._started = False
+        self._wake: threading.Event | None = None
+        self._wall_offset_ns = 0
+        self.initial_start_time: datetime | None = None
+        self.max_render_share: float | None = None
+        self.max_value: ValueT = None
+        self.min_poll_interval = 0.0
+        self.min_value: NumberT = 0
+        self.num_intervals = 0
+        self.paused = False
+        self.poll_interval: float | None = None
+        self.previous_value: NumberT | None = None
+        self.term_width = ProgressBarMixinBase.term_width
+        self.updates = 0
+        self.value: NumberT = 0
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        """Return the slots for pickling, without the runtime helpers."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state['_renderer'] = state['_data_snapshot'] = state['_wake'] = None
+        state['_rollup'] = None
+        # The restored bar draws on a screen of its own
+        state['_last_line'] = None
+        # Counters hold locks and are tied to the threads of this process
+        state['_counters'] = []
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        """Restore the slots saved by `__getstate__`."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+def _state_field(name: str) -> typing.Any:
+    """Return a property storing the attribute `name` in `_BarState`."""
+
+    def fset(self: ProgressBar, value: typing.Any) -> None:
+        setattr(self._state, name, value)
+
+    return property(operator.attrgetter(f'_state.{name}'), fset)
+
+
 class ProgressBar(
     StdRedirectMixin,
     ResizableMixin,
@@ -750,9 +1518,10 @@ class ProgressBar(
         widget_kwargs: Default keyword arguments passed to each widget
             built by `default_widgets()`.
         custom_len: Overrides how a rendered widget's width is measured.
-            The default also strips ANSI color codes before measuring;
-            override this if you use e.g. wide/CJK characters whose
-            on-screen width doesn't match `len()`.
+            The default, `utils.display_width`, ignores ANSI color codes
+            and counts East Asian wide characters (CJK, most emoji) as
+            two columns and combining marks as none. Pass
+            `utils.len_color` to count code points instead.
         max_error: Raise a `ValueError` if `value` goes beyond `max_value`.
             If `False`, `value` is clamped to `max_value` instead.
         prefix: Prefix the progressbar with the given string.
@@ -775,6 +1544,30 @@ class ProgressBar(
         postfix: tqdm-style initial value for the `postfix` variable.
             With the default widgets, also appends a `Postfix` widget
             automatically.
+        render_thread: Redraw from a background daemon thread instead of
+            the caller's thread. `update()` (and iteration) then only
+            store the new value, and the thread writes the line every
+            `min_poll_interval` seconds whenever `value` or a variable
+            changed, or `poll_interval` elapsed. Useful when `fd` is slow
+            (e.g. a congested pipe) or the widgets are expensive.
+        write_thread: Hand the output to a background writer thread
+            instead of writing to `fd` directly, so a pipe whose reader is
+            slow never blocks the loop. A line the thread hasn't written
+            yet is dropped in favor of the next one, so the latest state
+            still reaches the screen. Combines with `render_thread`,
+            which moves the formatting off the loop as well.
+        max_render_share: The largest fraction of the time that redrawing
+            may take. The cost of a redraw (formatting, writing and
+            flushing `fd`) is measured, and when the sink is slow -- a
+            congested pty, tmux over a slow link, a pipe to a log collector
+            -- the time between redraws is stretched beyond
+            `min_poll_interval` to keep within this share. `None` disables
+            the measurement.
+        diff_redraw: On a terminal, rewrite only the columns that changed
+            since the last redraw, positioning the cursor with escape
+            codes. Cuts the output per redraw on slow links such as SSH or
+            serial consoles. Colored lines are still rewritten whole, so
+            combine it with `enable_colors=False` for the full effect.
 
     A common way of using it is like:
 
@@ -809,13 +1602,59 @@ class ProgressBar(
     you from changing the ProgressBar you should treat it as read only.
     """
 
-    _iterable: collections.abc.Iterator | None
-
     _DEFAULT_MAXVAL: type[base.UnknownLength] = base.UnknownLength
     # update every 50 milliseconds (up to a 20 times per second)
     _MINIMUM_UPDATE_INTERVAL: float = 0.050
-    _last_update_time: float | None = None
-    paused: bool = False
+    #: Append a `Postfix` widget on the next `start()`
+    _auto_postfix: bool = False
+
+    # Attributes stored in `_state`, see `_BarState`
+    _async_iterable = _state_field('_async_iterable')
+    _counters = _state_field('_counters')
+    _data_snapshot = _state_field('_data_snapshot')
+    _draw_floor = _state_field('_draw_floor')
+    _end_ns = _state_field('_end_ns')
+    _end_ns_view = _state_field('_end_ns_view')
+    _finished = _state_field('_finished')
+    _gate_enabled = _state_field('_gate_enabled')
+    _gate_step = _state_field('_gate_step')
+    _iterable = _state_field('_iterable')
+    _last_drawn_value = _state_field('_last_drawn_value')
+    _last_line = _state_field('_last_line')
+    _last_update_ns = _state_field('_last_update_ns')
+    _last_update_ns_view = _state_field('_last_update_ns_view')
+    _layout = _state_field('_layout')
+    _next_update = _state_field('_next_update')
+    #: The background redraw thread while running with `render_thread=True`
+    _renderer = _state_field('_renderer')
+    #: Called with the bar's `_BarState` on every `update()` and on
+    #: `finish()`, so the `MultiBar` group holding this bar can roll up its
+    #: value without scanning all of its bars
+    _rollup = _state_field('_rollup')
+    _start_ns = _state_field('_start_ns')
+    _start_ns_view = _state_field('_start_ns_view')
+    _started = _state_field('_started')
+    #: Set when the bar changes while `paused`, so the `MultiBar` drawing
+    #: it can sleep until then (see `_notify_change`)
+    _wake = _state_field('_wake')
+    _wall_offset_ns = _state_field('_wall_offset_ns')
+    initial_start_time = _state_field('initial_start_time')
+    max_render_share = _state_field('max_render_share')
+    max_value = _state_field('max_value')
+    min_poll_interval = _state_field('min_poll_interval')
+    min_value = _state_field('min_value')
+    num_intervals = _state_field('num_intervals')
+    paused = _state_field('paused')
+    poll_interval = _state_field('poll_interval')
+    previous_value = _state_field('previous_value')
+    term_width = _state_field('term_width')
+    updates = _state_field('updates')
+    value = _state_field('value')
+
+    @functools.cached_property
+    def _state(self) -> _BarState:
+        """The hot state record, created on first use."""
+        return _BarState()
 
     def __init__(
         self,
@@ -826,7 +1665,9 @@ class ProgressBar(
         initial_value: NumberT = 0,
         poll_interval: timedelta | float | None = None,
         widget_kwargs: dict[str, typing.Any] | None = None,
-        custom_len: collections.abc.Callable[[str], int] = utils.len_color,
+        custom_len: collections.abc.Callable[[str], int] = (
+            utils.display_width
+        ),
         max_error: bool = True,
         prefix: str | None = None,
         suffix: str | None = None,
@@ -837,6 +1678,8 @@ class ProgressBar(
         unit: str = 'it',
         unit_scale: bool = False,
         postfix: typing.Any = None,
+        render_thread: bool = False,
+        max_render_share: float | None = 0.1,
         **kwargs: typing.Any,
     ) -> None:
         """Initializes a progress bar with sane defaults."""
@@ -869,8 +1712,8 @@ class ProgressBar(
         self.unit_scale = unit_scale
         # Auto-append a Postfix widget in start() when `postfix` is used
         # with the default widgets. Explicit widget lists are left alone.
-        self._auto_postfix = widgets is None and postfix is not None
-        self._auto_postfix_added = False
+        if widgets is None and postfix is not None:
+            self._auto_postfix = True
 
         self.prefix = prefix
         self.suffix = suffix
@@ -879,6 +1722,8 @@ class ProgressBar(
         self.value = initial_value
         self._iterable = None
         self.custom_len = custom_len  # type: ignore
+        self.render_thread = render_thread
+        self.max_render_share = max_render_share
         self.initial_start_time = kwargs.get('start_time')
         self.init()
 
@@ -922,14 +1767,20 @@ class ProgressBar(
     def _copy_widgets(
         self, widgets: collections.abc.Sequence[typing.Any] | None
     ) -> list[typing.Any]:
-        """Return a fresh widget list, deep-copying the copy-safe widgets.
+        """Return a fresh widget list, copying the copy-safe widgets.
 
         Only copy a widget if it's safe to copy. Most widgets are, so that is
         assumed to be true unless a widget opts out with ``copy = False``.
+        A `WidgetBase` copy shares its configuration with the original (see
+        `WidgetBase.copy_fields`), anything else is deep-copied.
         """
         result: list[typing.Any] = []
         for widget in widgets or []:
-            if getattr(widget, 'copy', True):
+            if isinstance(widget, str) or not getattr(widget, 'copy', True):
+                pass
+            elif hasattr(widget, '_copy_for_bar'):
+                widget = widget._copy_for_bar()
+            else:
                 widget = deepcopy(widget)
             result.append(widget)
         return result
@@ -954,7 +1805,7 @@ class ProgressBar(
             min_poll_interval,
             default=None,
         )
-        self._MINIMUM_UPDATE_INTERVAL = (
+        minimum_interval = (
             utils.deltas_to_seconds(self._MINIMUM_UPDATE_INTERVAL)
             or self._MINIMUM_UPDATE_INTERVAL
         )
@@ -962,8 +1813,8 @@ class ProgressBar(
         # _MINIMUM_UPDATE_INTERVAL floors low values below.
         self.poll_interval = poll_interval
         self.min_poll_interval = max(
-            min_poll_interval or self._MINIMUM_UPDATE_INTERVAL,
-            self._MINIMUM_UPDATE_INTERVAL,
+            min_poll_interval or minimum_interval,
+            minimum_interval,
             float(os.environ.get('PROGRESSBAR_MINIMUM_UPDATE_INTERVAL', 0)),
         )  # type: ignore
 
@@ -1004,17 +1855,18 @@ class ProgressBar(
         # Value at the last actual redraw, used internally by the update
         # gate's pixel check (distinct from the public `previous_value`).
         self._last_drawn_value = None
-        self.last_update_time = None
-        self.start_time = None
+        self._wall_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self._start_ns = None
+        self._end_ns = None
         self.updates = 0
-        self.end_time = None
         self.extra = dict()
-        self._last_update_timer = timeit.default_timer()
+        # Stamped by `start()`, so the update gate never sees `None`
+        self._last_update_ns = None
         # Fast-path "next update" gate. The common iteration only re-enters
         # the redraw machinery when value reaches `_next_update`. `_gate_step`
         # is a closed-loop estimate of iterations per `min_poll_interval`,
         # calibrated in `update()` from the value/time elapsed between redraws
-        # (tracked by `_last_drawn_value`/`_last_update_timer`). It starts at 1
+        # (tracked by `_last_drawn_value`/`_last_update_ns`). It starts at 1
         # so the gate forces an `update()` every iteration until a real timing
         # measurement (or the back-off doubling) grows the step, so slow
         # iterators (where time advances between calls) are never skipped
@@ -1097,6 +1949,10 @@ class ProgressBar(
                 - `unit`: The configured unit label (default `'it'`).
                 - `unit_scale`: Whether widgets should scale the unit
                   (e.g. `1.2K` instead of `1200`).
+                - `enable_colors`: The bar's `ColorSupport`. Colored
+                  widgets skip generating escape codes when it is `NONE`.
+                - `term_width`: The width of the line in columns. Gradient
+                  colors are quantized to this many steps.
                 - `variables`: User-defined variables set via the
                   `variables=` constructor arg or `bar.update(name=value)`;
                   read by `Variable` and by `FormatWidgetMixin`
@@ -1108,31 +1964,25 @@ class ProgressBar(
         This is a pure snapshot of the current state: it performs no timing
         side effects. The redraw path stamps the update timestamps via
         `_mark_update` before the widgets read them.
+
+        The derived fields (`last_update_time`, the `*_elapsed` fields and
+        `percentage`) are only computed when first read, so a layout that
+        never displays them never pays for them.
         """
-        elapsed = self.last_update_time - self.start_time  # type: ignore
-        total_seconds_elapsed = utils.deltas_to_seconds(elapsed)
-        return dict(
-            max_value=self.max_value,
-            start_time=self.start_time,
-            last_update_time=self.last_update_time,
-            end_time=self.end_time,
-            value=self.value,
-            previous_value=self.previous_value,
-            updates=self.updates,
-            total_seconds_elapsed=total_seconds_elapsed,
-            seconds_elapsed=(elapsed.seconds % 60)
-            + (elapsed.microseconds / 1000000.0),
-            minutes_elapsed=(elapsed.seconds / 60) % 60,
-            hours_elapsed=(elapsed.seconds / (60 * 60)) % 24,
-            days_elapsed=(elapsed.total_seconds() / (60 * 60 * 24)),
-            time_elapsed=elapsed,
-            percentage=self.percentage,
-            unit=self.unit,
-            unit_scale=self.unit_scale,
-            variables=self.variables,
-            # Deprecated alias for `variables`, deliberately the same object.
-            dynamic_messages=self.variables,
-        )
+        return _DataSnapshot(self).refresh()
+
+    def _redraw_data(self) -> dict[str, typing.Any]:
+        """Return the bar's reused data snapshot, refreshed for this redraw.
+
+        A subclass overriding `data()` keeps getting its own dict.
+        """
+        if type(self).data is not ProgressBar.data:
+            return self.data()
+
+        snapshot = self._data_snapshot
+        if snapshot is None:
+            snapshot = self._data_snapshot = _DataSnapshot(self, weak=True)
+        return snapshot.refresh()
 
     def default_widgets(self) -> list[typing.Any]:
         """Build the widgets used when no explicit `widgets=` is given.
@@ -1171,24 +2021,29 @@ class ProgressBar(
 
     def __call__(
         self,
-        iterable: collections.abc.Iterable[typing.Any],
+        iterable: collections.abc.Iterable[typing.Any]
+        | collections.abc.AsyncIterable[typing.Any],
         max_value: ValueT = None,
     ) -> ProgressBar:
         """Wrap `iterable` for use as `for item in bar(iterable):`.
 
-        If `max_value` isn't given (here or already set), it's inferred
-        from `len(iterable)`. An iterable without a `__len__` (e.g. a
-        generator) falls back to `UnknownLength`.
+        An async iterable is wrapped for `async for` instead, see
+        `__aiter__`. If `max_value` isn't given (here or already set), it's
+        inferred from `len(iterable)`. An iterable without a `__len__`
+        (e.g. a generator) falls back to `UnknownLength`.
         """
         if max_value is not None:
             self.max_value = max_value
         elif self.max_value is None:
             try:
                 self.max_value = len(iterable)  # type: ignore[arg-type]
-            except TypeError:  # pragma: no cover
+            except TypeError:
                 self.max_value = base.UnknownLength
 
-        self._iterable = iter(iterable)
+        if isinstance(iterable, collections.abc.Iterable):
+            self._iterable = iter(iterable)
+        else:
+            self._async_iterable = aiter(iterable)
         return self
 
     def __iter__(self) -> collections.abc.Iterator[typing.Any]:
@@ -1202,6 +2057,8 @@ class ProgressBar(
         if (
             _FastBarIterator is not None
             and self._iterable is not None
+            and not self.render_thread
+            and self._rollup is None
             and not os.environ.get('PROGRESSBAR_DISABLE_FASTPATH')
         ):
             return _FastBarIterator(self, self._iterable)
@@ -1227,9 +2084,10 @@ class ProgressBar(
         hoisting it drops a per-iteration attribute load from the hot
         path.
         """
-        iterable = self._iterable if self._iterable is not None else iter(())
+        state = self._state
+        iterable = state._iterable if state._iterable is not None else iter(())
         try:
-            if self.start_time is None:
+            if state._start_ns is None:
                 self.start()
             iterator = iter(iterable)
             try:
@@ -1238,10 +2096,13 @@ class ProgressBar(
                 self.finish()
                 return
             yield item  # first item at value == min_value (matches old code)
-            value = self.value
-            next_update = value
+            value = state.value
+            # With a render thread the loop never needs to enter update():
+            # the thread picks up `self.value` on its own schedule.
+            next_update = value if state._renderer is None else math.inf
             update = self.update
-            gate_enabled = self._gate_enabled
+            gate_enabled = state._gate_enabled
+            rollup = state._rollup
             for item in iterator:
                 value += 1
                 # When the gate is disabled, call `update()` every iteration so
@@ -1255,21 +2116,109 @@ class ProgressBar(
                 # preserving its original semantics.
                 if not gate_enabled or value >= next_update:
                     update(value)
-                    next_update = self._next_update
+                    next_update = state._next_update
+                    rollup = state._rollup
                 else:
                     # Gated out: advance bar.value AND previous_value (exactly
                     # as update() would) without entering the redraw machinery,
                     # so reads of bar.previous_value mid-loop stay identical to
                     # the original every-iteration semantics. The gate's pixel
                     # reference is the separate `_last_drawn_value`.
-                    self.previous_value = self.value
-                    self.value = value
+                    state.previous_value = state.value
+                    state.value = value
+                    if rollup is not None:
+                        # A group's total follows every item, see update()
+                        rollup(state)
                 yield item
             self.finish()
         except GeneratorExit:
             self.finish(dirty=True)
             raise
 
+    def __aiter__(self) -> collections.abc.AsyncIterator[typing.Any]:
+        """Iterate the async iterable given to `__call__`, for `async for`."""
+        return self._aiter()
+
+    async def _aiter(self) -> collections.abc.AsyncIterator[typing.Any]:
+        """Async counterpart of `_iter_python`, redrawn by the event loop.
+
+        The values and the integer gate match `_iter_python`: the first
+        item is yielded at `min_value`, each later one advances `value` and
+        `previous_value`, and `update()` only runs once the value reaches
+        `_next_update`. That keeps an iterable that never suspends, such as
+        a generator without an `await` or a queue that already holds its
+        items, redrawing like a plain loop. On top of that a
+        `loop.call_later` timer redraws once per redraw interval, which
+        keeps ETA and timers moving while the loop awaits a slow item. With
+        the gate disabled every item goes through `update()`, and a render
+        thread does its own redraws.
+        """
+        state = self._state
+        iterator = state._async_iterable
+        stop_timer: collections.abc.Callable[[], None] | None = None
+        try:
+            if state._start_ns is None:
+                self.start()
+            if iterator is None:
+                self.finish()
+                return
+            item = await anext(iterator, base.Undefined)
+            if item is base.Undefined:
+                self.finish()
+                return
+
+            if state._gate_enabled and state._renderer is None:
+                stop_timer = self._start_redraw_timer()
+
+            yield item  # first item at value == min_value
+            value = state.value
+            next_update = value if state._renderer is None else math.inf
+            update = self.update
+            gate_enabled = state._gate_enabled
+            rollup = state._rollup
+            async for item in iterator:
+                value += 1
+                if not gate_enabled or value >= next_update:
+                    update(value)
+                    next_update = state._next_update
+                    rollup = state._rollup
+                else:
+                    state.previous_value = state.value
+                    state.value = value
+                    if rollup is not None:
+                        rollup(state)
+                yield item
+            self.finish()
+        except GeneratorExit:
+            self.finish(dirty=True)
+            raise
+        finally:
+            if stop_timer is not None:
+                stop_timer()
+
+    def _start_redraw_timer(self) -> collections.abc.Callable[[], None]:
+        """Redraw from the running event loop once per redraw interval.
+
+        Returns:
+            A function that stops the timer.
+        """
+        import asyncio
+
+        state = self._state
+        loop = asyncio.get_running_loop()
+        handle: asyncio.TimerHandle
+
+        def tick() -> None:
+            nonlocal handle
+            if self._render_due():
+                value = state.value
+                self._update_parents(value)
+                state._last_drawn_value = value
+            handle = loop.call_later(self._redraw_interval(), tick)
+
+        handle = loop.call_later(state.min_poll_interval, tick)
+        return lambda: handle.cancel()
+
     # --- Native accelerator protocol (used by speedups.FastBarIterator) ------
     # The C iterator counts items itself and calls back here only at gate
     # crossings, reusing the existing gate/redraw/calibration machinery so the
@@ -1277,7 +2226,7 @@ class ProgressBar(
 
     def _fast_begin(self) -> None:
         """Start the bar (draws 0%, sets `_next_update`/`_gate_enabled`)."""
-        if self.start_time is None:
+        if self._start_ns is None:
             self.start()
 
     def _fast_tick(self, value: int) -> None:
@@ -1293,24 +2242,42 @@ class ProgressBar(
         self.finish(dirty=True)
 
     def __next__(self) -> typing.Any:
-        """Draw 0% on the first call, else `update()` and return the item."""
-        value: typing.Any
+        """Draw 0% on the first call, else advance the bar; return the item.
+
+        Manual `next(bar)` loops go through the same integer gate as
+        `_iter_python`: below the `_next_update` threshold (or with a render
+        thread doing the redraws) the call only advances `value` and
+        `previous_value`, and `update()` runs once the threshold is
+        reached. With the gate disabled every call goes through `update()`.
+        """
+        item: typing.Any
+        state = self._state
         try:
-            if self._iterable is None:  # pragma: no cover
-                value = self.value
+            if state._iterable is None:  # pragma: no cover
+                item = state.value
             else:
-                value = next(self._iterable)
+                item = next(state._iterable)
 
-            if self.start_time is None:
+            if state._start_ns is None:
                 self.start()
             else:
-                self.update(self.value + 1)
+                value = state.value + 1
+                if state._gate_enabled and (
+                    value < state._next_update or state._renderer is not None
+                ):
+                    state.previous_value = state.value
+                    state.value = value
+                    rollup = state._rollup
+                    if rollup is not None:
+                        rollup(state)
+                else:
+                    self.update(value)
 
         except StopIteration:
             self.finish()
             raise
         else:
-            return value
+            return item
 
     def __exit__(
         self,
@@ -1344,22 +2311,57 @@ class ProgressBar(
         self.update(self.value + value, *args, **kwargs)
         return self
 
+    def counter(self) -> ShardedCounter:
+        """Return a counter that worker threads can bump without locking.
+
+        Calling `increment()` or ``bar += n`` from several threads races on
+        `value` and makes every thread run the redraw check. Instead, give
+        the workers one counter and let them call ``counter.add(n)``; the
+        bar catches up with the counted items at most once per
+        `min_poll_interval` and when it finishes. The catching up runs on
+        one of the adding threads, so don't also advance the bar directly
+        while they are adding.
+
+        >>> import concurrent.futures
+        >>> bar = ProgressBar(max_value=1000)
+        >>> counter = bar.counter()
+        >>> def work(items):
+        ...     for _ in range(items):
+        ...         counter.add()
+        >>> with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        ...     _ = list(executor.map(work, [250] * 4))
+        >>> bar.finish()
+        >>> counter.value, bar.value
+        (1000, 1000)
+        """
+        counter = ShardedCounter(self)
+        self._counters.append(counter)
+        return counter
+
     def _needs_update(self) -> bool:
         """Return whether the ProgressBar should redraw the line."""
-        if self.paused:
+        state = self._state
+        if state.paused:
+            # Whoever paused the bar draws it, so let them know instead
+            self._notify_change()
             return False
-        delta = timeit.default_timer() - self._last_update_timer
-        if delta < self.min_poll_interval:
+        last_update: int = state._last_update_ns  # type: ignore[assignment]
+        delta = (time.perf_counter_ns() - last_update) / 1e9
+        if delta < state.min_poll_interval or delta < state._draw_floor:
             # Prevent updating too often
             return False
-        elif self.poll_interval and delta > self.poll_interval:
+        elif state.poll_interval and delta > state.poll_interval:
             # Needs to redraw timers and animations
             return True
-        elif self.max_value is base.UnknownLength:
+
+        value = state.value
+        last_drawn_value = state._last_drawn_value
+        max_value = state.max_value
+        if max_value is base.UnknownLength:
             # There's no terminal-width threshold to compute for an unknown
             # length, so redraw whenever the value advanced (still rate
             # limited by the min_poll_interval check above)
-            return self.value != self._last_drawn_value
+            return value != last_drawn_value
 
         # Update if the value increment is large enough to add more bars
         # to the progressbar (according to the current terminal width).
@@ -1369,20 +2371,80 @@ class ProgressBar(
         # what a `suppress(Exception)` used to swallow here. Anything else
         # failing in this math is a real bug and should propagate instead
         # of silently stopping redraws.
+        term_width = state.term_width
         if (
-            self.value is not None
-            and self._last_drawn_value is not None
-            and self.term_width
-            and self.max_value
+            value is not None
+            and last_drawn_value is not None
+            and term_width
+            and max_value
         ):
-            divisor: float = self.max_value / self.term_width  # type: ignore
-            value_divisor = self.value // divisor
-            pvalue_divisor = self._last_drawn_value // divisor
-            if value_divisor != pvalue_divisor:
+            divisor: float = max_value / term_width  # type: ignore
+            if value // divisor != last_drawn_value // divisor:
                 return True
         # No need to redraw yet
         return False
 
+    def _redraw_interval(self) -> float:
+        """The time between redraws: `min_poll_interval` or `_draw_floor`."""
+        state = self._state
+        return max(state.min_poll_interval, state._draw_floor)
+
+    def _render_due(self) -> bool:
+        """Whether the render thread's next tick should redraw the line.
+
+        The thread already wakes once per `min_poll_interval`, so unlike
+        `_needs_update()` there is no rate limit or pixel threshold here:
+        any change of `value` redraws, as does `poll_interval` elapsing.
+        """
+        state = self._state
+        if state.paused:
+            return False
+        elif state.value != state._last_drawn_value:
+            return True
+        elif state.poll_interval:
+            last_update: int = state._last_update_ns  # type: ignore[assignment]
+            delta = (time.perf_counter_ns() - last_update) / 1e9
+            return delta >= state.poll_interval
+        else:
+            return False
+
+    def _notify_change(self) -> None:
+        """Set `_wake`, if any, to wake the loop rendering this paused bar.
+
+        Called when `value` crosses the update gate, when a variable
+        changed, and on `finish()`. The gate lets at most a redraw
+        interval's worth of updates through, so this costs a flag check
+        per window rather than per `update()`.
+        """
+        wake = self._state._wake
+        if wake is not None and not wake.is_set():
+            wake.set()
+
+    def _line_outdated(self) -> bool:
+        """Whether the last drawn line no longer shows the bar's state.
+
+        `MultiBar` asks this of its (paused) bars every frame and only
+        formats those that changed: `value` moved, `poll_interval` elapsed
+        for the time-sensitive widgets, or the layout was dropped or went
+        stale (a resize, a new widget such as the multibar's label, or
+        nothing drawn yet). Changed variables need no check, `update()`
+        draws those at once.
+        """
+        state = self._state
+        layout = state._layout
+        if (
+            layout is None
+            or not layout.matches(self)
+            or state.value != state._last_drawn_value
+        ):
+            return True
+        elif state.poll_interval:
+            last_update: int = state._last_update_ns  # type: ignore[assignment]
+            delta = (time.perf_counter_ns() - last_update) / 1e9
+            return delta >= state.poll_interval
+        else:
+            return False
+
     def _gate_skips(
         self, value: ValueT, force: bool, variables_changed: bool
     ) -> bool:
@@ -1392,12 +2454,13 @@ class ProgressBar(
         or a `None` (tick) value, and only while the value is still below the
         `_next_update` threshold.
         """
+        state = self._state
         return (
-            self._gate_enabled
+            state._gate_enabled
             and not force
             and not variables_changed
             and value is not None
-            and self.value < self._next_update
+            and state.value < state._next_update
         )
 
     def _draw_and_recalibrate(
@@ -1405,42 +2468,43 @@ class ProgressBar(
     ) -> None:
         """Redraw if due, then resize the gate's next-update threshold.
 
-        On a redraw, `_gate_step` is calibrated to ~one `min_poll_interval`
+        On a redraw, `_gate_step` is calibrated to ~one `_redraw_interval()`
         window of iterations, measured from the value/time elapsed since the
         previous redraw (snapshotted here before the draw overwrites
-        `_last_drawn_value`/`_last_update_timer`, so the gate needs no extra
+        `_last_drawn_value`/`_last_update_ns`, so the gate needs no extra
         copies of those quantities). If we passed the threshold but no redraw
         was due (the loop sped up), back off by doubling the step.
         """
-        if self._needs_update() or variables_changed or force:
-            prev_value = self._last_drawn_value
-            prev_timer = self._last_update_timer
+        state = self._state
+        if force or variables_changed or self._needs_update():
+            prev_value = state._last_drawn_value
+            prev_ns: int = state._last_update_ns  # type: ignore[assignment]
             try:
                 self._update_parents(value)  # _mark_update refreshes timer
             finally:
                 # `_last_drawn_value` is the value at the last *redraw* (the
                 # pixel reference for `_needs_update`). Set in finally so it
                 # advances even if a draw raised.
-                self._last_drawn_value = self.value
-            if self._gate_enabled:
-                interval = self._last_update_timer - prev_timer
+                state._last_drawn_value = state.value
+            if state._gate_enabled:
+                interval = (state._last_update_ns - prev_ns) / 1e9  # type: ignore[operator]
                 if (
                     prev_value is not None
                     and interval > 0
-                    and self.value > prev_value
+                    and state.value > prev_value
                 ):
-                    self._gate_step = max(
+                    state._gate_step = max(
                         1,
                         int(
-                            (self.value - prev_value)
-                            * self.min_poll_interval
+                            (state.value - prev_value)
+                            * self._redraw_interval()
                             / interval
                         ),
                     )
-                self._next_update = self.value + self._gate_step
-        elif self._gate_enabled and value is not None:
-            self._gate_step = max(1, self._gate_step * 2)
-            self._next_update = self.value + self._gate_step
+                state._next_update = state.value + state._gate_step
+        elif state._gate_enabled and value is not None:
+            state._gate_step = max(1, state._gate_step * 2)
+            state._next_update = state.value + state._gate_step
 
     def update(
         self, value: ValueT = None, force: bool = False, **kwargs: typing.Any
@@ -1460,7 +2524,8 @@ class ProgressBar(
             **kwargs: Widget variable updates, applied to
                 `self.variables`.
         """
-        if self.start_time is None:
+        state = self._state
+        if state._start_ns is None:
             self.start()
 
         # `isinstance(value, (int, float))` already excludes both `None` and
@@ -1468,38 +2533,68 @@ class ProgressBar(
         # the earlier explicit `is not None`/`is not UnknownLength` clauses
         # were redundant.
         if isinstance(value, (int, float)):
-            if self.max_value is base.UnknownLength:
+            max_value = state.max_value
+            if max_value is base.UnknownLength:
                 # Can't compare against unknown lengths so just update
                 pass
-            elif self.min_value > value:  # type: ignore
+            elif state.min_value > value:  # type: ignore
                 raise ValueError(
                     f'Value {value} is too small. Should be '
-                    f'between {self.min_value} and {self.max_value}',
+                    f'between {self.min_value} and {max_value}',
                 )
-            elif self.max_value < value:  # type: ignore
+            elif max_value < value:  # type: ignore
                 if self.max_error:
                     raise ValueError(
                         f'Value {value} is too large. Should be between '
-                        f'{self.min_value} and {self.max_value}',
+                        f'{self.min_value} and {max_value}',
                     )
                 else:
-                    value = typing.cast(NumberT, self.max_value)
+                    value = typing.cast(NumberT, max_value)
 
             # `previous_value` keeps its original public meaning: the value
             # before this update() call. The gate uses a separate private
             # `_last_drawn_value` (set on redraw) for its pixel check.
-            self.previous_value = self.value
-            self.value = value
+            state.previous_value = state.value
+            state.value = value
 
         # Save the updated values for dynamic messages (skip the call and the
         # empty-dict iteration on the common no-kwargs path).
         variables_changed = self._update_variables(kwargs) if kwargs else False
 
-        if self._gate_skips(value, force, variables_changed):
+        if self._hand_off(value, force, variables_changed):
+            return
+        elif self._gate_skips(value, force, variables_changed):
             return
 
         self._draw_and_recalibrate(value, variables_changed, force)
 
+    def _hand_off(
+        self, value: ValueT, force: bool, variables_changed: bool
+    ) -> bool:
+        """Pass an update on to the bar's group and render thread, if any.
+
+        Returns:
+            Whether a render thread owns the redraw, which leaves nothing
+            for `update()` to do.
+        """
+        state = self._state
+        rollup = state._rollup
+        if rollup is not None:
+            rollup(state)
+
+        renderer = state._renderer
+        if renderer is None:
+            return False
+        # The render thread owns the redraw cadence. Only a forced draw
+        # happens here, serialized with the thread's own redraws.
+        elif force:
+            with renderer.lock:
+                self._update_parents(value)
+                state._last_drawn_value = state.value
+        else:
+            renderer.dirty = renderer.dirty or variables_changed
+        return True
+
     def _update_variables(self, kwargs: dict[str, typing.Any]) -> bool:
         """Apply changed `kwargs` to `self.variables`, returning if changed.
 
@@ -1517,28 +2612,30 @@ class ProgressBar(
             elif self.variables[key] != value_:
                 self.variables[key] = kwargs[key]
                 variables_changed = True
+        if variables_changed:
+            self._notify_change()
         return variables_changed
 
     def _mark_update(self) -> None:
-        """Stamp the wall-clock and perf-counter time of the current redraw.
+        """Stamp the time of the current redraw.
 
-        ``_last_update_timer`` feeds the poll-interval gate and cadence
-        calibration, ``_last_update_time`` backs the public
-        ``last_update_time`` read by timer/ETA widgets. Kept out of
-        :py:meth:`data` so that method stays a pure snapshot.
+        ``_last_update_ns`` feeds the poll-interval gate and cadence
+        calibration and backs the public ``last_update_time`` read by
+        timer/ETA widgets. Kept out of :py:meth:`data` so that method stays
+        a pure snapshot.
         """
-        self._last_update_time = time.time()
-        self._last_update_timer = timeit.default_timer()
+        self._state._last_update_ns = time.perf_counter_ns()
 
     def _update_parents(self, value: ValueT) -> None:
         """Stamp the redraw time and dispatch the cooperative `update()`.
 
         Stamps before formatting widgets so `data()`/`last_update_time`
         reflect this redraw and `_draw_and_recalibrate`'s interval
-        calculation (which snapshots `_last_update_timer` before this call
+        calculation (which snapshots `_last_update_ns` before this call
         and reads it again afterwards) measures up to this draw.
         """
-        self.updates += 1
+        state = self._state
+        state.updates += 1
         self._mark_update()
         # Cooperative dispatch through the MRO
         # (StdRedirectMixin -> DefaultFdMixin -> ProgressBarMixinBase). The
@@ -1546,8 +2643,38 @@ class ProgressBar(
         # and `value=None` signatures interoperate.
         super().update(value=value)  # type: ignore
 
-        # Only flush if something was actually written
-        self.fd.flush()
+        # `RawFdWriter` flushes the stream before writing to the descriptor,
+        # so only a frame written through `fd` itself still needs a flush
+        raw_writer = self._raw_writer
+        if raw_writer is None or raw_writer.stream is not self.fd:
+            self.fd.flush()
+
+        # Measure the first redraw and every 8th after it, which keeps the
+        # other redraws at a single clock read
+        if state.updates & 7 == 1 and state.max_render_share:
+            self._measure_draw(state.max_render_share)
+
+    def _measure_draw(self, share: float) -> None:
+        """Update `_draw_floor` from the cost of the redraw just made.
+
+        The redraw started at `_last_update_ns`, so its cost is the time
+        since. Redrawing at most once per ``cost / share`` keeps it within
+        `share` of the time; a slower redraw raises the floor at once, a
+        faster one halves the distance to it.
+        """
+        state = self._state
+        cost = (time.perf_counter_ns() - state._last_update_ns) / 1e9  # type: ignore[operator]
+        floor = cost / share
+        state._draw_floor = max(floor, (state._draw_floor + floor) / 2)
+
+    def _start_clock(self) -> None:
+        """Stamp `start_time` (unless given) and `last_update_time`."""
+        now = time.perf_counter_ns()
+        if self.initial_start_time is None:
+            self._start_ns = now
+        else:
+            self.start_time = self.initial_start_time
+        self._last_update_ns = now
 
     def start(
         self,
@@ -1580,7 +2707,7 @@ class ProgressBar(
             self.init()
 
         # Prevent multiple starts
-        if self.start_time is not None:  # pragma: no cover
+        if self._start_ns is not None:  # pragma: no cover
             return self
 
         if max_value is not None:
@@ -1593,12 +2720,13 @@ class ProgressBar(
         # max_value
         if not self.widgets:
             self.widgets = self.default_widgets()
-        if self._auto_postfix and not self._auto_postfix_added:
+        if self._auto_postfix:
             self.widgets.append(_load_widgets().Postfix())
-            self._auto_postfix_added = True
+            self._auto_postfix = False
 
         self._init_prefix()
         self._init_suffix()
+        self._layout = None
         self._calculate_poll_interval()
         if (
             os.environ.get('PROGRESSBAR_DISABLE_FASTPATH')
@@ -1614,10 +2742,7 @@ class ProgressBar(
             # sees `started()` True calls `update(force=True)`, and `update()`
             # re-enters `start()` whenever `start_time` is still None --
             # running the stream-capturing path twice.
-            now = datetime.now()
-            self.start_time = self.initial_start_time or now
-            self.last_update_time = now
-            self._last_update_timer = timeit.default_timer()
+            self._start_clock()
 
             # Cooperative dispatch through the MRO
             # (StdRedirectMixin -> DefaultFdMixin -> ProgressBarMixinBase);
@@ -1632,6 +2757,10 @@ class ProgressBar(
             super().start(max_value=max_value)
 
             self.update(self.min_value, force=True)
+
+            if self.render_thread and self._renderer is None:
+                self._renderer = _RenderThread(self)
+                self._renderer.start()
         except Exception:
             # A failed start must not leak global stream-wrapping state
             # (registered listeners, redirected stdout/stderr): run the
@@ -1716,9 +2845,18 @@ class ProgressBar(
             # state, so extra calls are no-ops
             return
 
+        for counter in self._counters:
+            counter.fold(blocking=True)
+
+        if self._renderer is not None:
+            # Stop the background redraws first so the final draw below is
+            # the last thing written.
+            self._renderer.stop()
+            self._renderer = None
+
         try:
             if not dirty:
-                self.end_time = datetime.now()
+                self._end_ns = time.perf_counter_ns()
                 self.update(self.max_value, force=True)
         finally:
             # Run the finish chain even when the final render raises, so a
@@ -1731,6 +2869,10 @@ class ProgressBar(
             # subsystems are independent, so the observable result is
             # unchanged.
             super().finish(end=end)
+            rollup = self._rollup
+            if rollup is not None:
+                rollup(self._state)
+            self._notify_change()
 
     @property
     def currval(self) -> NumberT:
@@ -9,9 +9,10 @@ the full layer breakdown and measured costs.
 
 from __future__ import annotations
 
+import time
 import typing
 from collections.abc import Callable
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from . import (
     bar as bar_module,
@@ -110,14 +111,13 @@ class FastProgressBar(bar_module.ProgressBar):
             `start_time`, ending at `end_time` once `finish()` has run,
             or at the current time while the bar is still active.
         """
-        if self.start_time is None:
+        start = self._start_ns
+        if start is None:
             return 0.0
-        end = self.end_time or self._fast_now()
-        return max((end - self.start_time).total_seconds(), 0.0)
-
-    def _fast_now(self) -> datetime:
-        """Current wall-clock time, split out so tests can monkeypatch it."""
-        return datetime.now()
+        end = self._end_ns
+        if end is None:
+            end = time.perf_counter_ns()
+        return max((end - start) / 1e9, 0.0)
 
     def _format_line(self) -> str:
         """Render via `_format_fast_line` or the pure-Python fallback."""
@@ -10,6 +10,7 @@ contract.
 from __future__ import annotations
 
 import collections.abc
+import contextlib
 import enum
 import importlib
 import io
@@ -25,7 +26,7 @@ from datetime import timedelta
 
 import python_utils
 
-from . import bar, terminal
+from . import bar, base, terminal, utils
 from .terminal import stream
 
 # MultiBar renders full (widget) progress bars from background threads. Warm
@@ -38,6 +39,17 @@ importlib.import_module('progressbar.widgets')
 
 SortKeyFunc = collections.abc.Callable[[bar.ProgressBar], typing.Any]
 
+#: An entry of `MultiBar._order`: the sort key, the bar's `index` (negated
+#: for `sort_reverse`) and a unique number, so entries sort as plain tuples
+#: without ever comparing two bars, followed by the bar, its `_state` and
+#: what the key was computed from (see `MultiBar._key_source`)
+_OrderEntry = tuple[
+    typing.Any, int, int, bar.ProgressBar, typing.Any, typing.Any
+]
+_entry_bar = operator.itemgetter(3)
+_entry_state = operator.itemgetter(4)
+_entry_source = operator.itemgetter(5)
+
 
 class _Update(typing.Protocol):
     """Shape of the `update` closure `_render_bar` builds per call."""
@@ -62,6 +74,157 @@ class SortKey(str, enum.Enum):
     PERCENTAGE = 'percentage'
 
 
+#: What the keys of the built-in `SortKey` values are computed from: a
+#: getter for the fields of a bar's `_BarState`, which are much cheaper to
+#: read every frame than the key itself, or `None` for a key that never
+#: changes once a bar is added
+_SORT_KEY_SOURCES: dict[
+    str, collections.abc.Callable[[typing.Any], typing.Any] | None
+] = {
+    SortKey.CREATED.value: None,
+    SortKey.LABEL.value: None,
+    SortKey.VALUE.value: operator.attrgetter('value'),
+    SortKey.PERCENTAGE.value: operator.attrgetter(
+        'value', 'min_value', 'max_value'
+    ),
+}
+
+
+class _Rollup:
+    """The totals of a `MultiBar.group`, shown by its group bar.
+
+    Every child holds a `_RollupLink` as its `_rollup`, which adds what
+    changed since the child's previous update to these totals, so the
+    group bar follows its children without anything scanning them.
+    """
+
+    __slots__ = (
+        'bar',
+        'children',
+        'collapsed',
+        'lock',
+        'max_value',
+        'unfinished',
+        'unknown',
+        'value',
+    )
+
+    def __init__(self, group_bar: bar.ProgressBar) -> None:
+        self.bar = group_bar
+        #: The number of bars in the group
+        self.children = 0
+        #: Render the group as a single row, without its children
+        self.collapsed = False
+        self.lock = threading.Lock()
+        #: The sum of the children's `max_value - min_value`, for those with
+        #: a known length
+        self.max_value: float = 0
+        #: The number of children that haven't finished
+        self.unfinished = 0
+        #: The number of children with an `UnknownLength`
+        self.unknown = 0
+        #: The sum of the children's `value - min_value`
+        self.value: float = 0
+
+    def attach(self, link: _RollupLink, state: typing.Any) -> None:
+        """Add a child, and what it has done so far, to the totals."""
+        with self.lock:
+            self.children += 1
+        link(state)
+
+    def detach(self, link: _RollupLink, keep: bool) -> None:
+        """Remove a child, and unless `keep`, what it has done so far."""
+        with self.lock:
+            self.children -= 1
+            if not keep:
+                self.move(link, 0, 0, True)
+
+    def move(
+        self,
+        link: _RollupLink,
+        value: float,
+        max_value: float | None,
+        finished: bool,
+    ) -> None:
+        """Replace what `link` added to the totals, with `lock` held."""
+        self.value += value - link.value
+        if link.max_value is None:
+            self.unknown -= 1
+        else:
+            self.max_value -= link.max_value
+        if max_value is None:
+            self.unknown += 1
+        else:
+            self.max_value += max_value
+        self.unfinished += link.finished - finished
+        link.value, link.max_value, link.finished = value, max_value, finished
+
+        group_bar = self.bar
+        state = group_bar._state  # pyright: ignore[reportPrivateUsage]
+        total = base.UnknownLength if self.unknown else self.max_value
+        done = self.children and not self.unfinished
+        if not state._started:
+            if not (self.unknown or self.max_value or done):
+                # Nothing to show yet, and starting without a length would
+                # pick the widgets for an unknown length
+                return
+            state.max_value = total
+            group_bar.start()
+
+        state.value = self.value
+        state.max_value = total
+        if done and not state._finished:
+            # `dirty`, as the value is already what the children did
+            group_bar.finish(dirty=True)
+        else:
+            group_bar._notify_change()  # pyright: ignore[reportPrivateUsage]
+            rollup = state._rollup
+            if rollup is not None:
+                rollup(state)
+
+
+class _RollupLink:
+    """What one child of a `MultiBar.group` added to its `_Rollup`.
+
+    Called by the child (as its `_rollup`) on every `update()`, item it
+    iterates and `finish()`, which only takes the group's lock if
+    something changed.
+    """
+
+    __slots__ = ('finished', 'max_value', 'rollup', 'value')
+
+    def __init__(self, rollup: _Rollup) -> None:
+        self.rollup = rollup
+        #: Nothing yet, see `_Rollup.move`, with `None` for an
+        #: `UnknownLength`
+        self.value: float = 0
+        self.max_value: float | None = 0
+        self.finished = True
+
+    def __call__(self, state: typing.Any) -> None:
+        """Add the changes to the child's `state` to the group's totals."""
+        min_value = state.min_value
+        value = state.value - min_value
+        max_value = state.max_value
+        if max_value is None:
+            # Not started yet, the length may still change
+            max_value = 0
+        elif max_value is base.UnknownLength:
+            max_value = None
+        else:
+            max_value -= min_value
+        finished = state._finished
+
+        if (
+            value != self.value
+            or max_value != self.max_value
+            or finished != self.finished
+        ):
+            rollup = self.rollup
+            with rollup.lock:
+                rollup.move(self, value, max_value, finished)
+
+
 class MultiBar(dict[str, bar.ProgressBar]):
     """Render and manage multiple progressbars from background threads.
 
@@ -113,8 +276,13 @@ class MultiBar(dict[str, bar.ProgressBar]):
         finished_format: The template used once a bar has finished,
             formatted with `label`. If `None`, the bar's own finished
             rendering is used instead.
-        update_interval: Seconds the render thread sleeps between
-            frames.
+        update_interval: The shortest time, in seconds, between two
+            frames of the render thread, however busy the bars are.
+        idle_interval: The longest time, in seconds, the render thread
+            sleeps while no bar changes. Bars wake it as they update,
+            so it backs off from `update_interval` to this heartbeat
+            when idle, which is all time-sensitive widgets such as a
+            `Timer` get while their bar stands still.
         show_initial: Whether a not-yet-started bar is rendered at all.
         show_finished: Whether a finished bar stays visible instead of
             being hidden (it is still tracked for `remove_finished`
@@ -126,7 +294,20 @@ class MultiBar(dict[str, bar.ProgressBar]):
         sort_reverse: Whether the sort order from `sort_key`/
             `sort_keyfunc` is reversed.
         sort_keyfunc: A custom key function overriding `sort_key`.
+        stable_layout: Order bars once, as they are first rendered, and
+            keep them on that row after, rather than moving rows as
+            their sort keys change.
         join_timeout: See above.
+        viewport: Limit the frame to the rows that fit on screen. `True`
+            uses the terminal height, an `int` that many rows. Only the
+            first bars in `sort_keyfunc` order are rendered, the rest
+            share a single `summary_format` line, so a frame formats at
+            most a screenful of bars however many there are. `False`
+            (the default) renders every bar.
+        summary_format: The `str.format` template for that line, with
+            the number of bars it stands for as `hidden`, how many of
+            those have finished as `finished`, and their mean
+            `percentage` (bars without a known length left out).
         **progressbar_kwargs: Passed to `ProgressBar()` when a missing
             key is looked up and a bar is auto-created for it (see
             `__getitem__`).
@@ -134,6 +315,9 @@ class MultiBar(dict[str, bar.ProgressBar]):
 
     fd: typing.TextIO
     _buffer: io.StringIO
+    #: `fd` and its `RawFdWriter` (`None` if it has none), looked up again
+    # by `flush` once `fd` changes
+    _raw_output: tuple[typing.TextIO, stream.RawFdWriter | None] | None = None
 
     #: The format for the label to append/prepend to the progressbar
     label_format: str
@@ -148,27 +332,75 @@ class MultiBar(dict[str, bar.ProgressBar]):
     #: If `finished_format` is `None`, the progressbar rendering is used.
     finished_format: str | None
 
-    #: The multibar updates at a fixed interval regardless of the progressbar
-    # updates
+    #: The shortest time between two frames, however often the bars update
     update_interval: float
+    #: The longest time between two frames while no bar changes
+    idle_interval: float
     remove_finished: float | None
     #: Seconds to wait for the render thread on a clean context-manager
     # exit before abandoning unfinished bars. `None` waits forever.
     join_timeout: float | None
+    #: `False` to render every bar, `True` to fit the terminal height, or
+    # the maximum number of rows to render
+    viewport: bool | int
+    #: The line standing in for the bars outside the viewport
+    summary_format: str
+    #: When the terminal height was last looked up for `viewport=True`,
+    # and what it was
+    _terminal_rows: tuple[float, int] | None = None
 
     #: The kwargs passed to the progressbar constructor
     progressbar_kwargs: dict[str, typing.Any]
 
     #: The progressbar sorting key function
     sort_keyfunc: SortKeyFunc
+    #: Place each bar by its sort key once, then keep it on that row
+    stable_layout: bool
 
     _previous_output: list[str]
+    #: The number of bar lines formatted so far. A frame that formatted
+    # none had nothing to show, `run` then waits for a change.
+    _formatted: int
     _finished_at: dict[bar.ProgressBar, float]
     _labeled: set[bar.ProgressBar]
     _print_lock: threading.RLock
     _thread: threading.Thread | None
     _thread_finished: threading.Event
     _thread_closed: threading.Event
+    #: Set by the bars (through their `_wake`) and by changes to the
+    # multibar itself, so the render thread can sleep until there is
+    # something to draw
+    _changed: threading.Event
+    #: The placed bars in ascending order, as `_OrderEntry` tuples.
+    # `get_sorted_bars` keeps this up to date instead of sorting every
+    # bar every frame.
+    _order: list[_OrderEntry]
+    #: Bars added since the last `get_sorted_bars`, not yet placed
+    _unplaced: list[bar.ProgressBar]
+    #: Bars removed since the last `get_sorted_bars`, still in `_order`
+    _removed: set[bar.ProgressBar]
+    #: Numbers each new `_OrderEntry`
+    _entry_numbers: typing.Iterator[int]
+    #: The `sort_keyfunc` and `sort_reverse` that `_order` is sorted by
+    _order_for: tuple[SortKeyFunc, bool] | None
+    #: The `sort_keyfunc` made from a built-in `sort_key`, with its
+    # `_SORT_KEY_SOURCES` entry
+    _known_key: (
+        tuple[
+            SortKeyFunc,
+            collections.abc.Callable[[typing.Any], typing.Any] | None,
+        ]
+        | None
+    )
+    #: Guards the order and the groups of the bars against concurrent
+    # changes
+    _order_lock: threading.RLock
+    #: Indents the label of a grouped bar, once per level of nesting
+    group_indent: str = '  '
+    #: The `_Rollup` of each group bar, see `group`
+    _groups: dict[bar.ProgressBar, _Rollup]
+    #: The group bar of each bar in a group
+    _parents: dict[bar.ProgressBar, bar.ProgressBar]
 
     def __init__(
         self,
@@ -191,7 +423,13 @@ class MultiBar(dict[str, bar.ProgressBar]):
         sort_reverse: bool = True,
         sort_keyfunc: SortKeyFunc | None = None,
         *,
+        stable_layout: bool = False,
         join_timeout: timedelta | float | None = None,
+        idle_interval: timedelta | float = 1.0,
+        viewport: bool | int = False,
+        summary_format: str = (
+            '+{hidden} more ({finished} finished, {percentage:.0f}% done)'
+        ),
         **progressbar_kwargs: typing.Any,
     ) -> None:
         """Initialize the multibar and add any initial `bars`."""
@@ -204,6 +442,7 @@ class MultiBar(dict[str, bar.ProgressBar]):
         self.finished_format = finished_format
 
         self.update_interval = update_interval
+        self.idle_interval = python_utils.delta_to_seconds(idle_interval)
 
         self.show_initial = show_initial
         self.show_finished = show_finished
@@ -213,23 +452,43 @@ class MultiBar(dict[str, bar.ProgressBar]):
         self.join_timeout = python_utils.delta_to_seconds_or_none(
             join_timeout,
         )
+        self.viewport = viewport
+        self.summary_format = summary_format
 
         self.progressbar_kwargs = progressbar_kwargs
 
+        self._known_key = None
         if sort_keyfunc is None:
-            sort_keyfunc = operator.attrgetter(sort_key)
+            # A plain `str` name, as `getattr` is much slower with a subclass
+            name = (
+                sort_key.value if isinstance(sort_key, SortKey) else sort_key
+            )
+            sort_keyfunc = operator.attrgetter(name)
+            if name in _SORT_KEY_SOURCES:
+                self._known_key = sort_keyfunc, _SORT_KEY_SOURCES[name]
 
         self.sort_keyfunc = sort_keyfunc
         self.sort_reverse = sort_reverse
+        self.stable_layout = stable_layout
+        self._order = []
+        self._unplaced = []
+        self._removed = set()
+        self._entry_numbers = itertools.count()
+        self._order_for = None
+        self._order_lock = threading.RLock()
+        self._groups = {}
+        self._parents = {}
 
         self._labeled = set()
         self._finished_at = {}
         self._previous_output = []
+        self._formatted = 0
         self._buffer = io.StringIO()
         self._print_lock = threading.RLock()
         self._thread = None
         self._thread_finished = threading.Event()
         self._thread_closed = threading.Event()
+        self._changed = threading.Event()
 
         super().__init__()
 
@@ -265,8 +524,11 @@ class MultiBar(dict[str, bar.ProgressBar]):
         - `bar.print = self.print`, so a `print()` made through the bar
           routes through the multibar's cursor-aware printing instead
           of corrupting whichever line the bar or another bar is on.
+        - `bar.diff_redraw` is turned off: the multibar places whole
+          lines, not the bar's column updates.
         - `bar.paused` is set `True`: the render thread, not the bar,
-          now decides when this bar redraws.
+          now decides when this bar redraws. The bar's `_wake` is set to
+          our `_changed` event so its updates wake that thread.
         - if `bar` was constructed directly and never went through
           `ProgressBar.__init__`'s indexing, `bar.index` is pulled
           from `bar._index_counter` here so it still sorts correctly
@@ -285,7 +547,10 @@ class MultiBar(dict[str, bar.ProgressBar]):
         ):
             bar.fd = stream.LastLineStream(self.fd)
 
+        if bar.diff_redraw:
+            bar.diff_redraw = False
         bar.paused = True
+        bar._wake = self._changed  # pyright: ignore[reportPrivateUsage]
         # `mypy` rejects assigning to a method, hence the ignore.
         bar.print = self.print  # type: ignore
 
@@ -296,13 +561,25 @@ class MultiBar(dict[str, bar.ProgressBar]):
                 bar._index_counter  # pyright: ignore[reportPrivateUsage]
             )
 
-        super().__setitem__(key, bar)
+        with self._order_lock:
+            previous = self.get(key)
+            if previous is not None:
+                self._unplace(previous)
+                self._ungroup(previous, keep_finished=True)
+            super().__setitem__(key, bar)
+            self._unplaced.append(bar)
+        self._changed.set()
 
     def __delitem__(self, key: str) -> None:
         """Remove a progressbar from the multibar."""
-        bar_: bar.ProgressBar = self.pop(key)
+        with self._order_lock:
+            bar_: bar.ProgressBar = self.pop(key)
+            self._unplace(bar_)
+            self._ungroup(bar_, keep_finished=True)
+        bar_._wake = None  # pyright: ignore[reportPrivateUsage]
         self._finished_at.pop(bar_, None)
         self._labeled.discard(bar_)
+        self._changed.set()
 
     def __getitem__(self, key: str) -> bar.ProgressBar:
         """Get (and create if needed) a progressbar from the multibar."""
@@ -313,6 +590,137 @@ class MultiBar(dict[str, bar.ProgressBar]):
             self[key] = progress
             return progress
 
+    def group(
+        self, key: str, *children: str, collapsed: bool | None = None
+    ) -> bar.ProgressBar:
+        """Make `key` a group of `children`, rolling up their progress.
+
+        The group bar's `value` and `max_value` become the sums of its
+        children's progress (`value - min_value`) and lengths. Rather
+        than scanning the children, every child adds what changed to
+        those sums on its own `update()` (see `_Rollup`). The group
+        finishes with the last of its children. A child that finished
+        still counts after it is removed, say by `remove_finished`.
+
+        Groups nest, so a child may be a group itself. A group renders
+        its children below it, in `sort_keyfunc` order among themselves
+        and with their labels indented by `group_indent`, unless it is
+        collapsed into a single row.
+
+        Args:
+            key: The group bar, created like `multibar[key]` if missing.
+            *children: The keys of the bars to add to the group, also
+                created if missing. A bar in another group moves over,
+                a group with its children.
+            collapsed: Whether to render the group as a single row.
+                `None` leaves that as it was, which is `False` for a new
+                group.
+
+        Returns:
+            The group bar.
+
+        Raises:
+            ValueError: A child is the group itself or one of the groups
+                it is in, or an unfinished child is added to a finished
+                group.
+        """
+        group_bar = self[key]
+        with self._order_lock:
+            rollup = self._groups.get(group_bar)
+            if rollup is None:
+                rollup = self._groups[group_bar] = _Rollup(group_bar)
+            if collapsed is not None:
+                rollup.collapsed = collapsed
+
+            for child_key in children:
+                child = self[child_key]
+                parent: bar.ProgressBar | None = group_bar
+                while parent is not None:
+                    if parent is child:
+                        raise ValueError(
+                            f'Cannot add {child_key!r} to the group {key!r} '
+                            'it contains'
+                        )
+                    parent = self._parents.get(parent)
+
+                if self._parents.get(child) is not group_bar:
+                    if group_bar.finished() and not child.finished():
+                        raise ValueError(
+                            f'Cannot add the unfinished {child_key!r} to the '
+                            f'finished group {key!r}'
+                        )
+                    self._leave_group(child, keep_finished=False)
+                    self._parents[child] = group_bar
+                    link = _RollupLink(rollup)
+                    child._rollup = link  # pyright: ignore[reportPrivateUsage]
+                    rollup.attach(
+                        link,
+                        child._state,  # pyright: ignore[reportPrivateUsage]
+                    )
+                    self._relabel(child)
+
+        self._changed.set()
+        return group_bar
+
+    def _ungroup(self, bar_: bar.ProgressBar, keep_finished: bool) -> None:
+        """Take `bar_` out of its group, and its children out of `bar_`.
+
+        Args:
+            bar_: The bar to take out.
+            keep_finished: Whether a finished `bar_` still counts towards
+                its group.
+        """
+        if self._groups.pop(bar_, None) is not None:
+            for child, parent in list(self._parents.items()):
+                if parent is bar_:
+                    del self._parents[child]
+                    child._rollup = None  # pyright: ignore[reportPrivateUsage]
+                    self._relabel(child)
+
+        self._leave_group(bar_, keep_finished)
+
+    def _leave_group(self, bar_: bar.ProgressBar, keep_finished: bool) -> None:
+        """Take `bar_` out of its group, keeping its own children.
+
+        Args:
+            bar_: The bar to take out.
+            keep_finished: Whether a finished `bar_` still counts towards
+                its group.
+        """
+        group_bar = self._parents.pop(bar_, None)
+        if group_bar is not None:
+            link: _RollupLink = bar_._rollup  # pyright: ignore[reportPrivateUsage]
+            bar_._rollup = None  # pyright: ignore[reportPrivateUsage]
+            self._groups[group_bar].detach(
+                link, keep=keep_finished and link.finished
+            )
+
+    def _tree_order(
+        self, bars: list[bar.ProgressBar]
+    ) -> list[bar.ProgressBar]:
+        """Return `bars` with every group followed by its children.
+
+        Siblings keep their order in `bars`, and the children of a
+        collapsed group are left out.
+        """
+        parents = self._parents
+        if not parents:
+            return bars
+
+        children: dict[bar.ProgressBar | None, list[bar.ProgressBar]] = {}
+        for bar_ in bars:
+            children.setdefault(parents.get(bar_), []).append(bar_)
+
+        ordered: list[bar.ProgressBar] = []
+        pending = children.get(None, [])[::-1]
+        while pending:
+            bar_ = pending.pop()
+            ordered.append(bar_)
+            rollup = self._groups.get(bar_)
+            if rollup is not None and not rollup.collapsed:
+                pending.extend(reversed(children.get(bar_, ())))
+        return ordered
+
     def _label_bar(self, bar: bar.ProgressBar) -> None:
         """Insert the label widget(s) into `bar.widgets`, once per bar."""
         if bar in self._labeled:  # pragma: no branch
@@ -322,45 +730,97 @@ class MultiBar(dict[str, bar.ProgressBar]):
 
         if self.prepend_label:  # pragma: no branch
             self._labeled.add(bar)
-            bar.widgets.insert(0, self.label_format.format(label=bar.label))
+            bar.widgets.insert(0, self._prepended_label(bar))
 
         if self.append_label:  # pragma: no branch
             self._labeled.add(bar)
             bar.widgets.append(self.label_format.format(label=bar.label))
 
+    def _prepended_label(self, bar: bar.ProgressBar) -> str:
+        """Return the label for `bar`, indented for each group it is in."""
+        indent = ''
+        parent = self._parents.get(bar)
+        while parent is not None:
+            indent += self.group_indent
+            parent = self._parents.get(parent)
+        return indent + self.label_format.format(label=bar.label)
+
+    def _relabel(self, bar_: bar.ProgressBar) -> None:
+        """Re-indent the labels of `bar_` and its children, if drawn.
+
+        `_label_bar` indents a label when it inserts it, so a bar drawn
+        before it moved to another group needs its label replaced.
+        """
+        if not self.prepend_label:
+            return
+
+        pending = [bar_]
+        while pending:
+            bar_ = pending.pop()
+            if bar_ in self._labeled:
+                bar_.widgets[0] = self._prepended_label(bar_)
+                # Replaced in place, which the layout can't tell
+                bar_._layout = None  # pyright: ignore[reportPrivateUsage]
+            if bar_ in self._groups:
+                pending.extend(
+                    child
+                    for child, parent in self._parents.items()
+                    if parent is bar_
+                )
+
     def render(self, flush: bool = True, force: bool = False) -> None:
         """Redraw every bar, only touching lines that actually changed.
 
-        Builds one output line per visible bar (`_render_bar`) and
+        Builds one output line per visible bar (`_render_bar`), which
+        only formats the bars that changed since their last line, and
         diffs it against `_previous_output` -- the frame built by the
         previous call: lines whose text is unchanged are left alone,
         lines that changed are reprinted in place through
         `print(clear=False)` at their fixed offset, lines for bars
         that vanished since the last frame are cleared, and a blank
         line is appended to the buffer for each bar that's new since
-        the last frame so it doesn't overwrite existing output.
+        the last frame so it doesn't overwrite existing output. With a
+        `viewport`, the bars that don't fit share one summary line
+        (`_summarize`) instead.
 
         Args:
             flush: Whether to flush the buffered escape sequences to
                 `fd` immediately after building this frame.
-            force: Reprint every line even if its text is unchanged --
-                used for the final render before the render thread
-                stops, so a just-finished bar's finished-format is
-                guaranteed to reach the screen.
+            force: Format and reprint every line even if nothing
+                changed -- used for the final render before the render
+                thread stops, so a just-finished bar's finished-format
+                is guaranteed to reach the screen.
         """
         now: float = timeit.default_timer()
         expired: float | None = (
             now - self.remove_finished if self.remove_finished else None
         )
 
+        rows = self._viewport_rows(now)
+        bars = self._tree_order(self.get_sorted_bars())
+
         # sourcery skip: list-comprehension
         output: list[str] = []
-        for bar_ in self.get_sorted_bars():
+        for position, bar_ in enumerate(bars):
             if not bar_.started() and not self.show_initial:
                 continue
+            elif (
+                rows is not None
+                and len(output) >= rows - 1
+                and position < len(bars) - 1
+            ):
+                # Only room for the summary of this bar and the rest
+                summary = self._summarize(bars[position:], now, expired)
+                if summary is not None:
+                    output.append(summary)
+                break
 
             output.extend(
-                iter(self._render_bar(bar_, expired=expired, now=now)),
+                iter(
+                    self._render_bar(
+                        bar_, expired=expired, now=now, force=force
+                    )
+                ),
             )
 
         with self._print_lock:
@@ -397,19 +857,82 @@ class MultiBar(dict[str, bar.ProgressBar]):
             if flush:  # pragma: no branch
                 self.flush()
 
+    def _viewport_rows(self, now: float) -> int | None:
+        """Return the number of rows a frame may use, `None` for no limit.
+
+        With `viewport=True` that is the terminal height less the line the
+        cursor rests on, looked up again at most once a second.
+        """
+        viewport = self.viewport
+        if viewport is False:
+            return None
+        elif viewport is not True:
+            return max(viewport, 1)
+
+        terminal_rows = self._terminal_rows
+        if terminal_rows is None or now - terminal_rows[0] >= 1:
+            _width, height = utils.get_terminal_size()
+            terminal_rows = self._terminal_rows = now, max(height - 1, 1)
+        return terminal_rows[1]
+
+    def _summarize(
+        self,
+        bars: collections.abc.Iterable[bar.ProgressBar],
+        now: float,
+        expired: float | None,
+    ) -> str | None:
+        """Return the `summary_format` line for the bars outside the viewport.
+
+        Nothing is formatted for these bars, only counted. Finished bars
+        still pass through `_render_finished_bar` so they expire as usual,
+        and bars that would not be shown anyway are not counted.
+
+        Returns:
+            The summary line, or `None` if none of `bars` would be shown.
+        """
+        hidden = finished = 0
+        percentages: list[float] = []
+        for bar_ in bars:
+            if bar_.finished():
+                if not list(self._render_bar(bar_, now, expired)):
+                    continue
+                finished += 1
+            elif not bar_.started() and not self.show_initial:
+                continue
+
+            hidden += 1
+            percentage = bar_.percentage
+            if percentage is not None:
+                percentages.append(percentage)
+
+        if not hidden:
+            return None
+
+        return self.summary_format.format(
+            hidden=hidden,
+            finished=finished,
+            percentage=sum(percentages) / len(percentages)
+            if percentages
+            else 0.0,
+        )
+
     def _render_bar(
         self,
         bar_: bar.ProgressBar,
         now: float,
         expired: float | None,
+        force: bool = False,
     ) -> collections.abc.Iterable[str]:
         """Yield the rendered line(s) for one bar, by lifecycle state.
 
         Finished bars delegate to `_render_finished_bar` (0 or 1
-        lines). A started bar is force-updated and yields its current
-        line. A not-yet-started bar either yields `initial_format`
-        as-is, or, if `initial_format` is `None`, is started and
-        rendered immediately instead of showing a placeholder.
+        lines). A started bar yields its current line, force-updating
+        it first only if `force` is set or its last line is outdated
+        (`ProgressBar._line_outdated`), so idle bars cost a lookup
+        instead of a format. A not-yet-started bar either yields
+        `initial_format` as-is, or, if `initial_format` is `None`, is
+        started and rendered immediately instead of showing a
+        placeholder.
 
         Returns:
             The line(s) to place on this bar's row(s) of the frame.
@@ -420,6 +943,7 @@ class MultiBar(dict[str, bar.ProgressBar]):
         ) -> str:  # pragma: no cover
             self._label_bar(bar_)
             bar_.update(force=force)
+            self._formatted += 1
             if write:
                 return typing.cast(stream.LastLineStream, bar_.fd).line
             else:
@@ -429,7 +953,13 @@ class MultiBar(dict[str, bar.ProgressBar]):
             yield from self._render_finished_bar(bar_, now, expired, update)
 
         elif bar_.started():
-            yield update()
+            # Labeling first makes the bar's layout stale, so a newly
+            # added bar is formatted with its label
+            self._label_bar(bar_)
+            if force or bar_._line_outdated():
+                yield update()
+            else:
+                yield typing.cast(stream.LastLineStream, bar_.fd).line
         else:
             if self.initial_format is None:
                 bar_.start()
@@ -557,8 +1087,21 @@ class MultiBar(dict[str, bar.ProgressBar]):
             value = self._buffer.getvalue()
             self._buffer.seek(0)
             self._buffer.truncate(0)
-            self.fd.write(value)
-            self.fd.flush()
+
+            fd = self.fd
+            raw_output = self._raw_output
+            if raw_output is None or raw_output[0] is not fd:
+                raw_output = self._raw_output = (
+                    fd,
+                    stream.RawFdWriter.for_stream(fd),
+                )
+
+            raw_writer = raw_output[1]
+            if raw_writer is None:
+                fd.write(value)
+                fd.flush()
+            else:
+                raw_writer.write(value)
 
     def run(self, join: bool = True) -> None:
         """Render in a loop until stopped or every bar has finished.
@@ -566,7 +1109,14 @@ class MultiBar(dict[str, bar.ProgressBar]):
         This is the render thread's target when started via `start`
         (which passes `join=False`). It can also be called directly to
         block the calling thread instead of backgrounding the loop.
-        Each pass renders once and sleeps `update_interval`. Then, but
+        Each pass renders once. A frame that formatted a bar is followed
+        by the next one after `update_interval`, so a busy multibar
+        renders every `update_interval` without waiting for its bars,
+        which only wake it (`_changed`) at their gate crossings. After a
+        frame with nothing to format the loop waits for a bar or the
+        multibar to change instead. Each wait that times out doubles
+        the next one, up to `idle_interval`, so an idle multibar settles
+        on a slow heartbeat. Then, but
         only if `join` is true or `_thread_closed` has been set (i.e.
         `join`/`stop` was called), every current bar is checked in a
         `for`/`else`: finding an unfinished bar just breaks out and the
@@ -584,9 +1134,22 @@ class MultiBar(dict[str, bar.ProgressBar]):
                 thread keeps looping, picking up bars added after it
                 started, until `join`/`stop` asks it to close.
         """
+        idle = self.update_interval
         while not self._thread_finished.is_set():  # pragma: no branch
+            started = time.perf_counter()
+            formatted = self._formatted
+            self._changed.clear()
             self.render()
-            time.sleep(self.update_interval)
+            if self._formatted != formatted or self._changed.wait(idle):
+                idle = self.update_interval
+                # At most one frame per `update_interval`
+                time.sleep(
+                    max(
+                        started + self.update_interval - time.perf_counter(), 0
+                    )
+                )
+            else:
+                idle = min(idle * 2, self.idle_interval)
 
             if join or self._thread_closed.is_set():
                 # If the thread is closed, we need to check if the progressbars
@@ -637,6 +1200,7 @@ class MultiBar(dict[str, bar.ProgressBar]):
         """
         if self._thread is not None:
             self._thread_closed.set()
+            self._changed.set()
             self._thread.join(timeout=timeout)
             if not self._thread.is_alive():
                 self._thread = None
@@ -653,20 +1217,132 @@ class MultiBar(dict[str, bar.ProgressBar]):
                 `join`.
         """
         self._thread_finished.set()
+        self._changed.set()
         self.join(timeout=timeout)
 
     def get_sorted_bars(self) -> list[bar.ProgressBar]:
         """Return the current bars, ordered per `sort_keyfunc`.
 
+        Rather than keying every bar on every frame, the order is kept
+        in `_order`, and only the bars whose key changed since the last
+        call are keyed again. Spotting those takes a single pass over
+        what the keys are computed from: the bar's `_BarState` fields
+        for the built-in `sort_key` values (and nothing at all for
+        `CREATED` and `LABEL`), the keys themselves for a custom
+        `sort_keyfunc`. Bars added since the last call are appended,
+        and the list, still nearly in order, is sorted again. With
+        `stable_layout` only new bars are placed. Replacing
+        `sort_keyfunc` or `sort_reverse`, or changing the bars behind
+        the multibar's back (`dict.update`, `dict.clear`, ...),
+        re-sorts everything. Bars with equal keys keep their creation
+        (`index`) order.
+
         Returns:
             The bars sorted by `sort_keyfunc`, reversed if
-            `sort_reverse`. The values are copied into a list first so
-            a concurrent `__setitem__`/`__delitem__` from another
-            thread (the multibar is a plain `dict`, not a thread-safe
-            one) can't mutate it out from under the sort.
+            `sort_reverse`, as a list of their own, so a concurrent
+            `__setitem__`/`__delitem__` from another thread can't change
+            it while the caller iterates.
+        """
+        with self._order_lock:
+            removed = self._removed
+            if removed:
+                self._order = [
+                    entry
+                    for entry in self._order
+                    if _entry_bar(entry) not in removed
+                ]
+                removed.clear()
+
+            order = self._order
+            unplaced = self._unplaced
+            if self._order_for != (self.sort_keyfunc, self.sort_reverse) or (
+                len(order) + len(unplaced) != len(self)
+            ):
+                order = self._order = sorted(map(self._entry, self.values()))
+                self._order_for = self.sort_keyfunc, self.sort_reverse
+            elif (not self.stable_layout and self._reorder()) or unplaced:
+                order.extend(map(self._entry, unplaced))
+                order.sort()
+            unplaced.clear()
+
+            bars = list(map(_entry_bar, order))
+            if self.sort_reverse:
+                bars.reverse()
+            return bars
+
+    def _key_source(
+        self,
+    ) -> (
+        tuple[collections.abc.Callable[[typing.Any], typing.Any], bool] | None
+    ):
+        """Return what the sort keys are computed with.
+
+        Returns:
+            The `_SORT_KEY_SOURCES` getter of a built-in `sort_key` and
+            `True`, as it reads a bar's `_state`, else `sort_keyfunc`
+            and `False`. `None` if the keys never change.
         """
-        bars = list(self.values())
-        return sorted(bars, key=self.sort_keyfunc, reverse=self.sort_reverse)
+        keyfunc = self.sort_keyfunc
+        known_key = self._known_key
+        if known_key is None or known_key[0] is not keyfunc:
+            return keyfunc, False
+        elif known_key[1] is None:
+            return None
+        else:
+            return known_key[1], True
+
+    def _entry(self, bar_: bar.ProgressBar) -> _OrderEntry:
+        """Return the `_OrderEntry` placing `bar_` by its current key."""
+        key = self.sort_keyfunc(bar_)
+        state = bar_._state  # pyright: ignore[reportPrivateUsage]
+        key_source = self._key_source()
+        if key_source is None:
+            source = None
+        elif key_source[1]:
+            source = key_source[0](state)
+        else:
+            source = key
+
+        index = -bar_.index if self.sort_reverse else bar_.index
+        number = next(self._entry_numbers)
+        return key, index, number, bar_, state, source
+
+    def _reorder(self) -> bool:
+        """Key the bars whose sort key changed again, in place.
+
+        This leaves `_order` for the caller to sort.
+
+        Returns:
+            Whether any bar was keyed again.
+        """
+        key_source = self._key_source()
+        if key_source is None:
+            return False
+
+        source, from_state = key_source
+        order = self._order
+        items = map(_entry_state if from_state else _entry_bar, order)
+        sources = list(map(source, items))
+        moved = list(
+            itertools.compress(
+                range(len(order)),
+                map(operator.ne, sources, map(_entry_source, order)),
+            )
+        )
+
+        keyfunc = self.sort_keyfunc
+        for position in moved:
+            _, index, number, bar_, state, _ = order[position]
+            source = sources[position]
+            key = keyfunc(bar_) if from_state else source
+            order[position] = key, index, number, bar_, state, source
+        return bool(moved)
+
+    def _unplace(self, bar_: bar.ProgressBar) -> None:
+        """Drop `bar_` from the order on the next `get_sorted_bars`."""
+        with contextlib.suppress(ValueError):
+            self._unplaced.remove(bar_)
+        self._removed.add(bar_)
 
     def __enter__(self) -> MultiBar:
         """Start the render thread and return this multibar."""
@@ -1,4 +1,4 @@
-"""The one-call entry point: `progressbar(iterable)`.
+"""The one-call entry points: `progressbar(iterable)` and `aprogressbar`.
 
 Most users never touch anything else in this package.
 """
@@ -77,6 +77,66 @@ def progressbar(
         An iterator yielding the same items, advancing the bar as it
         goes.
     """
+    progressbar_ = _create_bar(
+        min_value=min_value,
+        max_value=max_value,
+        widgets=widgets,
+        prefix=prefix,
+        suffix=suffix,
+        fast=fast,
+        desc=desc,
+        total=total,
+        unit=unit,
+        unit_scale=unit_scale,
+        postfix=postfix,
+        **kwargs,
+    )
+    return iter(progressbar_(iterator))
+
+
+def aprogressbar(
+    iterator: collections.abc.AsyncIterable[T],
+    **kwargs: typing.Any,
+) -> collections.abc.AsyncIterator[T]:
+    """Wrap an async iterable so `async for` renders a progress bar.
+
+    The async twin of `progressbar`::
+
+        async for message in aprogressbar(stream, max_value=total):
+            ...
+
+    Redraws are scheduled on the running event loop, so the loop itself
+    only counts items; see `ProgressBar.__aiter__`.
+
+    Args:
+        iterator: The async iterable to wrap. Async iterables rarely have
+            a length, so pass `max_value` for a percentage and ETA.
+        **kwargs: The same arguments as `progressbar`.
+
+    Returns:
+        An async iterator yielding the same items, advancing the bar as
+        it goes.
+    """
+    progressbar_ = _create_bar(**kwargs)
+    return progressbar_(iterator).__aiter__()
+
+
+def _create_bar(
+    min_value: bar.NumberT = 0,
+    max_value: bar.ValueT = None,
+    widgets: collections.abc.Sequence[widgets_module.WidgetBase | str]
+    | None = None,
+    prefix: str | None = None,
+    suffix: str | None = None,
+    fast: bool | None = None,
+    desc: str | None = None,
+    total: bar.ValueT = None,
+    unit: str = 'it',
+    unit_scale: bool = False,
+    postfix: typing.Any = None,
+    **kwargs: typing.Any,
+) -> bar.ProgressBar:
+    """Create the bar for `progressbar`/`aprogressbar`, see `progressbar`."""
     # Auto-dispatch to the lean FastProgressBar for the simple, common case.
     # Anything that needs the full widget machinery uses ProgressBar. The
     # tqdm-style `desc` (a prefix) and `total` (a max_value) render fine on
@@ -92,7 +152,7 @@ def progressbar(
         and not os.environ.get('PROGRESSBAR_DISABLE_FASTPATH')
     )
     cls = fast_module.FastProgressBar if use_fast else bar.ProgressBar
-    progressbar_ = cls(
+    return cls(
         min_value=min_value,
         max_value=max_value,
         widgets=widgets,
@@ -105,4 +165,3 @@ def progressbar(
         postfix=postfix,
         **kwargs,
     )
-    return iter(progressbar_(iterator))
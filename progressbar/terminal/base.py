@@ -38,6 +38,8 @@ from .os_specific import getch as getch
 #: ANSI escape character (``\x1b``), the CSI/SGR sequence prefix.
 ESC = '\x1b'
 
+_T = typing.TypeVar('_T')
+
 
 class CSI:
     """A single ANSI CSI (Control Sequence Introducer) escape sequence.
@@ -594,28 +596,48 @@ class Color(typing.NamedTuple):
         return hash(self.rgb)
 
 
+class _ColorIndex(typing.Generic[_T]):
+    """A `Colors` lookup index, built along with the others on first use."""
+
+    name: str
+
+    def __set_name__(self, owner: type[Colors], name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Colors | None, owner: type[Colors]) -> _T:
+        return owner._build_indexes()[self.name]
+
+
 class Colors:
     """Registry of `Color` instances, indexed for lookup.
 
     `register` files a new `Color` into the dicts below, keyed by
     each representation, so a color can be looked up by any of
-    them.
+    them. The dicts are built the first time one of them is read,
+    starting with the xterm table from `progressbar.terminal.colors`,
+    so registering (and importing that table) costs no indexing until
+    a lookup actually happens.
 
     """
 
     #: Registered colors keyed by `name`, as given.
-    by_name: ClassVar[defaultdict[str, list[Color]]] = defaultdict(list)
+    by_name = _ColorIndex[defaultdict[str, list[Color]]]()
     #: Registered colors keyed by `name.lower()`.
-    by_lowername: ClassVar[defaultdict[str, list[Color]]] = defaultdict(list)
+    by_lowername = _ColorIndex[defaultdict[str, list[Color]]]()
     #: Registered colors keyed by `RGB.hex`.
-    by_hex: ClassVar[defaultdict[str, list[Color]]] = defaultdict(list)
+    by_hex = _ColorIndex[defaultdict[str, list[Color]]]()
     #: Registered colors keyed by `RGB`.
-    by_rgb: ClassVar[defaultdict[RGB, list[Color]]] = defaultdict(list)
+    by_rgb = _ColorIndex[defaultdict[RGB, list[Color]]]()
     #: Registered colors keyed by `HSL`.
-    by_hls: ClassVar[defaultdict[HSL, list[Color]]] = defaultdict(list)
+    by_hls = _ColorIndex[defaultdict[HSL, list[Color]]]()
     #: Registered colors keyed by xterm palette index, at most one color per
     #: index, later registrations overwrite earlier ones.
-    by_xterm: ClassVar[dict[int, Color]] = dict()
+    by_xterm = _ColorIndex[dict[int, Color]]()
+
+    #: The indexes by name, once built.
+    _indexes: ClassVar[dict[str, typing.Any] | None] = None
+    #: The colors registered before the indexes were built.
+    _registered: ClassVar[list[Color]] = []
 
     @classmethod
     def register(
@@ -643,19 +665,49 @@ class Colors:
             hls = HSL.from_rgb(rgb)
 
         color = Color(rgb, hls, name, xterm)
+        if cls._indexes is None:
+            cls._registered.append(color)
+        else:
+            cls._index(cls._indexes, color)
 
-        if name:
-            cls.by_name[name].append(color)
-            cls.by_lowername[name.lower()].append(color)
+        return color
 
-        cls.by_hex[rgb.hex].append(color)
-        cls.by_rgb[rgb].append(color)
-        cls.by_hls[hls].append(color)
+    @classmethod
+    def _build_indexes(cls) -> dict[str, typing.Any]:
+        """Return the indexes, building them on first use."""
+        if cls._indexes is None:
+            # Imported here as the table itself is built on this module
+            from . import colors
+
+            indexes: dict[str, typing.Any] = dict(
+                by_name=defaultdict(list),
+                by_lowername=defaultdict(list),
+                by_hex=defaultdict(list),
+                by_rgb=defaultdict(list),
+                by_hls=defaultdict(list),
+                by_xterm=dict(),
+            )
+            for color in colors._xterm_colors() + cls._registered:
+                cls._index(indexes, color)
 
-        if xterm is not None:
-            cls.by_xterm[xterm] = color
+            cls._registered.clear()
+            cls._indexes = indexes
 
-        return color
+        return cls._indexes
+
+    @staticmethod
+    def _index(indexes: dict[str, typing.Any], color: Color) -> None:
+        """File `color` into `indexes` under each of its representations."""
+        if color.name:
+            indexes['by_name'][color.name].append(color)
+            indexes['by_lowername'][color.name.lower()].append(color)
+
+        indexes['by_hex'][color.rgb.hex].append(color)
+        indexes['by_rgb'][color.rgb].append(color)
+        indexes['by_hls'][color.hls].append(color)
+
+        if color.xterm is not None:
+            indexes['by_xterm'][color.xterm] = color
 
     @classmethod
     def interpolate(cls, color_a: Color, color_b: Color, step: float) -> Color:
@@ -682,6 +734,18 @@ class ColorGradient:
 
     interpolate: collections.abc.Callable[[Color, Color, float], Color] | None
     colors: tuple[Color, ...]
+    #: The `wrap` lookup tables by `(start_code, steps,
+    #: env.COLOR_SUPPORT)`: the `(start, end)` escapes per step (`None`
+    #: when there is no usable color). At most `sgr_table_limit` are kept,
+    #: the oldest is dropped first. Never changed once assigned: `wrap`
+    #: swaps in a new dict, so bars drawing from several threads can
+    #: share the gradient without a lock.
+    _sgr_tables: dict[
+        tuple[int, int, env.ColorSupport], tuple[tuple[str, str] | None, ...]
+    ]
+    #: Enough tables for a few bar widths and both layers, so bars of
+    #: different widths sharing a gradient don't rebuild them every redraw.
+    sgr_table_limit: int = 8
 
     def __init__(
         self,
@@ -703,11 +767,73 @@ class ColorGradient:
         assert colors
         self.colors = colors
         self.interpolate = interpolate
+        self._sgr_tables = {}
 
     def __call__(self, value: float) -> Color:
         """Shorthand for `get_color(value)`."""
         return self.get_color(value)
 
+    def wrap(
+        self,
+        text: str,
+        value: float,
+        steps: int,
+        start_code: int = 38,
+        end_code: int = 39,
+    ) -> str:
+        """Wrap `text` in the SGR color for `value`, from a lookup table.
+
+        `value` is rounded to the nearest of `steps` + 1 evenly spaced
+        levels, as a bar `steps` columns wide shows no more than that. The
+        escapes for every level are built on first use of each
+        `start_code`, `steps` and `env.COLOR_SUPPORT` combination. After
+        that a redraw costs a lookup instead of interpolating the color
+        and formatting its escape sequence.
+
+        Args:
+            text: The text to style.
+            value: Position in the gradient, 0-1 (clamped).
+            steps: The number of levels above 0, at least 1.
+            start_code: The SGR code of the layer, 38 for the foreground
+                and 48 for the background, see `Color.fg`/`Color.bg`.
+            end_code: The SGR code resetting that layer.
+
+        Returns:
+            `text` wrapped like `self.get_color(value).fg(text)` would
+            for the rounded `value`.
+        """
+        tables = self._sgr_tables
+        key = start_code, steps, env.COLOR_SUPPORT
+        table = tables.get(key)
+        if table is None:
+            escapes: list[tuple[str, str] | None] = []
+            for step in range(steps + 1):
+                sgr = SGRColor(
+                    self.get_color(step / steps), start_code, end_code
+                )
+                if sgr._color.ansi is None:
+                    escapes.append(None)
+                else:
+                    escapes.append((sgr._start_template, sgr._end_template))
+            # A copy, as another thread may be reading `tables`. If two
+            # threads add a table at once one is lost and built again.
+            tables = dict(tables)
+            if len(tables) >= self.sgr_table_limit:
+                del tables[next(iter(tables))]
+            table = tables[key] = tuple(escapes)
+            self._sgr_tables = tables
+
+        if value <= 0:
+            step = 0
+        elif value >= 1:
+            step = steps
+        else:
+            step = round(value * steps)
+
+        if (escape := table[step]) is None:
+            return text
+        return escape[0] + text + escape[1]
+
     def get_color(self, value: float) -> Color:
         """Map `value` (0-1) to a `Color` from this gradient.
 
@@ -813,6 +939,7 @@ def apply_colors(
     bg: OptionalColor = None,
     fg_none: Color | None = None,
     bg_none: Color | None = None,
+    steps: int | None = None,
     **kwargs: typing.Any,
 ) -> str:
     """Apply colors/gradients to a string depending on the given percentage.
@@ -820,6 +947,8 @@ def apply_colors(
     When percentage is `None`, the `fg_none` and `bg_none` colors will be used.
     Otherwise, the `fg` and `bg` colors will be used. If the colors are
     gradients, the color will be interpolated depending on the percentage.
+    Given `steps`, a gradient's color is rounded to one of `steps` + 1
+    levels and taken from a lookup table instead (see `ColorGradient.wrap`).
     """
     if percentage is None:
         if fg_none is not None:
@@ -827,12 +956,18 @@ def apply_colors(
         if bg_none is not None:
             text = bg_none.bg(text)
     elif fg is not None or bg is not None:
-        fg = get_color(percentage * 0.01, fg)
-        bg = get_color(percentage * 0.01, bg)
+        value = percentage * 0.01
+        # The table holds SGR escapes, which the legacy console can't use
+        lookup = steps and env.COLOR_SUPPORT is not env.ColorSupport.WINDOWS
 
-        if fg is not None:  # pragma: no branch
+        if lookup and isinstance(fg, ColorGradient):
+            text = fg.wrap(text, value, steps, 38, 39)  # type: ignore
+        elif (fg := get_color(value, fg)) is not None:
             text = fg.fg(text)
-        if bg is not None:  # pragma: no branch
+
+        if lookup and isinstance(bg, ColorGradient):
+            text = bg.wrap(text, value, steps, 48, 49)  # type: ignore
+        elif (bg := get_color(value, bg)) is not None:
             text = bg.bg(text)
 
     return text
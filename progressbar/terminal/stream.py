@@ -3,7 +3,7 @@
 `TextIOOutputWrapper` is a pass-through base that delegates every
 `TextIO` operation to a wrapped stream unchanged. Concrete wrappers
 subclass it and override only the operation(s) they need to change
-(typically `write`). Two concrete wrappers:
+(typically `write`). Three concrete wrappers:
 
 - `LineOffsetStreamWrapper` writes a fixed number of lines above the
   current cursor position instead of at it, used by `ProgressBar`'s
@@ -11,6 +11,12 @@ subclass it and override only the operation(s) they need to change
 - `LastLineStream` discards everything but the most recently written
   line, used by `MultiBar` to capture a bar's rendered output without
   letting it reach the terminal directly.
+- `FrameMailboxStream` hands writes to a background writer thread and
+  drops superseded frames, used by `ProgressBar`'s `write_thread=`
+  argument so a slow reader never blocks the instrumented loop.
+
+`RawFdWriter` is not a wrapper but a shortcut past one: it writes a
+frame to a terminal's file descriptor with a single `os.write`.
 
 Every non-underscore name here is re-exported by `progressbar.terminal`
 (``from .stream import *``, no ``__all__``). `LineOffsetStreamWrapper`
@@ -19,7 +25,10 @@ is also part of the top-level `progressbar` public API.
 
 from __future__ import annotations
 
+import io
+import os
 import sys
+import threading
 import typing
 from collections.abc import Generator, Iterable, Iterator
 from types import TracebackType
@@ -239,3 +248,178 @@ class LastLineStream(TextIOOutputWrapper):
             pass
 
         self.line = line
+
+
+class FrameMailboxStream(TextIOOutputWrapper):
+    """Writes to the wrapped stream from a background thread.
+
+    `write` and `flush` never wait on the wrapped stream: the text is
+    queued for a daemon writer thread that writes and flushes it. Plain
+    writes keep their order, but a bar line sent through `write_frame`
+    goes into a single-slot mailbox: a frame the thread hasn't written
+    yet is replaced by the next one instead of queued behind it, so a
+    slow reader sees fewer, but always the latest, frames. `write_to`
+    queues text for another stream in the same order, such as the
+    redirected prints a bar flushes above its line. The thread is
+    started on the first write and stopped by `stop`, which waits until
+    everything queued has been written.
+
+    Each queued chunk is written with its own `write` call, so a
+    wrapper such as `LineOffsetStreamWrapper` works underneath.
+    """
+
+    #: Number of frames replaced before the writer thread got to them
+    dropped: int = 0
+
+    def __init__(self, stream: base.TextIO) -> None:
+        """Queue writes for `stream`."""
+        super().__init__(stream)
+        self._ready = threading.Condition()
+        #: The chunks to write, with the stream each one goes to
+        self._pending: list[tuple[base.IO[str], str]] = []
+        #: Whether the last pending chunk is a frame that may be replaced
+        self._frame_pending = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+
+    def write(self, data: str) -> int:
+        """Queue `data`, after everything written before it."""
+        return self.write_to(self.stream, data)
+
+    def write_to(self, stream: base.IO[str], data: str) -> int:
+        """Queue `data` for `stream`, after everything written before it.
+
+        The writer thread flushes the previous stream before it writes to
+        another one, so text for different streams reaches a shared
+        terminal in the order it was queued.
+        """
+        with self._ready:
+            self._pending.append((stream, data))
+            self._frame_pending = False
+            self._wake()
+        return len(data)
+
+    def write_frame(self, frame: str) -> int:
+        r"""Queue `frame`, replacing a previous frame not yet written.
+
+        Only for output that fully redraws what the previous frame drew,
+        such as a ``'\r'``-prefixed bar line.
+        """
+        with self._ready:
+            if self._frame_pending:
+                self._pending[-1] = self.stream, frame
+                self.dropped += 1
+            else:
+                self._pending.append((self.stream, frame))
+                self._frame_pending = True
+            self._wake()
+        return len(frame)
+
+    def writelines(self, __lines: Iterable[str]) -> None:
+        """Queue each of `__lines`, in order."""
+        for line in __lines:
+            self.write(line)
+
+    def flush(self) -> None:
+        """Don't wait: the writer thread flushes after every batch."""
+
+    def stop(self) -> None:
+        """Write everything still queued and stop the writer thread.
+
+        Raises:
+            Exception: Whatever writing to the wrapped stream raised on
+                the writer thread since the last `stop`.
+        """
+        with self._ready:
+            thread = self._thread
+            self._stopping = True
+            self._ready.notify()
+
+        if thread is not None:
+            thread.join()
+
+        with self._ready:
+            self._thread = None
+            self._stopping = False
+            error, self._error = self._error, None
+
+        if error is not None:
+            raise error
+
+    def _wake(self) -> None:
+        """Start or notify the writer thread. Call with `_ready` held."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name='progressbar-writer', daemon=True
+            )
+            self._thread.start()
+        else:
+            self._ready.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._ready:
+                while not self._pending and not self._stopping:
+                    self._ready.wait()
+                chunks, self._pending = self._pending, []
+                self._frame_pending = False
+
+            if not chunks:
+                return
+
+            try:
+                previous = chunks[0][0]
+                for stream, text in chunks:
+                    if stream is not previous:
+                        previous.flush()
+                        previous = stream
+                    stream.write(text)
+                previous.flush()
+            except Exception as exception:  # noqa: BLE001
+                # Reported by `stop()`, so the loop being measured isn't
+                # interrupted by its progressbar's output
+                self._error = exception
+
+
+class RawFdWriter:
+    """Writes whole frames to a terminal's file descriptor directly.
+
+    A `TextIOWrapper` write followed by a `flush` goes through the text
+    and buffer layers twice; encoding the frame once and handing it to
+    `os.write` does the same work in one call. Only offered (see
+    `for_stream`) for a `TextIOWrapper` on a POSIX terminal, where the
+    result is indistinguishable.
+    """
+
+    __slots__ = ('encoding', 'fileno', 'stream')
+
+    def __init__(self, stream: io.TextIOWrapper, fileno: int) -> None:
+        """Write to `fileno`, the descriptor underneath `stream`."""
+        self.stream = stream
+        self.fileno = fileno
+        self.encoding = stream.encoding
+
+    @classmethod
+    def for_stream(cls, stream: typing.Any) -> RawFdWriter | None:
+        """Return a writer for `stream` if it is safe to bypass, or `None`."""
+        if os.name != 'posix' or not isinstance(stream, io.TextIOWrapper):
+            return None
+
+        try:
+            fileno = stream.fileno()
+            if not os.isatty(fileno):
+                return None
+        except (OSError, ValueError):
+            return None
+        return cls(stream, fileno)
+
+    def write(self, frame: str) -> None:
+        """Write `frame` after whatever `stream` still has buffered."""
+        # Anything written through `stream` itself goes out first
+        self.stream.flush()
+        data = frame.encode(self.encoding, 'replace')
+        fileno = self.fileno
+        # A terminal write can come up short when a signal interrupts it
+        while data:
+            data = data[os.write(fileno, data) :]
@@ -1,4 +1,4 @@
-"""Color stripping, delta coalescing, and stdout/stderr redirection.
+"""Color stripping, display widths, delta coalescing, and redirection.
 
 The redirection machinery (`WrappingIO`, `StreamWrapper`, and the
 module-level `streams` singleton constructed at the bottom of this
@@ -13,12 +13,14 @@ from __future__ import annotations
 import atexit
 import contextlib
 import datetime
+import functools
 import io
 import logging
 import os
 import re
 import sys
 import typing
+import unicodedata
 from collections.abc import Callable, Iterable, Iterator, Mapping
 from types import TracebackType
 
@@ -170,6 +172,54 @@ def len_color(value: types.StringTypes) -> int:
     return len(no_color(value))
 
 
+def display_width(value: types.StringTypes) -> int:
+    """Return the number of terminal columns `value` takes up.
+
+    Like `len_color`, ANSI escape codes take no room. Unlike it, East Asian
+    wide and fullwidth characters (CJK, most emoji) take two columns, and
+    combining marks and other zero-width characters (such as a zero-width
+    joiner or an emoji variation selector) none. ASCII text, the common
+    case, is measured without looking at the characters; anything else
+    is cached per string, since a bar keeps showing the same markers and
+    labels from one redraw to the next.
+
+    >>> display_width('abc')
+    3
+    >>> display_width('\u001b[31mabc\u001b[0m')
+    3
+    >>> display_width('進捗')
+    4
+    >>> display_width('e\u0301')
+    1
+    """
+    if isinstance(value, str) and not value.isascii():
+        return _unicode_width(value)
+    return len(no_color(value))
+
+
+@functools.lru_cache(maxsize=4096)
+def _unicode_width(value: str) -> int:
+    """Sum the column widths of the characters of `value`, see above."""
+    return sum(map(_char_width, no_color(value)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _char_width(char: str) -> int:
+    """Return the columns `char` takes up: 0, 1 or 2."""
+    if char.isascii():
+        return 1
+    elif unicodedata.combining(char) or unicodedata.category(char) in (
+        'Mn',
+        'Me',
+        'Cf',
+    ):
+        return 0
+    elif unicodedata.east_asian_width(char) in ('W', 'F'):
+        return 2
+    else:
+        return 1
+
+
 class WrappingIO:
     """`sys.stdout`/`sys.stderr` replacement installed while capturing.
 
@@ -248,15 +298,24 @@ class WrappingIO:
         """
         self.buffer.flush()
 
-    def _flush(self) -> None:
+    def _flush(
+        self, queue: Callable[[base.IO, str], typing.Any] | None = None
+    ) -> None:
         """Write buffered output through to `target`, then flush it.
 
         The buffer is drained (`seek`/`truncate`) *before*
         `target.write()` is called, not after, so if that write
         raises, the already-buffered text isn't written a second time
-        by the next call. `target` is flushed unconditionally at the
-        end, even when the buffer was empty, since this runs on every
-        bar redraw, not just when there's something to flush.
+        by the next call. Without `queue`, `target` is flushed
+        unconditionally at the end, even when the buffer was empty, since
+        this runs on every bar redraw, not just when there's something to
+        flush.
+
+        Args:
+            queue: Called as ``queue(target, text)`` to hand the text to
+                a bar's writer thread (see `FrameMailboxStream.write_to`)
+                instead of writing it here. The writer thread flushes
+                `target` itself.
         """
         if value := self.buffer.getvalue():
             self.flush()
@@ -266,10 +325,14 @@ class WrappingIO:
             self.buffer.truncate(0)
             self.needs_clear = False
             if not self.target.closed:
-                self.target.write(value)
+                if queue is None:
+                    self.target.write(value)
+                else:
+                    queue(self.target, value)
 
-        # when explicitly flushing, always flush the target as well
-        self.flush_target()
+        if queue is None:
+            # when explicitly flushing, always flush the target as well
+            self.flush_target()
 
     def flush_target(self) -> None:  # pragma: no cover
         """Flush `target` itself, if it's open and flushable."""
@@ -711,9 +774,13 @@ class StreamWrapper:
         stderr_needs_clear = getattr(self.stderr, 'needs_clear', False)
         return stderr_needs_clear or stdout_needs_clear
 
-    def flush(self) -> None:
+    def flush(
+        self, queue: Callable[[base.IO, str], typing.Any] | None = None
+    ) -> None:
         """Flush buffered captured output on both wrapped streams.
 
+        `queue` is passed on to `WrappingIO._flush`.
+
         If writing the buffered text to a stream's target raises
         `io.UnsupportedOperation` (as happens for some non-seekable
         streams), that stream's redirection disables itself:
@@ -725,7 +792,7 @@ class StreamWrapper:
         """
         if self.wrapped_stdout and isinstance(self.stdout, WrappingIO):
             try:
-                self.stdout._flush()
+                self.stdout._flush(queue)
             except io.UnsupportedOperation:
                 self.wrapped_stdout = 0
                 logger.warning(
@@ -735,7 +802,7 @@ class StreamWrapper:
 
         if self.wrapped_stderr and isinstance(self.stderr, WrappingIO):
             try:
-                self.stderr._flush()
+                self.stderr._flush(queue)
             except io.UnsupportedOperation:  # pragma: no cover
                 self.wrapped_stderr = 0
                 logger.warning(
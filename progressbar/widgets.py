@@ -11,9 +11,12 @@ from __future__ import annotations
 import abc
 import collections.abc
 import contextlib
+import copy
 import datetime
 import functools
 import logging
+import re
+import string
 import typing
 from typing import ClassVar
 
@@ -37,6 +40,125 @@ FormatString = str | None
 T = typing.TypeVar('T')
 
 
+#: `%`-style conversions: `%(name)s`, an escaped `%%`, or a bare `%s`
+_PERCENT_FIELD_RE = re.compile(r'%(?:\(([^)]*)\)|%|)')
+#: The top-level name of a `str.format` field plus the attribute or item
+#: right after it, e.g. `variables` and `name` for `{variables.name}`
+_FORMAT_FIELD_RE = re.compile(r'([^.\[]*)(?:[.\[](\w+))?')
+#: `data()` keys holding the user variables (the same object twice)
+_VARIABLES_KEYS = frozenset(('variables', 'dynamic_messages'))
+#: The origin of `SamplesMixin`'s float sample times for a `progress`
+#: without a clock of its own. Recent enough that a double still resolves
+#: well below a microsecond.
+_SAMPLE_EPOCH = datetime.datetime(2000, 1, 1)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_fields(
+    format: str, new_style: bool = False
+) -> tuple[str, ...] | None:
+    """Return the `data()` fields a format string references.
+
+    A single bar variable is reported as `'variables.<name>'`. Returns
+    `None` when that can't be determined, e.g. for positional fields.
+
+    >>> _format_fields('%(value)d of %(max_value)d (100%%)')
+    ('value', 'max_value')
+    >>> _format_fields('{variables.loss:.2f} {value}', new_style=True)
+    ('variables.loss', 'value')
+    >>> _format_fields('%s') is None
+    True
+    """
+    if new_style:
+        fields = _new_style_format_fields(format)
+    else:
+        fields = _percent_format_fields(format)
+
+    return None if fields is None else tuple(dict.fromkeys(fields))
+
+
+def _percent_format_fields(format: str) -> list[str] | None:
+    """Return the `%(name)s` fields in `format`, see `_format_fields`."""
+    fields: list[str] = []
+    for match in _PERCENT_FIELD_RE.finditer(format):
+        if match.group(1) is not None:
+            fields.append(match.group(1))
+        elif match.group(0) != '%%':
+            return None
+    return fields
+
+
+def _new_style_format_fields(format: str) -> list[str] | None:
+    """Return the `{name}` fields in `format`, see `_format_fields`."""
+    try:
+        parsed = list(string.Formatter().parse(format))
+    except ValueError:
+        return None
+
+    fields: list[str] = []
+    for _, field, spec, _ in parsed:
+        if field is not None:
+            match = _FORMAT_FIELD_RE.match(field)
+            name, item = match.groups()  # type: ignore[union-attr]
+            if not name or name.isdigit():
+                return None
+            elif name in _VARIABLES_KEYS and item:
+                fields.append(f'variables.{item}')
+            else:
+                fields.append(name)
+
+        if spec:
+            spec_fields = _new_style_format_fields(spec)
+            if spec_fields is None:
+                return None
+            fields.extend(spec_fields)
+
+    return fields
+
+
+@functools.cache
+def _declares_data_fields(cls: type[WidgetBase]) -> bool:
+    """Whether `cls.data_fields` was declared for its rendering code.
+
+    The declaration only counts if no subclass of the declaring class
+    overrides `__call__` or `get_format`, since such an override can
+    render from anything.
+    """
+    mro = cls.__mro__
+    declared = next(
+        index
+        for index, base_ in enumerate(mro)
+        if 'data_fields' in vars(base_)
+    )
+    return not any(
+        '__call__' in vars(base_) or 'get_format' in vars(base_)
+        for base_ in mro[:declared]
+    )
+
+
+@functools.cache
+def _shares_configuration(cls: type[WidgetBase]) -> bool:
+    """Whether a per-bar copy of a `cls` widget may share its attributes.
+
+    Like `_declares_data_fields`, a `copy_fields` declaration vouches for
+    the declaring class and its bases. Any `__init__` in a subclass below
+    it has to come from this package: another one can set up state that
+    rendering mutates in place, so such a widget is deep-copied for every
+    bar instead.
+    """
+    mro = cls.__mro__
+    declared = next(
+        index
+        for index, base_ in enumerate(mro)
+        if 'copy_fields' in vars(base_)
+    )
+    return not any(
+        '__init__' in vars(base_)
+        and base_.__module__.partition('.')[0] != __package__
+        for base_ in mro[:declared]
+    )
+
+
 def string_or_lambda(
     input_: str | collections.abc.Callable[..., str],
 ) -> collections.abc.Callable[..., str]:
@@ -111,7 +233,8 @@ def create_marker(
 
     A single-character `marker` string becomes a callable that repeats
     it proportionally to where `progress.value` sits between
-    `progress.min_value` and `progress.max_value`, clamped to `width`.
+    `progress.min_value` and `progress.max_value`, clamped to `width`
+    columns (so a two-column emoji or CJK marker repeats half as often).
     A callable `marker` is used as-is. Either way, the result is passed
     through :func:`wrapper` so `wrap` still applies.
 
@@ -126,6 +249,7 @@ def create_marker(
         marker_str = converters.to_unicode(marker)
         if utils.len_color(marker_str) != 1:
             raise ValueError('Markers are required to be 1 char')
+        marker_width = max(utils.display_width(marker_str), 1)
 
         def _marker(progress, data, width):
             if (
@@ -144,7 +268,7 @@ def create_marker(
                         * width,
                     ),
                 )
-                return marker_str * length
+                return marker_str * (length // marker_width)
             else:
                 return marker_str
 
@@ -198,7 +322,9 @@ class FormatWidgetMixin:
         format_ = self.get_format(progress, data, format)
         try:
             if self.new_style:
-                return format_.format(**data)
+                # `format_map` only looks up the fields the format uses,
+                # so derived `data()` fields it doesn't show aren't computed
+                return format_.format_map(data)
             else:
                 return format_ % data
         except (TypeError, KeyError):
@@ -312,10 +438,13 @@ class WidgetBase(WidthWidgetMixin, metaclass=abc.ABCMeta):
     State specific to one progressbar belongs in `progress.extra` (see
     e.g. `SamplesMixin`) rather than on the widget, which keeps the
     widget stateless: the bar owns the state and clears it on restart.
-    Widgets passed via `widgets=` are deep-copied per bar by
+    Widgets passed via `widgets=` are copied per bar by
     `ProgressBar._copy_widgets` unless they set ``copy = False``, so a
     genuinely shared instance is the exception -- but a widget that
-    keeps per-bar state on itself breaks in exactly that case.
+    keeps per-bar state on itself breaks in exactly that case. The copy
+    shares the widget's configuration with the original (see
+    `copy_fields`), so it costs the same however elaborate the colors,
+    gradients or format strings are.
 
     Variables available:
      - min_width: Only display the widget if at least `min_width` is left
@@ -330,6 +459,21 @@ class WidgetBase(WidthWidgetMixin, metaclass=abc.ABCMeta):
 
     copy = True
 
+    #: The `data()` fields the output depends on, or `None` (the default)
+    #: when unknown. A bar re-renders a fixed-width widget declaring its
+    #: fields only when one of them changed, and reuses its previous output
+    #: otherwise. `'variables.<name>'` refers to a single bar variable. A
+    #: subclass overriding `__call__` or `get_format` has to declare its
+    #: own fields, until it does, its output is never reused.
+    data_fields: tuple[str, ...] | None = None
+
+    #: The attributes a per-bar copy gets its own (shallow) copy of because
+    #: the widget changes them in place, such as a cache. Every other
+    #: attribute is configuration, shared between the copies. A subclass
+    #: outside this package whose `__init__` sets up attributes is deep
+    #: copied instead, unless it declares its own `copy_fields`.
+    copy_fields: tuple[str, ...] = ()
+
     @abc.abstractmethod
     def __call__(self, progress: ProgressBarMixinBase, data: Data) -> str:
         """Updates the widget.
@@ -337,6 +481,31 @@ class WidgetBase(WidthWidgetMixin, metaclass=abc.ABCMeta):
         progress - a reference to the calling ProgressBar
         """
 
+    def get_data_fields(self) -> tuple[str, ...] | None:
+        """Return `data_fields` if it can be trusted for this class."""
+        if _declares_data_fields(type(self)):
+            return self.data_fields
+        else:
+            return None
+
+    def _copy_for_bar(self) -> WidgetBase:
+        """Return the copy of this widget a new bar renders with.
+
+        The copy shares all attributes except `copy_fields` with this
+        widget, which is what makes creating thousands of bars from one
+        widget list cheap.
+        """
+        cls = type(self)
+        if not _shares_configuration(cls):
+            return copy.deepcopy(self)
+
+        clone = cls.__new__(cls)
+        attributes = vars(clone)
+        attributes.update(vars(self))
+        for name in self.copy_fields:
+            attributes[name] = copy.copy(attributes[name])
+        return clone
+
     # Class-level defaults. Instances may hold their own copy when a
     # ``fixed_colors``/``gradient_colors`` override is passed (copy-on-write in
     # ``__init__``), so these are not ``ClassVar``.
@@ -360,11 +529,19 @@ class WidgetBase(WidthWidgetMixin, metaclass=abc.ABCMeta):
         return any(value is not None for value in self._fixed_colors.values())
 
     def _apply_colors(self, text: str, data: Data) -> str:
-        """Wrap `text` in the configured fixed/gradient colors, if any."""
-        if self.uses_colors:
+        """Wrap `text` in the configured fixed/gradient colors, if any.
+
+        Nothing is generated when the bar has colors disabled
+        (``data['enable_colors']``), so it doesn't have to strip them
+        again. A `data` mapping without that key keeps the colors.
+        Gradients come from a table with one color per column of
+        ``data['term_width']``, see `terminal.ColorGradient.wrap`.
+        """
+        if self.uses_colors and data.get('enable_colors', True):
             return terminal.apply_colors(
                 text,
                 data.get('percentage'),
+                steps=data.get('term_width'),
                 **self._gradient_colors,
                 **self._fixed_colors,
             )
@@ -485,6 +662,17 @@ class FormatLabel(FormatWidgetMixin, WidgetBase):
         """Create a `FormatLabel` for the given `format` string."""
         super().__init__(format=format, **kwargs)
 
+    @property
+    def data_fields(self) -> tuple[str, ...] | None:  # type: ignore[override]
+        """The fields in `format`, with the `mapping` aliases resolved."""
+        fields = _format_fields(self.format, self.new_style)
+        if fields is None:
+            return None
+        return tuple(
+            self.mapping[field][0] if field in self.mapping else field
+            for field in fields
+        )
+
     def __call__(
         self,
         progress: ProgressBarMixinBase,
@@ -583,31 +771,68 @@ class SamplesMixin(TimeSensitiveWidgetBase, metaclass=abc.ABCMeta):
         self.key_prefix = (key_prefix or self.__class__.__name__) + '_'
         super().__init__(**kwargs)
 
-    def get_sample_times(self, progress: ProgressBarMixinBase, data: Data):
-        """Return this bar's sample-time deque, creating it if needed.
+    def get_samples(
+        self, progress: ProgressBarMixinBase, data: Data
+    ) -> algorithms.SampleRing:
+        """Return this bar's sample ring, creating it if needed.
 
         Stored on `progress.extra` (keyed by `self.key_prefix`), not on
         `self`, which keeps the widget stateless: the history belongs to
         the bar, so `ProgressBar.init()` clears it when a bar is
         restarted, and a widget instance that does end up shared between
         bars cannot mix their samples together. Widgets passed via
-        `widgets=` are deep-copied per bar by
-        `ProgressBar._copy_widgets`, so sharing is the exception rather
-        than the rule.
+        `widgets=` are copied per bar by `ProgressBar._copy_widgets`, so
+        sharing is the exception rather than the rule.
+
+        The times are seconds, see `_sample_time`. A sample count
+        gives the ring a fixed capacity, a `timedelta` window lets it
+        grow as far as the window needs.
         """
-        return progress.extra.setdefault(
-            f'{self.key_prefix}sample_times',
-            containers.SliceableDeque(),
+        key = f'{self.key_prefix}samples'
+        if (samples := progress.extra.get(key)) is None:
+            capacity = None
+            if not isinstance(self.samples, datetime.timedelta):
+                # Fractional counts round down, as `len() > samples` did
+                capacity = max(int(self.samples), 1)
+            samples = progress.extra[key] = algorithms.SampleRing(capacity)
+        return samples
+
+    def get_sample_times(self, progress: ProgressBarMixinBase, data: Data):
+        """Return a copy of this bar's sample times as `datetime`s.
+
+        See `get_samples` for where the samples live.
+        """
+        if (ns := getattr(progress, '_last_update_ns', None)) is None:
+            epoch, origin = _SAMPLE_EPOCH, 0.0
+        else:
+            # Measured from the newest timestamp: the differences stay
+            # exact to the microsecond where the raw seconds might not
+            epoch, origin = progress._ns_to_datetime(ns), ns / 1e9
+        return containers.SliceableDeque(
+            epoch + datetime.timedelta(seconds=time - origin)
+            for time in self.get_samples(progress, data).times()
         )
 
+    @staticmethod
+    def _sample_time(progress: ProgressBarMixinBase) -> float:
+        """Return `progress.last_update_time` in seconds.
+
+        A bar's own `perf_counter_ns()` timestamp is read directly, so a
+        redraw doesn't build a `datetime` just to turn it back into a
+        number. A duck-typed `progress`, like the one in the class
+        example, is measured from `_SAMPLE_EPOCH` instead.
+        """
+        if (ns := getattr(progress, '_last_update_ns', None)) is not None:
+            return ns / 1e9
+        return (progress.last_update_time - _SAMPLE_EPOCH).total_seconds()
+
     def get_sample_values(self, progress: ProgressBarMixinBase, data: Data):
-        """Return this bar's sample-value deque, creating it if needed.
+        """Return a copy of this bar's sample values.
 
-        See `get_sample_times` for why this lives on `progress.extra`.
+        See `get_samples` for where the samples live.
         """
-        return progress.extra.setdefault(
-            f'{self.key_prefix}sample_values',
-            containers.SliceableDeque(),
+        return containers.SliceableDeque(
+            self.get_samples(progress, data).values()
         )
 
     def __call__(
@@ -623,8 +848,8 @@ class SamplesMixin(TimeSensitiveWidgetBase, metaclass=abc.ABCMeta):
         `int`, or by dropping samples older than `self.samples` when
         it's a `timedelta` (always keeping at least the two most recent
         so a delta can still be computed). The window itself lives in
-        `progress.extra`, not on the widget. See `get_sample_times` for
-        why.
+        `progress.extra`, not on the widget. See `get_samples` for why.
+        Either way a sample costs the same however long the window is.
 
         Args:
             progress: The calling `ProgressBar`.
@@ -639,36 +864,28 @@ class SamplesMixin(TimeSensitiveWidgetBase, metaclass=abc.ABCMeta):
             `(sample_times, sample_values)` deques, or the delta tuple
             described above when `delta` is set.
         """
-        sample_times = self.get_sample_times(progress, data)
-        sample_values = self.get_sample_values(progress, data)
-
-        if sample_times:
-            sample_time = sample_times[-1]
-        else:
-            sample_time = datetime.datetime.min
+        samples = self.get_samples(progress, data)
+        now = self._sample_time(progress)
 
-        if progress.last_update_time - sample_time > self.INTERVAL:
+        if not samples or (
+            now - samples.time(-1) > self.INTERVAL.total_seconds()
+        ):
             # Add a sample, then trim the window back to `self.samples`
-            sample_times.append(progress.last_update_time)
-            sample_values.append(progress.value)
-
+            samples.append(now, progress.value)
             if isinstance(self.samples, datetime.timedelta):
-                minimum_time = progress.last_update_time - self.samples
-                while sample_times[2:] and minimum_time > sample_times[1]:
-                    sample_times.pop(0)
-                    sample_values.pop(0)
-            elif len(sample_times) > self.samples:
-                sample_times.pop(0)
-                sample_values.pop(0)
+                samples.trim(now - self.samples.total_seconds())
 
         if delta:
-            if delta_time := sample_times[-1] - sample_times[0]:
-                delta_value = sample_values[-1] - sample_values[0]
-                return delta_time, delta_value
+            if delta_time := samples.time(-1) - samples.time(0):
+                delta_value = samples.value(-1) - samples.value(0)
+                return datetime.timedelta(seconds=delta_time), delta_value
             else:
                 return None, None
         else:
-            return sample_times, sample_values
+            return (
+                self.get_sample_times(progress, data),
+                self.get_sample_values(progress, data),
+            )
 
 
 class ETA(Timer):
@@ -914,6 +1131,7 @@ class SmoothingETA(ETA):
 
     smoothing_algorithm: algorithms.SmoothingAlgorithm
     smoothing_parameters: dict[str, float]
+    copy_fields = ('smoothing_algorithm',)
 
     def __init__(
         self,
@@ -1189,6 +1407,11 @@ class Counter(FormatWidgetMixin, WidgetBase):
         # the ``WidgetBase`` tail of the cooperative chain.
         super().__init__(format=format, **kwargs)
 
+    @property
+    def data_fields(self) -> tuple[str, ...] | None:  # type: ignore[override]
+        """The fields in `format`."""
+        return _format_fields(self.format, self.new_style)
+
     def __call__(
         self,
         progress: ProgressBarMixinBase,
@@ -1231,6 +1454,15 @@ class Percentage(FormatWidgetMixin, ColoredMixin, WidgetBase):
         self.na = na
         super().__init__(format=format, **kwargs)
 
+    @property
+    def data_fields(self) -> tuple[str, ...] | None:  # type: ignore[override]
+        """`percentage` (which also picks the color) plus the format's."""
+        fields = _format_fields(self.format, self.new_style)
+        na_fields = _format_fields(self.na, self.new_style)
+        if fields is None or na_fields is None:
+            return None
+        return tuple(dict.fromkeys(('percentage', *fields, *na_fields)))
+
     def get_format(
         self,
         progress: ProgressBarMixinBase,
@@ -1335,6 +1567,7 @@ class SimpleProgress(FormatWidgetMixin, ColoredMixin, WidgetBase):
     ]
 
     DEFAULT_FORMAT = '%(value_s)s of %(max_value_s)s'
+    copy_fields = ('max_width_cache',)
 
     def __init__(self, format=DEFAULT_FORMAT, **kwargs: typing.Any):
         """Create a `SimpleProgress` with the given `format` string."""
@@ -1586,6 +1819,7 @@ class FormatCustomText(FormatWidgetMixin, WidgetBase):
 
     mapping: dict[str, typing.Any] = dict()  # noqa: RUF012
     copy = False
+    copy_fields = ('mapping',)
 
     def __init__(
         self,
@@ -1676,6 +1910,11 @@ class Postfix(VariableMixin, WidgetBase):
         VariableMixin.__init__(self, name=name)
         WidgetBase.__init__(self, **kwargs)
 
+    @property
+    def data_fields(self) -> tuple[str, ...]:  # type: ignore[override]
+        """Only the variable itself."""
+        return (f'variables.{self.name}',)
+
     def __call__(self, progress: ProgressBarMixinBase, data: Data) -> str:
         """Render the variable, or `''` if it's unset/empty."""
         value = data['variables'].get(self.name)
@@ -1747,16 +1986,21 @@ class MultiRangeBar(Bar, VariableMixin):
             middle = ''
             values_accumulated = 0
             width_accumulated = 0
-            for marker, value in zip(self.markers, values, strict=False):
-                marker = converters.to_unicode(marker(progress, data, width))
-                if progress.custom_len(marker) != 1:
+            for render, value in zip(self.markers, values, strict=False):
+                marker = converters.to_unicode(render(progress, data, width))
+                if utils.len_color(marker) != 1:
                     raise ValueError('Markers are required to be 1 char')
 
                 values_accumulated += value
                 item_width = int(values_accumulated / values_sum * width)
                 item_width -= width_accumulated
                 width_accumulated += item_width
-                middle += item_width * marker
+                # A wide marker fills its share two columns at a time, with
+                # a space for an odd column left over
+                repeats, rest = divmod(
+                    item_width, max(progress.custom_len(marker), 1)
+                )
+                middle += repeats * marker + rest * ' '
         else:
             fill = converters.to_unicode(self.fill(progress, data, width))
             if progress.custom_len(fill) != 1:
@@ -2042,6 +2286,18 @@ class Variable(FormatWidgetMixin, VariableMixin, WidgetBase):
         # ``name`` rides the cooperative chain to VariableMixin.
         super().__init__(name=name, format=format, **kwargs)
 
+    @property
+    def data_fields(self) -> tuple[str, ...] | None:  # type: ignore[override]
+        """The variable plus whatever else `format` uses from `data()`."""
+        fields = _format_fields(self.format, new_style=True)
+        if fields is None:
+            return None
+        own = ('value', 'name', 'width', 'precision', 'formatted_value')
+        return (
+            f'variables.{self.name}',
+            *(field for field in fields if field not in own),
+        )
+
     def __call__(
         self,
         progress: ProgressBarMixinBase,
@@ -2155,6 +2411,7 @@ class JobStatusBar(Bar, VariableMixin):
     Per-run marker state lives in ``progress.extra`` instead (see
     :py:meth:`get_job_markers`).
     """
+    copy_fields = ('job_markers',)
 
     def __init__(
         self,
@@ -2262,10 +2519,11 @@ class JobStatusBar(Bar, VariableMixin):
                 fg_color = bg_color = None
 
             marker = converters.to_unicode(marker)
-            if fg_color:  # pragma: no branch
-                marker = fg_color.fg(marker)
-            if bg_color:  # pragma: no cover
-                marker = bg_color.bg(marker)
+            if data.get('enable_colors', True):
+                if fg_color:  # pragma: no branch
+                    marker = fg_color.fg(marker)
+                if bg_color:  # pragma: no cover
+                    marker = bg_color.bg(marker)
 
             job_markers = self.get_job_markers(progress)
             job_markers.append(marker)
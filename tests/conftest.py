@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections.abc
+import io
 import logging
 import time
 import timeit
@@ -26,6 +27,25 @@ def pytest_configure(config: pytest.Config) -> None:
     )
 
 
+@pytest.fixture
+def make_bar() -> collections.abc.Callable[..., typing.Any]:
+    """Return a factory for bars drawing a `Counter` to a new `StringIO`.
+
+    The factory takes an `fd` to draw to instead, a `bar_class` to create
+    and any other argument of `bar_class`, `widgets` included.
+    """
+
+    def make_bar(
+        fd: typing.TextIO | None = None,
+        bar_class: type[progressbar.ProgressBar] = progressbar.ProgressBar,
+        **kwargs: typing.Any,
+    ) -> typing.Any:
+        kwargs.setdefault('widgets', [progressbar.Counter()])
+        return bar_class(fd=io.StringIO() if fd is None else fd, **kwargs)
+
+    return make_bar
+
+
 @pytest.fixture(autouse=True)
 def disable_native_accelerator(monkeypatch: pytest.MonkeyPatch) -> None:
     # The optional native accelerator (speedups.FastBarIterator) is exercised
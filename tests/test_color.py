@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import concurrent.futures
 import os
+import subprocess
+import sys
+import typing
 
 import pytest
 
@@ -319,6 +323,48 @@ def test_registered_color_hls_matches_rgb() -> None:
         assert color.hls == terminal.HSL.from_rgb(color.rgb)
 
 
+def test_colors_are_built_on_first_use() -> None:
+    assert colors.red is Colors.by_xterm[9]
+    assert colors.red is colors.red
+    # Where several colors share a name, the last one is the attribute
+    assert colors.blue3.xterm == 20
+    assert 'dodger_blue2' in dir(colors)
+
+    with pytest.raises(AttributeError):
+        colors.no_such_color  # noqa: B018
+
+
+def test_color_indexes_are_built_on_first_use(monkeypatch) -> None:
+    monkeypatch.setattr(Colors, '_indexes', None)
+    monkeypatch.setattr(Colors, '_registered', [])
+    before = Colors.register(terminal.RGB(1, 2, 3), name='Before', xterm=9)
+    assert Colors._indexes is None
+
+    # The xterm table comes first, so the earlier registration wins
+    assert Colors.by_xterm[9] is before
+    assert Colors.by_name['Red'] == [colors.red]
+    assert Colors.by_lowername['before'] == [before]
+
+    after = Colors.register(terminal.RGB(1, 2, 3), before.hls, name='After')
+    assert Colors.by_rgb[after.rgb] == [before, after]
+    assert Colors.by_hex[after.rgb.hex] == [before, after]
+    assert Colors.by_hls[after.hls] == [before, after]
+    assert not Colors._registered
+
+
+def test_importing_widgets_builds_few_colors() -> None:
+    code = (
+        'import progressbar.widgets\n'
+        'from progressbar.terminal import Colors, colors\n'
+        'print(len(list(filter(None, colors._colors))), Colors._indexes)'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    built, indexes = output.split()
+
+    assert int(built) < 20
+    assert indexes == 'None'
+
+
 @pytest.mark.parametrize(
     'rgb, expected',
     [
@@ -433,6 +479,100 @@ def test_apply_colors(
     )
 
 
+@pytest.mark.parametrize(
+    'support',
+    [
+        env.ColorSupport.NONE,
+        env.ColorSupport.XTERM_256,
+        env.ColorSupport.XTERM_TRUECOLOR,
+    ],
+)
+def test_gradient_lookup_matches_interpolation(monkeypatch, support) -> None:
+    monkeypatch.setattr(env, 'COLOR_SUPPORT', support)
+    # Unregistered colors, so `NONE` leaves them without an escape
+    gradient = terminal.ColorGradient(
+        *(
+            Color(rgb, terminal.HSL.from_rgb(rgb), None, None)
+            for rgb in (terminal.RGB(255, 0, 0), terminal.RGB(0, 255, 0))
+        )
+    )
+
+    for percentage in (-5, 0, 25, 50, 75, 100, 150):
+        expected = apply_colors('x', percentage, fg=gradient, bg=gradient)
+        assert (
+            apply_colors('x', percentage, fg=gradient, bg=gradient, steps=4)
+            == expected
+        )
+
+    # Between the levels the nearest one is used
+    assert apply_colors('x', 30, fg=gradient, steps=4) == apply_colors(
+        'x', 25, fg=gradient
+    )
+
+
+def test_gradient_lookup_follows_resizes(monkeypatch) -> None:
+    monkeypatch.setattr(env, 'COLOR_SUPPORT', env.ColorSupport.XTERM_256)
+    gradient = terminal.ColorGradient(colors.red, colors.green)
+
+    gradient.wrap('x', 0.5, 4)
+    table = gradient._sgr_tables[38, 4, env.ColorSupport.XTERM_256]
+    gradient.wrap('x', 0.75, 4)
+    assert gradient._sgr_tables[38, 4, env.ColorSupport.XTERM_256] is table
+
+    gradient.wrap('x', 0.5, 8)
+    assert len(gradient._sgr_tables[38, 8, env.ColorSupport.XTERM_256]) == 9
+
+    monkeypatch.setattr(env, 'COLOR_SUPPORT', env.ColorSupport.XTERM)
+    gradient.wrap('x', 0.5, 8)
+    assert (38, 8, env.ColorSupport.XTERM) in gradient._sgr_tables
+
+
+def test_gradient_lookup_keeps_tables_for_several_widths(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(env, 'COLOR_SUPPORT', env.ColorSupport.XTERM_256)
+    gradient = terminal.ColorGradient(colors.red, colors.green)
+
+    # Two bars of different widths sharing the gradient
+    gradient.wrap('x', 0.5, 4)
+    gradient.wrap('x', 0.5, 8)
+    tables = dict(gradient._sgr_tables)
+    for _ in range(3):
+        assert gradient.wrap('x', 0.5, 4) == gradient.wrap('x', 0.5, 8)
+    assert gradient._sgr_tables == tables
+    for key, table in tables.items():
+        assert gradient._sgr_tables[key] is table
+
+    # Beyond the limit the oldest table makes room
+    for steps in range(10, 10 + gradient.sgr_table_limit - 1):
+        gradient.wrap('x', 0.5, steps)
+    assert len(gradient._sgr_tables) == gradient.sgr_table_limit
+    assert (38, 4, env.ColorSupport.XTERM_256) not in gradient._sgr_tables
+    assert (38, 8, env.ColorSupport.XTERM_256) in gradient._sgr_tables
+
+
+def test_gradient_lookup_swaps_in_new_tables(monkeypatch) -> None:
+    monkeypatch.setattr(env, 'COLOR_SUPPORT', env.ColorSupport.XTERM_256)
+    gradient = terminal.ColorGradient(colors.red, colors.green)
+    monkeypatch.setattr(gradient, 'sgr_table_limit', 1)
+    gradient.wrap('x', 0.5, 4)
+    tables = gradient._sgr_tables
+
+    # A thread still holding the old dict sees it unchanged
+    expected = gradient.wrap('x', 0.5, 8)
+    assert gradient._sgr_tables is not tables
+    assert list(tables) == [(38, 4, env.ColorSupport.XTERM_256)]
+    assert list(gradient._sgr_tables) == [(38, 8, env.ColorSupport.XTERM_256)]
+
+    def draw(steps: int) -> list[str]:
+        return [gradient.wrap('x', 0.5, steps) for _ in range(500)]
+
+    # Threads evicting each other's table at the limit
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(draw, [4, 8] * 4))
+    assert all(result == [expected] * 500 for result in results)
+
+
 def test_windows_colors(monkeypatch) -> None:
     monkeypatch.setattr(env, 'COLOR_SUPPORT', env.ColorSupport.WINDOWS)
     assert (
@@ -617,3 +757,42 @@ def test_bar_with_colors_opted_out_renders_text_unchanged() -> None:
 
     assert not bar_widget.uses_colors
     assert bar_widget._apply_colors('#####', {}) == '#####'
+
+
+@pytest.mark.parametrize('enable_colors', [False, True])
+def test_colors_are_not_generated_when_disabled(
+    monkeypatch, enable_colors
+) -> None:
+    import io
+
+    generated: list[str] = []
+    real = terminal.apply_colors
+
+    def recording_apply_colors(
+        text: str, *args: typing.Any, **kwargs: typing.Any
+    ) -> str:
+        generated.append(text)
+        return real(text, *args, **kwargs)
+
+    monkeypatch.setattr(terminal, 'apply_colors', recording_apply_colors)
+    bar = progressbar.ProgressBar(
+        fd=io.StringIO(),
+        max_value=10,
+        term_width=60,
+        enable_colors=enable_colors,
+        widgets=[
+            progressbar.Percentage(),
+            progressbar.Bar(),
+            progressbar.FormatLabelBar('%(value)d'),
+            widgets.JobStatusBar('status'),
+        ],
+        variables={'status': True},
+    )
+    bar.start()
+    bar.update(5, force=True)
+
+    assert bool(generated) == enable_colors
+    assert bar.data()['enable_colors'] == bar.enable_colors
+    line = bar._format_line()
+    assert ('\x1b' in line) == enable_colors
+    bar.finish()
@@ -1,3 +1,11 @@
+from __future__ import annotations
+
+import collections.abc
+import functools
+import io
+import pickle
+import typing
+
 import pytest
 
 import progressbar
@@ -23,3 +31,135 @@ import progressbar
 def test_data_size(value, expected) -> None:
     widget = progressbar.DataSize()
     assert widget(None, dict(value=value)) == expected
+
+
+class CountingBar(progressbar.ProgressBar):
+    """A bar counting how often its `percentage` is computed."""
+
+    percentage_reads = 0
+
+    @property
+    def percentage(self) -> float | None:
+        self.percentage_reads += 1
+        return super().percentage
+
+
+@pytest.fixture
+def counting_bar(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., typing.Any]:
+    return functools.partial(make_bar, bar_class=CountingBar, max_value=10)
+
+
+def test_unread_fields_are_not_computed(
+    counting_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = counting_bar().start()
+    bar.update(5, force=True)
+
+    assert bar.percentage_reads == 0
+    bar.finish()
+
+
+def test_read_fields_are_computed_once(
+    counting_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = counting_bar().start()
+    data = bar.data()
+
+    assert data['percentage'] == 0
+    assert data.get('percentage') == 0
+    assert bar.percentage_reads == 1
+
+
+def test_percentage_widget_reads_percentage(
+    counting_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = counting_bar(widgets=[progressbar.Percentage()]).start()
+    reads = bar.percentage_reads
+    bar.update(5, force=True)
+
+    assert bar.percentage_reads > reads
+    bar.finish()
+
+
+def test_snapshot_behaves_like_the_full_dict(
+    counting_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = counting_bar().start()
+    data = bar.data()
+
+    assert 'days_elapsed' in data
+    assert 'missing' not in data
+    assert data.get('missing', 'default') == 'default'
+    assert set(data) == set(data.copy())
+    assert len(data) == 20
+    assert type(data.copy()) is dict
+    assert data == data.copy()
+    assert '{percentage:.0f}|{value}'.format(**data) == '0|0'
+    bar.finish()
+
+
+def test_redraws_reuse_one_snapshot(
+    counting_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    seen: list[int] = []
+
+    def widget(progress: typing.Any, data: dict[str, typing.Any]) -> str:
+        seen.append(id(data))
+        assert 'leftover' not in data
+        data['leftover'] = True
+        return ''
+
+    bar = counting_bar(widgets=[widget]).start()
+    for i in range(3):
+        bar.update(i, force=True)
+
+    assert len(set(seen)) == 1
+    bar.finish()
+
+
+def test_subclass_data_override_is_used_for_redraws() -> None:
+    class CustomDataBar(progressbar.ProgressBar):
+        def data(self) -> dict[str, typing.Any]:
+            data = super().data()
+            data['custom'] = 'spam'
+            return data
+
+    bar = CustomDataBar(
+        fd=io.StringIO(),
+        max_value=10,
+        widgets=[progressbar.FormatLabel('%(custom)s')],
+    ).start()
+
+    assert 'spam' in bar.fd.getvalue()  # type: ignore[attr-defined]
+    bar.finish()
+
+
+def test_snapshot_pickles_as_a_plain_dict(
+    counting_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = counting_bar().start()
+    data = pickle.loads(pickle.dumps(bar.data()))
+
+    assert type(data) is dict
+    assert data['percentage'] == 0
+    bar.finish()
+
+
+def test_snapshot_mapping_protocol(
+    counting_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = counting_bar().start()
+    first = bar.data()
+    second = bar.data()
+
+    with pytest.raises(KeyError, match='missing'):
+        first['missing']
+
+    assert first == second
+    assert first != {}
+    assert list(first.values()) == list(first.copy().values())
+    assert list(first.items()) == list(first.copy().items())
+    assert repr(first) == repr(first.copy())
+    bar.finish()
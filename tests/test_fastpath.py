@@ -182,15 +182,15 @@ def test_exception_in_body_propagates_and_finishes():
 
 
 def fixed_clock(monkeypatch, dt: float):
-    """Patch the timer used by bar.py to advance by `dt` per read."""
+    """Patch the clock used by bar.py to advance by `dt` seconds per read."""
     bar_module = progressbar.bar
 
     counter = itertools.count()
 
-    def fake_timer() -> float:
-        return next(counter) * dt
+    def fake_clock() -> int:
+        return round(next(counter) * dt * 1e9)
 
-    monkeypatch.setattr(bar_module.timeit, 'default_timer', fake_timer)
+    monkeypatch.setattr(bar_module.time, 'perf_counter_ns', fake_clock)
 
 
 def test_redraw_count_is_rate_limited(monkeypatch):
@@ -210,10 +210,10 @@ def test_gate_state_initialized():
 
 
 def _controlled_clock(monkeypatch) -> list[float]:
-    """Patch bar.py's timer to read one mutable value; return that list."""
+    """Patch bar.py's clock to read one mutable value; return that list."""
     clock = [0.0]
     monkeypatch.setattr(
-        progressbar.bar.timeit, 'default_timer', lambda: clock[0]
+        progressbar.bar.time, 'perf_counter_ns', lambda: round(clock[0] * 1e9)
     )
     return clock
 
@@ -292,13 +292,13 @@ def test_last_drawn_value_pinned_on_skipped_update(monkeypatch):
     # then keep it at 1.0 so subsequent updates are rate-limited (skipped).
     _time: list[float] = [0.0]
 
-    def timer() -> float:
-        return _time[0]
+    def timer() -> int:
+        return round(_time[0] * 1e9)
 
-    monkeypatch.setattr(bar_module.timeit, 'default_timer', timer)
+    monkeypatch.setattr(bar_module.time, 'perf_counter_ns', timer)
 
     bar = progressbar.ProgressBar(max_value=100, fd=RecordingTTY())
-    bar.start()  # _last_update_timer = 0.0
+    bar.start()  # _last_update_ns = 0
 
     # Advance time far past min_poll_interval (0.05 s) => update(3) draws.
     _time[0] = 1.0
@@ -337,15 +337,15 @@ def test_manual_update_skips_clock_when_gated(monkeypatch):
     bar_module = progressbar.bar
 
     reads: dict[str, int] = {'n': 0}
-    real = bar_module.timeit.default_timer
+    real = bar_module.time.perf_counter_ns
 
-    def counting() -> float:
+    def counting() -> int:
         reads['n'] += 1
         return real()
 
     bar = progressbar.ProgressBar(max_value=10**7, fd=RecordingTTY())
     bar.start()
-    monkeypatch.setattr(bar_module.timeit, 'default_timer', counting)
+    monkeypatch.setattr(bar_module.time, 'perf_counter_ns', counting)
     before = reads['n']
     for i in range(1, 1_000_001):
         bar.update(i)
@@ -369,9 +369,9 @@ def _iter_clock(monkeypatch, dt: float) -> dict[str, int]:
 
     state: dict[str, int] = {'i': 0}
     monkeypatch.setattr(
-        bar_module.timeit,
-        'default_timer',
-        lambda: state['i'] * dt,
+        bar_module.time,
+        'perf_counter_ns',
+        lambda: round(state['i'] * dt * 1e9),
     )
     return state
 
@@ -520,6 +520,65 @@ def test_next_direct_exhaustion_calls_finish():
     assert '100%' in fd.repaints()[-1]
 
 
+def _counting_update(monkeypatch, bar) -> list[typing.Any]:
+    """Record the values `bar.update()` is called with."""
+    calls: list[typing.Any] = []
+    update = bar.update
+
+    def counting(value=None, *args, **kwargs):
+        calls.append(value)
+        return update(value, *args, **kwargs)
+
+    monkeypatch.setattr(bar, 'update', counting)
+    return calls
+
+
+def test_next_is_gated_like_iteration(monkeypatch):
+    clock = _controlled_clock(monkeypatch)
+    bar = progressbar.ProgressBar(max_value=10000, fd=RecordingTTY())
+    bar.min_poll_interval = 0.05
+    bar(range(10000))
+    calls = _counting_update(monkeypatch, bar)
+    assert next(bar) == 0  # starts the bar
+    clock[0] = 0.10
+    assert next(bar) == 1  # crosses the initial threshold: calibrates
+    step = bar._gate_step
+    assert step > 1
+    for expected in range(2, 2 + step // 2):
+        assert next(bar) == expected
+
+    # Only the start and the crossing went through update(), the gated calls
+    # still advanced value and previous_value
+    assert calls == [0, 1]
+    assert bar.value == 1 + step // 2
+    assert bar.previous_value == bar.value - 1
+    bar.finish()
+
+
+def test_next_with_render_thread_only_stores(monkeypatch):
+    bar = progressbar.ProgressBar(
+        max_value=5, fd=RecordingTTY(), render_thread=True
+    )
+    bar(range(5))
+    calls = _counting_update(monkeypatch, bar)
+    assert [next(bar) for _ in range(5)] == [0, 1, 2, 3, 4]
+
+    assert calls == [0]
+    assert bar.value == 4
+    bar.finish()
+
+
+def test_next_with_gate_disabled_updates_every_call(monkeypatch):
+    monkeypatch.setenv('PROGRESSBAR_DISABLE_FASTPATH', '1')
+    bar = progressbar.ProgressBar(max_value=3, fd=RecordingTTY())
+    bar(range(3))
+    calls = _counting_update(monkeypatch, bar)
+    assert [next(bar) for _ in range(3)] == [0, 1, 2]
+
+    assert calls == [0, 1, 2]
+    bar.finish()
+
+
 def test_shortcut_has_single_generator_layer():
     import types
 
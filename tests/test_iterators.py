@@ -1,4 +1,11 @@
+from __future__ import annotations
+
+import asyncio
+import collections.abc
+import contextlib
+import io
 import time
+import typing
 
 import pytest
 
@@ -59,3 +66,157 @@ def test_adding_value() -> None:
     p.increment(2)
     with pytest.raises(ValueError):
         p += 5
+
+
+async def _items(
+    count: int, delay: float = 0
+) -> collections.abc.AsyncIterator[int]:
+    for item in range(count):
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+def test_values_match_the_sync_iterator(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=5)
+
+    async def run() -> list[tuple[int, typing.Any]]:
+        return [(item, bar.value) async for item in bar(_items(5))]
+
+    assert asyncio.run(run()) == [(item, item) for item in range(5)]
+    assert bar.finished()
+    assert bar.value == 5
+    assert bar.previous_value == 4
+
+
+def test_aprogressbar_renders_the_bar() -> None:
+    fd = io.StringIO()
+
+    async def run() -> list[int]:
+        stream = progressbar.aprogressbar(_items(3), max_value=3, fd=fd)
+        return [item async for item in stream]
+
+    assert asyncio.run(run()) == [0, 1, 2]
+    assert '100%' in fd.getvalue()
+
+
+def test_unknown_length_and_empty_iterables(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar()
+
+    async def run() -> list[int]:
+        return [item async for item in bar(_items(0))]
+
+    assert asyncio.run(run()) == []
+    assert bar.max_value is progressbar.UnknownLength
+    assert bar.finished()
+
+    unwrapped = make_bar(max_value=1)
+    assert asyncio.run(_collect(unwrapped)) == []
+    assert unwrapped.finished()
+
+
+async def _collect(bar: progressbar.ProgressBar) -> list[typing.Any]:
+    return [item async for item in bar]
+
+
+@pytest.mark.no_freezegun
+def test_loop_redraws_while_awaiting_items(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=3, min_poll_interval=0.01, poll_interval=0.01)
+
+    async def run() -> list[int]:
+        return [bar.updates async for _ in bar(_items(3, delay=0.05))]
+
+    updates = asyncio.run(run())
+    # Timer redraws happen between the items, none in the loop body
+    assert updates[-1] - updates[0] >= 2
+
+
+@pytest.mark.no_freezegun
+def test_items_that_never_suspend_redraw_through_the_gate(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=200_000, min_poll_interval=0.001)
+
+    async def run() -> list[int]:
+        return [
+            bar.updates
+            async for item in bar(_items(200_000))
+            if item % 20_000 == 0
+        ]
+
+    updates = asyncio.run(run())
+    # The loop never yields to the event loop, so the timer can't run:
+    # these redraws come from the gate
+    assert updates[-1] > updates[0]
+    assert bar._gate_step > 1
+
+
+def test_break_finishes_dirty(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=10)
+
+    async def run() -> None:
+        async with contextlib.aclosing(bar(_items(10)).__aiter__()) as stream:
+            async for item in stream:
+                if item == 3:
+                    break
+
+    asyncio.run(run())
+    assert bar.finished()
+    assert bar.value == 3
+
+
+def test_disabled_gate_updates_every_item(
+    make_bar: collections.abc.Callable[..., typing.Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv('PROGRESSBAR_DISABLE_FASTPATH', '1')
+    bar = make_bar(max_value=4)
+    values: list[typing.Any] = []
+    update = bar.update
+
+    def counting_update(value: typing.Any = None, **kwargs: typing.Any):
+        values.append(value)
+        update(value, **kwargs)
+
+    monkeypatch.setattr(bar, 'update', counting_update)
+
+    async def run() -> list[int]:
+        return [item async for item in bar(_items(4))]
+
+    assert asyncio.run(run()) == [0, 1, 2, 3]
+    # start() draws 0, then every item goes through update()
+    assert values[:4] == [0, 1, 2, 3]
+
+
+def test_render_thread_replaces_the_loop_timer(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=4, render_thread=True)
+
+    async def run() -> list[int]:
+        return [item async for item in bar(_items(4))]
+
+    assert asyncio.run(run()) == [0, 1, 2, 3]
+    assert bar.value == 4
+
+
+@pytest.mark.no_freezegun
+def test_idle_ticks_do_not_redraw(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=1000, min_poll_interval=0.01).start()
+
+    async def run() -> list[int]:
+        return [bar.updates async for _ in bar(_items(2, delay=0.05))]
+
+    # `value` only moves when an item arrives, so the ticks while waiting
+    # for one find nothing new to draw (and one item is no visible change)
+    assert asyncio.run(run()) == [1, 1]
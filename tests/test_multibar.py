@@ -1,8 +1,11 @@
+import asyncio
 import contextlib
 import io
+import operator
 import random
 import threading
 import time
+import typing
 
 import pytest
 
@@ -577,3 +580,469 @@ def test_multibar_concurrent_mutation() -> None:
 
     assert not errors
     assert not multibar._thread or not multibar._thread.is_alive()
+
+
+def test_multibar_formats_only_changed_bars(monkeypatch) -> None:
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(),
+        max_value=10,
+        term_width=40,
+        widgets=[progressbar.Counter()],
+    )
+    busy: typing.Any = multibar['busy']
+    idle: typing.Any = multibar['idle']
+    busy.start()
+    idle.start()
+    multibar.render()
+    assert 'busy' in busy.fd.line
+
+    updates = idle.updates
+    for value in range(1, 4):
+        busy.update(value)
+        multibar.render()
+    assert busy.fd.line.rstrip().endswith('3')
+    assert idle.updates == updates
+    assert idle.fd.line in multibar._previous_output
+
+    # Time-sensitive widgets, a resize and a forced render all redraw
+    idle.poll_interval = 0.1
+    idle._last_update_ns = 0
+    multibar.render()
+    assert idle.updates == updates + 1
+
+    monkeypatch.setattr(
+        progressbar.utils, 'get_terminal_size', lambda: (30, 25)
+    )
+    idle._handle_resize()
+    multibar.render()
+    assert idle.updates == updates + 2
+
+    multibar.render(force=True)
+    assert idle.updates == updates + 3
+
+
+def _viewport_multibar(count: int, **kwargs) -> progressbar.MultiBar:
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(),
+        sort_reverse=False,
+        max_value=10,
+        term_width=40,
+        widgets=[progressbar.Counter()],
+        **kwargs,
+    )
+    for i in range(count):
+        multibar[f'bar {i}'].start()
+    return multibar
+
+
+def test_multibar_viewport_summarizes_the_rest() -> None:
+    multibar = _viewport_multibar(6, viewport=3)
+    multibar['bar 4'].update(5)
+    multibar['bar 5'].finish()
+    multibar.render()
+
+    assert len(multibar._previous_output) == 3
+    assert multibar._previous_output[-1] == ('+4 more (1 finished, 38% done)')
+    # Bars outside the viewport are never formatted by the multibar
+    assert multibar['bar 3'].updates == 1
+
+    # Exactly as many bars as rows need no summary
+    multibar.viewport = 6
+    multibar.render()
+    assert multibar._previous_output[-1].startswith('bar 5')
+
+    # Nor do bars that wouldn't be shown anyway
+    multibar.viewport = 5
+    multibar.show_finished = False
+    multibar['bar 4'].finish()
+    multibar.render()
+    assert len(multibar._previous_output) == 4
+
+
+def test_multibar_viewport_fits_the_terminal(monkeypatch) -> None:
+    sizes = iter([(80, 4), (80, 10)])
+    monkeypatch.setattr(
+        progressbar.utils, 'get_terminal_size', lambda: next(sizes)
+    )
+    multibar = _viewport_multibar(20, viewport=True, show_initial=False)
+    unknown = multibar['unknown']
+    unknown.max_value = progressbar.UnknownLength
+    unknown.start()
+    assert multibar['waiting'] is not None
+
+    multibar.render()
+    multibar.render()
+    assert len(multibar._previous_output) == 3
+    assert multibar._previous_output[-1] == '+19 more (0 finished, 0% done)'
+
+    # The height is looked up again once a second
+    multibar._terminal_rows = (0.0, 3)
+    multibar.render()
+    assert len(multibar._previous_output) == 9
+
+
+def test_multibar_bars_wake_the_render_loop() -> None:
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(), max_value=10, variables={'name': ''}
+    )
+    bar = multibar['bar']
+    bar.start()
+    assert bar._wake is multibar._changed
+    assert bar._state.__getstate__()['_wake'] is None
+
+    for change in (
+        lambda: bar.update(5),
+        lambda: bar.update(name='x'),
+        bar.finish,
+        lambda: multibar.__delitem__('bar'),
+    ):
+        multibar._changed.clear()
+        change()
+        assert multibar._changed.is_set()
+
+    assert bar._wake is None
+
+
+def test_multibar_idle_render_loop_backs_off(monkeypatch) -> None:
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(), update_interval=0.001, idle_interval=0.004
+    )
+    changes = [False, False, False, True, False]
+    waits: list[float] = []
+
+    def wait(timeout: float) -> bool:
+        waits.append(timeout)
+        if len(waits) == len(changes):
+            multibar._thread_finished.set()
+        return changes[len(waits) - 1]
+
+    monkeypatch.setattr(multibar._changed, 'wait', wait)
+    multibar.run(join=False)
+
+    assert waits == [0.001, 0.002, 0.004, 0.004, 0.001]
+
+
+def test_multibar_busy_render_loop_keeps_its_frame_rate(monkeypatch) -> None:
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(), update_interval=0.01, max_value=100
+    )
+    bar = multibar['bar']
+    bar.start()
+    sleeps: list[float] = []
+    waits: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) < 4:
+            # Like a gated loop, which moves the value without waking it
+            bar._state.value += 1
+
+    def wait(timeout: float) -> bool:
+        waits.append(timeout)
+        multibar._thread_finished.set()
+        return False
+
+    monkeypatch.setattr(time, 'sleep', sleep)
+    monkeypatch.setattr(multibar._changed, 'wait', wait)
+    multibar.run(join=False)
+
+    # A frame per `update_interval` while the bar moves, then a wait
+    assert len(sleeps) == 4
+    assert all(0 <= seconds <= 0.01 for seconds in sleeps)
+    assert waits == [0.01]
+
+
+def _check_order(multibar: progressbar.MultiBar) -> list[str]:
+    labels = [bar.label for bar in multibar.get_sorted_bars()]
+    # A full, stable sort of the bars in creation order
+    expected = sorted(
+        sorted(multibar.values(), key=operator.attrgetter('index')),
+        key=multibar.sort_keyfunc,
+        reverse=multibar.sort_reverse,
+    )
+    assert labels == [bar.label for bar in expected]
+    return labels
+
+
+@pytest.mark.parametrize('sort_reverse', [False, True])
+@pytest.mark.parametrize(
+    'sort_key',
+    [progressbar.SortKey.VALUE, progressbar.SortKey.PERCENTAGE, 'max_value'],
+)
+def test_multibar_order_follows_key_changes(sort_key, sort_reverse) -> None:
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(),
+        sort_key=sort_key,
+        sort_reverse=sort_reverse,
+        max_value=100,
+    )
+    for i in range(40):
+        multibar[f'bar {i}'].start()
+    _check_order(multibar)
+
+    rng = random.Random(0)
+    for moves in (1, 3, 40):
+        for bar in rng.sample(list(multibar.values()), moves):
+            bar.update(rng.randrange(100))
+        _check_order(multibar)
+
+    # Added, replaced and removed bars
+    multibar['bar 40'] = progressbar.ProgressBar(max_value=100)
+    multibar['bar 0'] = progressbar.ProgressBar(max_value=100)
+    del multibar['bar 1']
+    assert multibar['bar 2'] is not None
+    del multibar['bar 2']
+    _check_order(multibar)
+
+    # As do changes made behind the multibar's back
+    multibar.sort_keyfunc = operator.attrgetter('label')
+    _check_order(multibar)
+    dict.pop(multibar, 'bar 3')
+    _check_order(multibar)
+
+
+def test_multibar_order_shares_an_index() -> None:
+    multibar = progressbar.MultiBar(fd=io.StringIO(), sort_reverse=False)
+    first = multibar['first']
+    second = multibar['second']
+    second.index = first.index
+    multibar.get_sorted_bars()
+
+    del multibar['second']
+    assert multibar.get_sorted_bars() == [first]
+
+
+def test_multibar_stable_layout_keeps_rows() -> None:
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(),
+        sort_key=progressbar.SortKey.VALUE,
+        sort_reverse=False,
+        stable_layout=True,
+        max_value=10,
+    )
+    low = multibar['low']
+    high = multibar['high']
+    high.update(5)
+    assert multibar.get_sorted_bars() == [low, high]
+
+    low.update(9)
+    late = multibar['late']
+    late.update(7)
+    # Placed by the keys the others had when they were placed
+    assert multibar.get_sorted_bars() == [low, high, late]
+
+
+def _group_multibar(**kwargs) -> progressbar.MultiBar:
+    kwargs.setdefault('initial_format', None)
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(), sort_reverse=False, remove_finished=0, **kwargs
+    )
+    multibar.group('job', 'stage 1', 'stage 2')
+    multibar.group('stage 1', 'file a', 'file b')
+    return multibar
+
+
+def _rendered_labels(multibar: progressbar.MultiBar) -> list[str]:
+    multibar.render()
+    return [line.split('|')[0] for line in multibar._previous_output]
+
+
+def test_multibar_group_rolls_up_children() -> None:
+    multibar = _group_multibar(label_format='{label}|')
+    job = multibar['job']
+    file_a = multibar['file a'].start(max_value=10)
+    file_b = multibar['file b'].start(max_value=30)
+    stage_2 = multibar['stage 2']
+    stage_2.min_value = 10
+    stage_2.start(max_value=60)
+    file_a.update(5)
+    file_b.increment(10)
+    stage_2.update(30)
+
+    assert (job.value, job.max_value) == (35, 90)
+    assert (multibar['stage 1'].value, multibar['stage 1'].max_value) == (
+        15,
+        40,
+    )
+    assert _rendered_labels(multibar) == [
+        'job',
+        '  stage 1',
+        '    file a',
+        '    file b',
+        '  stage 2',
+    ]
+
+    multibar.group('stage 1', collapsed=True)
+    assert _rendered_labels(multibar) == ['job', '  stage 1', '  stage 2']
+
+    file_a.finish()
+    file_b.finish()
+    assert multibar['stage 1'].finished()
+    assert not job.finished()
+    stage_2.finish(dirty=True)
+    assert job.finished()
+    assert (job.value, job.max_value) == (60, 90)
+
+
+def test_multibar_group_changes() -> None:
+    multibar = _group_multibar()
+    job = multibar['job']
+    multibar['file a'].start(max_value=10)
+    multibar['file b'].start(max_value=10)
+    multibar['stage 2'].max_value = progressbar.UnknownLength
+    multibar['stage 2'].start()
+    multibar['file a'].finish()
+    multibar['file b'].update(4)
+    assert job.max_value is progressbar.UnknownLength
+
+    # A finished bar still counts once removed, an unfinished one doesn't
+    del multibar['file a']
+    del multibar['stage 2']
+    assert (job.value, job.max_value) == (14, 20)
+    multibar['file b'] = progressbar.ProgressBar(max_value=5)
+    assert (job.value, job.max_value) == (10, 10)
+
+    # Moving a bar takes all of it along
+    multibar['file c'].start(max_value=10)
+    multibar.group('stage 1', 'file c')
+    multibar['file c'].update(3)
+    assert (job.value, job.max_value) == (13, 20)
+    multibar.group('job', 'file c')
+    multibar.group('job', 'file c')
+    assert multibar['stage 1'].value == 10
+    assert (job.value, job.max_value) == (13, 20)
+
+    with pytest.raises(ValueError):
+        multibar.group('stage 1', 'job')
+    with pytest.raises(ValueError):
+        multibar.group('job', 'job')
+
+    # The bars of a removed group are no longer grouped
+    multibar.group('stage 1', 'file d')
+    del multibar['job']
+    multibar['file c'].update(4)
+    assert job.value == 13
+    assert multibar._parents == {multibar['file d']: multibar['stage 1']}
+
+
+def test_multibar_group_waits_for_a_length() -> None:
+    multibar = _group_multibar(initial_format='{label}')
+    job = multibar['job']
+    assert _rendered_labels(multibar)[0] == 'job'
+    assert not job.started()
+
+    multibar['stage 2'].update(0)
+    assert job.started()
+    assert job.max_value is progressbar.UnknownLength
+
+    # A group of empty bars starts to finish
+    multibar.group('empty', 'nothing')
+    multibar['nothing'].start(max_value=0)
+    multibar['nothing'].finish()
+    assert multibar['empty'].finished()
+
+
+def test_multibar_collapsed_group_follows_iteration() -> None:
+    multibar = _group_multibar()
+    multibar.group('stage 1', collapsed=True)
+    stage_1 = multibar['stage 1']
+    file_a = multibar['file a']
+    file_a.max_value = 10_000
+    multibar['file b'].start(max_value=10)
+
+    # The gate grows its step while the collapsed child isn't drawn
+    for _ in file_a(range(10_000)):
+        assert stage_1.value == file_a.value
+    assert file_a._gate_step > 1
+    assert (stage_1.value, stage_1.max_value) == (10_000, 10_010)
+
+    file_b = multibar['file b']
+    file_b._iterable = iter(range(10))
+    next(file_b)
+    file_b._next_update = 10
+    for _ in range(9):
+        next(file_b)
+        assert stage_1.value == 10_000 + file_b.value
+
+    async def items() -> typing.AsyncIterator[int]:
+        for item in range(10):
+            yield item
+
+    async def iterate() -> None:
+        async for _ in multibar['stage 2'](items(), max_value=10):
+            assert multibar['job'].value == 10_010 + multibar['stage 2'].value
+
+    asyncio.run(iterate())
+
+
+def test_multibar_group_indents_bars_drawn_before() -> None:
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(),
+        sort_reverse=False,
+        initial_format=None,
+        label_format='{label}|',
+    )
+    for key in ('job', 'stage', 'file'):
+        multibar[key].start(max_value=10)
+    assert _rendered_labels(multibar) == ['job', 'stage', 'file']
+
+    multibar.group('stage', 'file')
+    assert _rendered_labels(multibar) == ['job', 'stage', '  file']
+
+    # Nesting a group later indents its children as well
+    multibar.group('job', 'stage')
+    assert _rendered_labels(multibar) == ['job', '  stage', '    file']
+
+    del multibar['job']
+    assert _rendered_labels(multibar) == ['stage', '  file']
+
+    # Only a prepended label is indented
+    multibar = progressbar.MultiBar(
+        fd=io.StringIO(),
+        initial_format=None,
+        prepend_label=False,
+        append_label=True,
+    )
+    file = multibar['file'].start(max_value=10)
+    multibar.render()
+    widgets = list(file.widgets)
+    multibar.group('job', 'file')
+    assert file.widgets == widgets
+
+
+def test_multibar_finished_group_rejects_unfinished_children() -> None:
+    multibar = _group_multibar()
+    job = multibar['job']
+    for key in ('file a', 'file b', 'stage 2'):
+        multibar[key].start(max_value=10).finish()
+    assert job.finished()
+
+    with pytest.raises(ValueError):
+        multibar.group('job', 'file c')
+    assert multibar['file c'] not in multibar._parents
+
+    # A finished bar can still join
+    multibar['file d'].start(max_value=5).finish()
+    multibar.group('job', 'file d')
+    assert job.finished()
+    assert (job.value, job.max_value) == (35, 35)
+
+
+def test_multibar_group_threads() -> None:
+    multibar = _group_multibar()
+    files = [multibar['file a'], multibar['file b']]
+    for file in files:
+        file.start(max_value=1000)
+
+    def work(file: progressbar.ProgressBar) -> None:
+        for _ in range(1000):
+            file.increment()
+
+    threads = [threading.Thread(target=work, args=(file,)) for file in files]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert multibar['stage 1'].value == 2000
+    assert multibar['job'].value == 2000
@@ -44,7 +44,7 @@ def _bar(**kwargs: typing.Any) -> progressbar.ProgressBar:
     # Move the rate limiters out of the way (the constructor substitutes a
     # default for poll_interval=None) so the width-threshold branch decides.
     bar.poll_interval = None
-    bar._last_update_timer = -1e9
+    bar._last_update_ns -= 10**18
     return bar
 
 
@@ -142,7 +142,7 @@ class TestCurrentTaskBar:
 
     def test_with_task_bar_binds_and_restores(self) -> None:
         marker: progressbar.ProgressBar = progressbar.ProgressBar(max_value=1)
-        seen: list[progressbar.ProgressBar | None] = []
+        seen: list[_common.TaskBar | None] = []
 
         def _inner() -> str:
             seen.append(_common.current_task_bar())
@@ -0,0 +1,160 @@
+"""Shared-memory task progress for process-pool workers."""
+
+from __future__ import annotations
+
+import io
+import time
+import typing
+
+import pytest
+
+import progressbar
+from progressbar._parallel import (
+    _common,
+    _shared,
+    _sync,
+)
+
+
+def _report(steps: int) -> float:
+    task_bar = _common.current_task_bar()
+    assert isinstance(task_bar, _shared.SharedTaskBar)
+    for step in range(1, steps + 1):
+        task_bar.update(step)
+        time.sleep(0.02)
+    return task_bar.value
+
+
+def _has_no_task_bar(_: int) -> bool:
+    return _common.current_task_bar() is None
+
+
+@pytest.mark.no_freezegun
+def test_process_workers_report_task_progress(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[typing.Any] = []
+    copy_progress = _shared.copy_progress
+
+    def spy(
+        slots: _shared.SharedSlots,
+        task_slots: dict[int, tuple[int, progressbar.ProgressBar]],
+    ) -> None:
+        copy_progress(slots, task_slots)
+        seen.extend(task_bar.value for _, task_bar in task_slots.values())
+
+    monkeypatch.setattr(_shared, 'copy_progress', spy)
+    results = _sync.map(
+        _report,
+        [5, 5, 5],
+        pool='process',
+        workers=2,
+        bar='multi',
+        poll_interval=0.01,
+        fd=io.StringIO(),
+    )
+
+    assert results == [5.0, 5.0, 5.0]
+    assert any(value > 0 for value in seen)
+
+
+def test_plain_mode_creates_no_shared_block() -> None:
+    results = _sync.map(_has_no_task_bar, range(2), pool='process', bar=False)
+    assert results == [True, True]
+
+
+def test_task_bar_writes_its_slot() -> None:
+    slots = _shared.SharedSlots(2)
+    first, second = slots.acquire(), slots.acquire()
+
+    def work() -> float:
+        task_bar = _common.current_task_bar()
+        assert isinstance(task_bar, _shared.SharedTaskBar)
+        task_bar.update(2)
+        task_bar.update()
+        task_bar.increment()
+        task_bar += 1
+        task_bar.counter().add(0.5)
+        return task_bar.value
+
+    try:
+        assert _shared.run_with_slot(slots.name, second, work) == 4.5
+        assert _common.current_task_bar() is None
+        assert slots.read(first) == 0
+        assert slots.read(second) == 4.5
+
+        slots.values[second] = 7
+        assert slots.read(second) == 7
+        assert isinstance(slots.read(second), int)
+    finally:
+        slots.close()
+
+
+def test_progress_is_copied_onto_changed_bars() -> None:
+    slots = _shared.SharedSlots(2)
+    bars = [
+        progressbar.ProgressBar(
+            fd=io.StringIO(), max_value=progressbar.UnknownLength
+        ).start()
+        for _ in range(2)
+    ]
+    task_slots = {
+        seq: (slots.acquire(), task_bar) for seq, task_bar in enumerate(bars)
+    }
+    slots.values[task_slots[0][0]] = 3
+
+    try:
+        _shared.copy_progress(slots, task_slots)
+        assert [task_bar.value for task_bar in bars] == [3, 0]
+
+        slots.release(task_slots.pop(0)[0])
+        assert slots.acquire() == 0
+        assert slots.read(0) == 0
+    finally:
+        slots.close()
+        for task_bar in bars:
+            task_bar.finish()
+
+
+def _overshoot(value: float) -> float:
+    task_bar = _common.current_task_bar()
+    assert task_bar is not None
+    task_bar.update(value)
+    time.sleep(0.05)
+    return value
+
+
+def test_out_of_range_progress_is_clamped() -> None:
+    slots = _shared.SharedSlots(2)
+    bars = [
+        progressbar.ProgressBar(fd=io.StringIO(), max_value=5).start()
+        for _ in range(2)
+    ]
+    task_slots = {
+        seq: (slots.acquire(), task_bar) for seq, task_bar in enumerate(bars)
+    }
+    slots.values[task_slots[0][0]] = 8
+    slots.values[task_slots[1][0]] = -1
+
+    try:
+        _shared.copy_progress(slots, task_slots)
+        assert [task_bar.value for task_bar in bars] == [5, 0]
+    finally:
+        slots.close()
+        for task_bar in bars:
+            task_bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_overshooting_workers_do_not_abort_the_run() -> None:
+    results = _sync.map(
+        _overshoot,
+        [1e9, -1.0],
+        pool='process',
+        workers=2,
+        bar='multi',
+        poll_interval=0.01,
+        fd=io.StringIO(),
+    )
+
+    assert results == [1e9, -1.0]
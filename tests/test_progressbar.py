@@ -1,10 +1,19 @@
+from __future__ import annotations
+
+import collections
+import collections.abc
+import concurrent.futures
 import contextlib
+import functools
 import gc
 import io
 import os
+import pickle
 import signal
 import sys
+import threading
 import time
+import typing
 from datetime import timedelta
 
 import original_examples  # type: ignore
@@ -196,38 +205,33 @@ def test_elapsed_data_spans_days() -> None:
 @pytest.mark.no_freezegun
 def test_data_is_a_pure_snapshot(monkeypatch) -> None:
     # `data()` must be a pure read of the current state: calling it must not
-    # mutate the timing fields (`_last_update_time` / `_last_update_timer`).
-    # The redraw path refreshes those via `_mark_update()`, not the getter.
+    # mutate the timing field (`_last_update_ns`). The redraw path refreshes
+    # it via `_mark_update()`, not the getter.
     #
     # A strictly-increasing clock makes any hidden mutation observable: on the
     # old code each data() call re-stamped the fields with a fresh (larger)
     # value, so two calls would disagree.
-    import timeit as _timeit
-
     import progressbar.bar as bar_module
 
     ticks = iter(range(1_700_000_000, 1_700_001_000))
 
-    def fake_clock() -> float:
-        return float(next(ticks))
+    def fake_clock() -> int:
+        return next(ticks) * 10**9
 
     bar = progressbar.ProgressBar(
         max_value=10, fd=io.StringIO(), term_width=60
     )
     bar.start()
 
-    monkeypatch.setattr(bar_module.time, 'time', fake_clock)
-    monkeypatch.setattr(_timeit, 'default_timer', fake_clock)
+    monkeypatch.setattr(bar_module.time, 'perf_counter_ns', fake_clock)
 
-    time_before = bar._last_update_time
-    timer_before = bar._last_update_timer
+    timer_before = bar._last_update_ns
 
     first = bar.data()
     second = bar.data()
 
-    # Neither the wall-clock nor the perf-counter timing state may change.
-    assert bar._last_update_time == time_before
-    assert bar._last_update_timer == timer_before
+    # The timing state may not change.
+    assert bar._last_update_ns == timer_before
     # And the two snapshots agree on the timing-derived fields.
     assert first['last_update_time'] == second['last_update_time']
     assert first['total_seconds_elapsed'] == second['total_seconds_elapsed']
@@ -388,3 +392,483 @@ def test_sigwinch_restored_with_overlapping_bars() -> None:
             bar_module._ResizeRegistry.bars.add(restored_bar)
         bar_module._ResizeRegistry.previous_handler = saved_prev
         signal.signal(signal.SIGWINCH, saved_handler)
+
+
+#: CPython stops sharing the instance dict keys of a class at 30 keys
+SHARED_KEYS_LIMIT = 30
+
+
+def test_started_bar_stays_below_the_shared_keys_limit() -> None:
+    bar = progressbar.ProgressBar(fd=io.StringIO(), max_value=10).start()
+    bar.update(5)
+    bar.finish()
+
+    assert len(vars(bar)) < SHARED_KEYS_LIMIT
+
+
+def test_multibar_child_stays_below_the_shared_keys_limit() -> None:
+    multibar = progressbar.MultiBar(fd=io.StringIO())
+    bar = multibar['child']
+    bar.start()
+    bar.update(5)
+
+    assert len(vars(bar)) < SHARED_KEYS_LIMIT
+
+
+def test_attributes_are_stored_in_the_record() -> None:
+    bar = progressbar.ProgressBar(fd=io.StringIO(), max_value=10)
+    bar.value = 3
+    bar.paused = True
+
+    assert isinstance(bar._state, bar_module._BarState)
+    assert bar._state.value == 3
+    assert bar._state.paused is True
+    assert 'value' not in vars(bar)
+    assert bar.max_value == bar._state.max_value == 10
+
+
+def test_record_pickles_without_runtime_helpers() -> None:
+    bar = progressbar.ProgressBar(
+        fd=io.StringIO(), max_value=10, widgets=[progressbar.Counter()]
+    ).start()
+    bar.update(5, force=True)
+    bar.data()
+    assert bar._data_snapshot is not None
+
+    state = pickle.loads(pickle.dumps(bar._state))
+
+    assert state.value == 5
+    assert state.max_value == 10
+    assert state._data_snapshot is None
+    assert state._renderer is None
+    bar.finish()
+
+
+def test_init_resets_the_record_in_place() -> None:
+    bar = progressbar.ProgressBar(fd=io.StringIO(), max_value=10).start()
+    bar.update(5)
+    state = bar._state
+    bar.finish()
+    bar.start(init=True)
+
+    assert bar._state is state
+    assert state.updates == 1
+    assert state._finished is False
+    bar.finish()
+
+
+class SlowStream(io.StringIO):
+    """A stream whose writes and flushes block, like a congested pipe.
+
+    It also records the names of the threads that wrote to it.
+    """
+
+    def __init__(
+        self, write_delay: float = 0.0, flush_delay: float = 0.0
+    ) -> None:
+        super().__init__()
+        self.write_delay = write_delay
+        self.flush_delay = flush_delay
+        self.writers: set[str] = set()
+
+    def write(self, text: str) -> int:
+        self.writers.add(threading.current_thread().name)
+        if self.write_delay:
+            time.sleep(self.write_delay)
+        return super().write(text)
+
+    def flush(self) -> None:
+        if self.flush_delay:
+            time.sleep(self.flush_delay)
+
+
+@pytest.fixture
+def share_bar(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., typing.Any]:
+    """Return a function creating a bar that redraws as often as it can."""
+
+    def share_bar(fd: io.StringIO, **kwargs: typing.Any) -> typing.Any:
+        kwargs.setdefault('max_value', 1000)
+        bar = make_bar(fd, term_width=40, **kwargs)
+        # Below the usual floor, so a slow `fd` is what limits the redraws
+        bar.min_poll_interval = 0.001
+        return bar
+
+    return share_bar
+
+
+@pytest.mark.no_freezegun
+def test_slow_fd_stretches_the_redraw_interval(
+    share_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = share_bar(
+        SlowStream(flush_delay=0.01),
+        max_value=progressbar.UnknownLength,
+        max_render_share=0.5,
+    ).start()
+
+    # The 0% draw is measured: >= 10 ms at half the time is >= 20 ms
+    assert bar._draw_floor >= 0.02
+    assert bar._redraw_interval() == bar._draw_floor
+
+    draws = bar.updates
+    deadline = time.perf_counter() + 0.1
+    value = 0
+    while time.perf_counter() < deadline:
+        value += 1
+        bar.update(value)
+
+    # Without the floor every 1 ms window would try a 10 ms redraw
+    assert bar.updates - draws <= 6
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_fast_fd_keeps_min_poll_interval(
+    share_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = share_bar(io.StringIO()).start()
+
+    assert bar._draw_floor < bar._MINIMUM_UPDATE_INTERVAL
+    bar.min_poll_interval = bar._MINIMUM_UPDATE_INTERVAL
+    assert bar._redraw_interval() == bar.min_poll_interval
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_floor_decays_once_the_sink_recovers(
+    share_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = SlowStream(flush_delay=0.01)
+    bar = share_bar(fd, max_render_share=0.5).start()
+    slow = bar._draw_floor
+
+    fd.flush_delay = 0
+    bar.updates = 8
+    bar.update(1, force=True)
+
+    assert slow / 2 <= bar._draw_floor < slow
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_only_every_eighth_redraw_is_measured(
+    share_bar: collections.abc.Callable[..., typing.Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bar = share_bar(io.StringIO()).start()
+    measured: list[float] = []
+    monkeypatch.setattr(bar, '_measure_draw', measured.append)
+
+    for value in range(1, 17):
+        bar.update(value, force=True)
+
+    assert measured == [0.1, 0.1]
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_disabled_share_never_measures(
+    share_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = share_bar(
+        SlowStream(flush_delay=0.01), max_render_share=None
+    ).start()
+
+    assert bar._draw_floor == 0.0
+    assert bar._redraw_interval() == bar.min_poll_interval
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_render_thread_follows_the_floor(
+    share_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = SlowStream(flush_delay=0.02)
+    bar = share_bar(fd, render_thread=True, max_render_share=0.5).start()
+    draws = bar.updates
+
+    for value in range(1, 500):
+        bar.update(value)
+        time.sleep(0.0002)
+    time.sleep(0.05)
+
+    # ~0.15 s at a >= 40 ms interval instead of 1 ms
+    assert bar.updates - draws <= 5
+    bar.finish()
+
+
+@pytest.fixture
+def thread_bar(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., typing.Any]:
+    return functools.partial(
+        make_bar,
+        widgets=None,
+        max_value=100,
+        term_width=40,
+        render_thread=True,
+        min_poll_interval=0.01,
+    )
+
+
+@pytest.mark.no_freezegun
+def test_update_does_not_write_on_the_callers_thread(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = SlowStream(write_delay=0.05)
+    bar = thread_bar(fd).start()
+    fd.writers.clear()
+
+    started = time.perf_counter()
+    for i in range(1, 51):
+        bar.update(i)
+    elapsed = time.perf_counter() - started
+
+    # 50 synchronous writes would take at least 2.5 seconds
+    assert elapsed < 0.5
+    deadline = time.monotonic() + 5
+    while not fd.writers and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fd.writers == {f'progressbar-render-{bar.index}'}
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_thread_redraws_the_latest_value(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = io.StringIO()
+    bar = thread_bar(fd).start()
+    bar.update(42)
+
+    deadline = time.monotonic() + 5
+    while bar._last_drawn_value != 42 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert bar._last_drawn_value == 42
+    assert ' 42%' in fd.getvalue()
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_iteration_only_stores_the_value(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = io.StringIO()
+    bar = thread_bar(fd)
+    updates: list[object] = []
+    original_update = bar.update
+
+    def counting_update(*args: object, **kwargs: object) -> None:
+        updates.append(args)
+        original_update(*args, **kwargs)  # type: ignore[arg-type]
+
+    bar.update = counting_update  # type: ignore[method-assign]
+    for _ in bar(range(100)):
+        pass
+
+    # Only the forced start and finish draws go through update()
+    assert len(updates) == 2
+    assert bar.value == 100
+    assert '100%' in fd.getvalue()
+
+
+@pytest.mark.no_freezegun
+def test_variable_change_triggers_a_redraw(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = io.StringIO()
+    bar = thread_bar(
+        fd,
+        widgets=[progressbar.Variable('name')],
+    ).start()
+    bar.update(name='spam')
+
+    deadline = time.monotonic() + 5
+    while 'spam' not in fd.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert 'spam' in fd.getvalue()
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_poll_interval_redraws_without_value_change(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = io.StringIO()
+    bar = thread_bar(fd, poll_interval=0.02).start()
+    updates = bar.updates
+
+    deadline = time.monotonic() + 5
+    while bar.updates < updates + 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert bar.updates >= updates + 2
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_unchanged_value_is_not_redrawn(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = thread_bar(io.StringIO()).start()
+    bar.poll_interval = None
+    bar.update(10, force=True)
+
+    assert not bar._render_due()
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_paused_bar_is_not_redrawn(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = io.StringIO()
+    bar = thread_bar(fd).start()
+    bar.paused = True
+    updates = bar.updates
+    bar.update(50)
+
+    time.sleep(0.1)
+    assert bar.updates == updates
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_forced_update_draws_immediately(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    fd = io.StringIO()
+    bar = thread_bar(fd).start()
+    bar.update(30, force=True)
+
+    assert bar._last_drawn_value == 30
+    assert ' 30%' in fd.getvalue()
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_finish_stops_the_thread(
+    thread_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = thread_bar(io.StringIO()).start()
+    renderer = bar._renderer
+    assert renderer is not None
+
+    bar.finish()
+    assert bar._renderer is None
+    assert not renderer._thread.is_alive()
+
+
+@pytest.mark.no_freezegun
+def test_render_thread_is_off_by_default() -> None:
+    bar = progressbar.ProgressBar(fd=io.StringIO(), max_value=10).start()
+    assert bar._renderer is None
+    bar.finish()
+
+
+@pytest.mark.no_freezegun
+def test_threads_count_every_item(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=40_000, min_poll_interval=0.001)
+    counter = bar.counter()
+
+    def work(items: int) -> None:
+        for _ in range(items):
+            counter.add()
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        list(executor.map(work, [5_000] * 8))
+
+    assert counter.value == 40_000
+    assert len(counter._shards) <= 8
+    bar.finish()
+    assert bar.value == 40_000
+
+
+def test_bar_catches_up_once_per_interval(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=100)
+    counter = bar.counter()
+    counter += 5
+    counter += 5
+
+    # The first add folds right away, the next waits for the interval
+    assert bar.value == 5
+    bar.finish(dirty=True)
+    assert bar.value == 10
+
+
+def test_fold_in_progress_is_not_repeated(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=100)
+    counter = bar.counter()
+    with counter._fold_lock:
+        counter.add(3)
+
+    assert bar.value == 0
+    counter.fold()
+    assert bar.value == 3
+    bar.finish()
+
+
+def test_counters_of_a_bar_fold_one_at_a_time(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=100)
+    first, second = bar.counter(), bar.counter()
+    assert first._fold_lock is second._fold_lock
+    assert make_bar().counter()._fold_lock is not first._fold_lock
+
+    with first._fold_lock:
+        second.add(3)
+    assert bar.value == 0
+    second.fold()
+    assert bar.value == 3
+    bar.finish()
+
+
+def test_counters_add_up_with_direct_updates(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=100).start()
+    first, second = bar.counter(), bar.counter()
+    bar.update(10)
+    first.add(20)
+    second.add(30)
+
+    assert bar.value == 60
+    bar.finish(dirty=True)
+    assert bar.value == 60
+
+
+def test_counter_with_render_thread(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=10, render_thread=True).start()
+    counter = bar.counter()
+    threads = [
+        threading.Thread(target=counter.add, args=(2,)) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    bar.finish(dirty=True)
+    assert bar.value == 10
+
+
+def test_counters_are_not_pickled(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=10)
+    bar.counter().add()
+
+    state = pickle.loads(pickle.dumps(bar._state))
+    assert state._counters == []
+    assert isinstance(bar._counters[0], bar_module.ShardedCounter)
+    bar.finish()
@@ -1,10 +1,12 @@
 import time
 from datetime import datetime, timedelta
 
+import pytest
 from python_utils.containers import SliceableDeque
 
 import progressbar
 from progressbar import widgets
+from progressbar.algorithms import SampleRing
 
 
 def test_numeric_samples() -> None:
@@ -127,3 +129,90 @@ def test_timedelta_samples_evicted_when_value_stalls() -> None:
 
     sample_times = samples_widget.get_sample_times(bar, None)
     assert sample_times[-1] - sample_times[0] <= timedelta(seconds=3)
+
+
+def test_long_window_keeps_only_the_window() -> None:
+    samples_widget = widgets.SamplesMixin(samples=timedelta(seconds=1))
+    bar = progressbar.ProgressBar(widgets=[samples_widget])
+    samples_widget.INTERVAL = timedelta(0)
+    start = datetime(2000, 1, 1)
+
+    for i in range(5000):
+        bar.value = i
+        bar.last_update_time = start + timedelta(milliseconds=i)
+        samples_widget(bar, {})
+
+    # The window plus the newest sample before it
+    ring = samples_widget.get_samples(bar, {})
+    assert len(ring) == 1002
+    assert samples_widget(bar, {}, True) == (
+        timedelta(seconds=1.001),
+        1001,
+    )
+    assert samples_widget.get_sample_times(bar, {})[0] == start + timedelta(
+        seconds=3.998
+    )
+
+
+def test_bar_samples_are_read_from_its_clock(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    samples_widget = widgets.SamplesMixin(samples=3)
+    bar = progressbar.ProgressBar(widgets=[samples_widget])
+    samples_widget.INTERVAL = timedelta(0)
+
+    def no_datetime(ns: int) -> datetime:
+        raise AssertionError('built a datetime')
+
+    monkeypatch.setattr(bar, '_ns_to_datetime', no_datetime)
+    for i in range(1, 5):
+        bar.value = i
+        bar._last_update_ns = i * 1_500_000_000
+        # As `AdaptiveETA` and `AdaptiveTransferSpeed` call it
+        delta = samples_widget(bar, {}, True)
+    monkeypatch.undo()
+
+    assert delta == (timedelta(seconds=3), 2)
+    assert samples_widget.get_sample_times(bar, {})[-1] == (
+        bar._ns_to_datetime(6_000_000_000)
+    )
+
+
+def test_sample_ring() -> None:
+    ring = SampleRing()
+    for second in range(20):
+        ring.append(second, str(second))
+
+    assert len(ring) == 20
+    assert ring.times() == list(range(20))
+    assert ring.value(-1) == '19'
+
+    ring.trim(15.5)
+    assert ring.times() == [15, 16, 17, 18, 19]
+    ring.trim(100)
+    assert ring.values() == ['18', '19']
+    ring.trim(0)
+    assert len(ring) == 2
+
+    with pytest.raises(IndexError):
+        ring.time(2)
+    with pytest.raises(IndexError):
+        SampleRing(capacity=3).value(-1)
+
+
+def test_sample_ring_wraps_around() -> None:
+    ring = SampleRing(capacity=3)
+    for second in range(7):
+        ring.append(second, second)
+
+    assert ring.times() == [4, 5, 6]
+    assert ring.values() == [4, 5, 6]
+
+    ring = SampleRing()
+    for second in range(12):
+        ring.append(second, second)
+        ring.trim(second - 2)
+
+    # The ring moved around its 8 slots without growing
+    assert ring.values() == [8, 9, 10, 11]
+    assert len(ring._times) == 8
@@ -1,14 +1,21 @@
+from __future__ import annotations
+
 import io
 import logging
 import os
+import select
 import subprocess
 import sys
 import textwrap
+import threading
+import time
+import typing
 
 import pytest
 
 import progressbar
 from progressbar import terminal
+from progressbar.terminal import stream
 
 
 def reset_wrapped_streams() -> None:
@@ -556,3 +563,340 @@ def test_wrap_logging_deduplicates_shared_handler(monkeypatch) -> None:
         progressbar.streams.unwrap(stderr=True)
         root.removeHandler(handler)
         named.handlers = []
+
+
+@pytest.mark.no_freezegun
+def test_writes_keep_their_order() -> None:
+    output = io.StringIO()
+    mailbox = stream.FrameMailboxStream(output)
+    mailbox.write('a')
+    mailbox.writelines(['b', 'c'])
+    mailbox.flush()
+    mailbox.stop()
+
+    assert output.getvalue() == 'abc'
+
+
+@pytest.mark.no_freezegun
+def test_idle_writer_waits_for_more() -> None:
+    output = io.StringIO()
+    mailbox = stream.FrameMailboxStream(output)
+    mailbox.write('a')
+    deadline = time.perf_counter() + 5
+    while output.getvalue() != 'a' and time.perf_counter() < deadline:
+        time.sleep(0.001)
+
+    # By now the thread is idle, waiting for the next write
+    time.sleep(0.01)
+    mailbox.write('b')
+    mailbox.stop()
+
+    assert output.getvalue() == 'ab'
+
+
+@pytest.mark.no_freezegun
+def test_writes_to_other_streams_keep_their_order() -> None:
+    output = io.StringIO()
+    other = io.StringIO()
+    log: list[str] = []
+    for name, target in (('output', output), ('other', other)):
+
+        def flush(name: str = name) -> None:
+            log.append(f'flush {name}')
+
+        target.flush = flush  # type: ignore[method-assign]
+
+    mailbox = stream.FrameMailboxStream(output)
+    mailbox.write('a')
+    mailbox.write_to(other, 'b')
+    mailbox.write_frame('\rc')
+    mailbox.stop()
+
+    assert output.getvalue() == 'a\rc'
+    assert other.getvalue() == 'b'
+    # Each stream is flushed before the next one is written to
+    assert log == ['flush output', 'flush other', 'flush output']
+
+
+class BlockedStream(io.StringIO):
+    """A stream whose writes wait for `release`, like a stalled pipe."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.writing = threading.Event()
+        self.flushes = 0
+
+    def write(self, text: str) -> int:
+        self.writing.set()
+        self.release.wait()
+        return super().write(text)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+@pytest.mark.no_freezegun
+def test_pending_frames_are_replaced() -> None:
+    output = BlockedStream()
+    mailbox = stream.FrameMailboxStream(output)
+    mailbox.write('first\n')
+    assert output.writing.wait(5)
+
+    # The thread is stuck writing 'first', so these all wait their turn
+    mailbox.write_frame('\r1')
+    mailbox.write_frame('\r2')
+    mailbox.write('text\n')
+    mailbox.write_frame('\r3')
+    mailbox.write_frame('\r4')
+    output.release.set()
+    mailbox.stop()
+
+    assert output.getvalue() == 'first\n\r2text\n\r4'
+    assert mailbox.dropped == 2
+    assert output.flushes >= 1
+
+
+@pytest.mark.no_freezegun
+def test_stop_reports_write_errors() -> None:
+    output = io.StringIO()
+    output.close()
+    mailbox = stream.FrameMailboxStream(output)
+    mailbox.write('lost')
+
+    with pytest.raises(ValueError):
+        mailbox.stop()
+
+    # The error is reported once, and the mailbox can be used again
+    mailbox.stop()
+
+
+@pytest.mark.no_freezegun
+def test_stopped_mailbox_restarts_on_write() -> None:
+    output = io.StringIO()
+    mailbox = stream.FrameMailboxStream(output)
+    mailbox.stop()
+    mailbox.write('a')
+    mailbox.stop()
+    mailbox.write_frame('\rb')
+    mailbox.stop()
+
+    assert output.getvalue() == 'a\rb'
+
+
+@pytest.mark.no_freezegun
+def test_slow_reader_does_not_block_the_loop() -> None:
+    output = BlockedStream()
+    bar = progressbar.ProgressBar(
+        fd=output,
+        max_value=100,
+        line_breaks=False,
+        enable_colors=False,
+        term_width=40,
+        write_thread=True,
+        widgets=[progressbar.Counter()],
+    ).start()
+    assert output.writing.wait(5)
+
+    started = time.perf_counter()
+    for value in range(1, 101):
+        bar.update(value, force=True)
+    assert time.perf_counter() - started < 1
+
+    output.release.set()
+    bar.finish()
+
+    assert bar._writer is not None
+    assert bar._writer.dropped >= 98
+    assert output.getvalue().endswith('\r100' + ' ' * 37 + '\n')
+
+
+@pytest.mark.no_freezegun
+def test_redirected_prints_queue_behind_the_bar(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    output = BlockedStream()
+    bar = progressbar.ProgressBar(
+        fd=output,
+        max_value=10,
+        line_breaks=False,
+        enable_colors=False,
+        term_width=20,
+        write_thread=True,
+        redirect_stdout=True,
+        widgets=[progressbar.Counter()],
+    ).start()
+    assert output.writing.wait(5)
+    stdout = progressbar.utils.streams.stdout
+    assert isinstance(stdout, progressbar.utils.WrappingIO)
+    monkeypatch.setattr(stdout, 'target', output)
+
+    # The thread is stuck on the first frame, the print doesn't wait for it
+    stdout.write('printed\n')
+    bar.update(5)
+    output.release.set()
+    bar.finish()
+
+    # The pending 5 was replaced by the final frame
+    blank = '\r' + ' ' * 20 + '\r'
+    assert output.getvalue().startswith('\r0')
+    assert blank + 'printed\n\r10' in output.getvalue()
+
+
+@pytest.mark.no_freezegun
+def test_line_offset_frames_are_replaced() -> None:
+    output = BlockedStream()
+    bar = progressbar.ProgressBar(
+        fd=output,
+        max_value=100,
+        line_breaks=False,
+        enable_colors=False,
+        term_width=40,
+        write_thread=True,
+        line_offset=1,
+        widgets=[progressbar.Counter()],
+    ).start()
+    assert output.writing.wait(5)
+
+    for value in range(1, 101):
+        bar.update(value, force=True)
+    output.release.set()
+    bar.finish()
+
+    assert bar.fd is bar._writer
+    assert bar._writer.dropped >= 98
+    up = stream.LineOffsetStreamWrapper.UP
+    assert output.getvalue().count(up) <= 4
+    assert up + '\r\r100' in output.getvalue()
+
+
+@pytest.fixture
+def tty() -> typing.Iterator[tuple[io.TextIOWrapper, int]]:
+    import pty
+
+    master, slave = pty.openpty()
+    file = os.fdopen(slave, 'w', encoding='utf-8')
+    try:
+        yield typing.cast(io.TextIOWrapper, file), master
+    finally:
+        file.close()
+        os.close(master)
+
+
+def _read(master: int) -> str:
+    return os.read(master, 65536).decode()
+
+
+def _read_until(master: int, suffix: str, timeout: float = 5.0) -> str:
+    # A pty may hand a frame over in several reads
+    output = ''
+    deadline = time.monotonic() + timeout
+    while not output.endswith(suffix):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([master], [], [], remaining)[0]:
+            break
+        output += _read(master)
+    return output
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='needs a POSIX pty')
+def test_only_terminals_get_a_writer(
+    tty: tuple[io.TextIOWrapper, int],
+) -> None:
+    file, _ = tty
+    writer = stream.RawFdWriter.for_stream(file)
+
+    assert writer is not None
+    assert writer.fileno == file.fileno()
+    assert stream.RawFdWriter.for_stream(io.StringIO()) is None
+
+    read_end, write_end = os.pipe()
+    with os.fdopen(write_end, 'w') as pipe:
+        assert stream.RawFdWriter.for_stream(pipe) is None
+    os.close(read_end)
+
+    closed = os.fdopen(os.dup(file.fileno()), 'w')
+    closed.close()
+    assert stream.RawFdWriter.for_stream(closed) is None
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='needs a POSIX pty')
+def test_buffered_text_is_written_first(
+    tty: tuple[io.TextIOWrapper, int],
+) -> None:
+    file, master = tty
+    writer = stream.RawFdWriter.for_stream(file)
+    assert writer is not None
+
+    file.write('before ')
+    writer.write('frame ✓')
+
+    assert _read(master) == 'before frame ✓'
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='needs a POSIX pty')
+def test_bar_writes_through_the_descriptor(
+    tty: tuple[io.TextIOWrapper, int],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    file, master = tty
+    bar = progressbar.ProgressBar(
+        fd=file,
+        max_value=10,
+        term_width=20,
+        widgets=[progressbar.Counter()],
+    )
+    assert bar._raw_writer is not None
+    writes: list[str] = []
+    flushes: list[None] = []
+    flush = file.flush
+    monkeypatch.setattr(file, 'write', writes.append)
+
+    def counting_flush() -> None:
+        flushes.append(None)
+        flush()
+
+    monkeypatch.setattr(file, 'flush', counting_flush)
+
+    bar.start()
+    flushes.clear()
+    bar.update(5, force=True)
+
+    assert writes == []
+    # Once by `RawFdWriter`, not again after the frame
+    assert len(flushes) == 1
+    frame = '\r5' + ' ' * 19
+    assert _read_until(master, frame).endswith(frame)
+    monkeypatch.undo()
+    bar.finish()
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='needs a POSIX pty')
+def test_replaced_fd_is_written_normally(
+    tty: tuple[io.TextIOWrapper, int],
+) -> None:
+    file, _ = tty
+    bar = progressbar.ProgressBar(
+        fd=file, max_value=10, term_width=20, widgets=[progressbar.Counter()]
+    )
+    output = io.StringIO()
+    bar.fd = output
+    bar.start()
+    bar.finish()
+
+    assert output.getvalue().startswith('\r0')
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='needs a POSIX pty')
+def test_multibar_flush_uses_the_descriptor(
+    tty: tuple[io.TextIOWrapper, int],
+) -> None:
+    file, master = tty
+    multibar = progressbar.MultiBar(fd=file)
+    multibar.print('hello', flush=True)
+    assert 'hello' in _read(master)
+
+    output = io.StringIO()
+    multibar.fd = output
+    multibar.print('again', flush=True)
+    assert 'again' in output.getvalue()
@@ -1,11 +1,19 @@
+from __future__ import annotations
+
+import collections.abc
+import functools
 import io
+import re
 import signal
 import sys
 import time
+import typing
 from datetime import timedelta
 
+import pytest
+
 import progressbar
-from progressbar import terminal
+from progressbar import terminal, utils
 
 
 def test_left_justify() -> None:
@@ -237,3 +245,190 @@ def test_redirect_blank_line_position(monkeypatch) -> None:
 
     output_off = _redirect_update_output(redirect_blank_line=False)
     assert (clear + '\n') not in output_off, repr(output_off)
+
+
+_COLUMN = re.compile(r'\x1b\[(\d+)G')
+
+
+@pytest.fixture
+def diff_bar(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., typing.Any]:
+    return functools.partial(
+        make_bar,
+        widgets=[progressbar.Counter(), ' ', progressbar.Bar()],
+        max_value=100,
+        line_breaks=False,
+        enable_colors=False,
+        diff_redraw=True,
+        term_width=40,
+    )
+
+
+def _redraw(bar: progressbar.ProgressBar, value: int) -> str:
+    fd = typing.cast(io.StringIO, bar.fd)
+    fd.seek(0)
+    fd.truncate()
+    bar.update(value, force=True)
+    return fd.getvalue()
+
+
+def _apply(screen: str, output: str) -> str:
+    """Play `output` onto a one-line `screen`, like a terminal would."""
+    cells = list(screen)
+    column = 0
+    for part in re.split(r'(\r|\x1b\[\d+G)', output):
+        if part == '\r':
+            column = 0
+        elif match := _COLUMN.fullmatch(part):
+            column = int(match.group(1)) - 1
+        else:
+            for char in part:
+                if column < len(cells):
+                    cells[column] = char
+                else:
+                    cells.append(char)
+                column += 1
+    return ''.join(cells)
+
+
+def test_only_changed_columns_are_written(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = diff_bar().start()
+    screen = _apply('', typing.cast(io.StringIO, bar.fd).getvalue())
+
+    for value in (11, 12, 50, 99):
+        output = _redraw(bar, value)
+        screen = _apply(screen, output)
+
+        assert not output.startswith('\r')
+        assert len(output) < bar.term_width
+        assert screen == utils.no_color(bar._format_line())
+    bar.finish()
+
+
+def test_nearby_changes_share_one_escape(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = diff_bar().start()
+    bar._last_line = 'a' * 40
+
+    output = bar._diff_redraw('b' + 'a' * 3 + 'b' + 'a' * 10 + 'b' + 'a' * 24)
+
+    assert output == '\x1b[1Gbaaab\x1b[16Gb'
+    bar.finish()
+
+
+def test_unchanged_line_writes_nothing(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = diff_bar().start()
+    _redraw(bar, 10)
+
+    assert _redraw(bar, 10) == ''
+    bar.finish()
+
+
+def test_scattered_changes_fall_back_to_a_full_rewrite(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = diff_bar().start()
+    bar._last_line = 'ab' * 20
+
+    assert bar._diff_redraw('ba' * 20) == '\r' + 'ba' * 20
+    bar.finish()
+
+
+@pytest.mark.parametrize(
+    'line',
+    [
+        '\x1b[31m' + 'x' * 35,
+        '█' * 40,
+        'x' * 39,
+    ],
+)
+def test_unknown_columns_are_rewritten(
+    diff_bar: collections.abc.Callable[..., typing.Any], line: str
+) -> None:
+    bar = diff_bar().start()
+    bar._last_line = 'y' * 40
+
+    assert bar._diff_redraw(line) == '\r' + line
+    # Nor is a line with escapes or wide characters a base for the next
+    assert bar._diff_redraw('y' * 40) == '\r' + 'y' * 40
+    bar.finish()
+
+
+def test_resize_forces_a_full_rewrite(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bar = diff_bar().start()
+    _redraw(bar, 10)
+
+    monkeypatch.setattr(utils, 'get_terminal_size', lambda: (40, 25))
+    bar._handle_resize()
+
+    assert _redraw(bar, 11).startswith('\r')
+    bar.finish()
+
+
+def test_cleared_line_forces_a_full_rewrite(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bar = diff_bar().start()
+    _redraw(bar, 10)
+
+    monkeypatch.setattr(utils.streams, 'needs_clear', lambda: True)
+    output = _redraw(bar, 11)
+
+    assert output == '\r' + ' ' * 40 + '\r\r' + utils.no_color(
+        bar._format_line()
+    )
+    bar.finish()
+
+
+def test_print_forces_a_full_rewrite(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = diff_bar().start()
+    _redraw(bar, 10)
+    bar.print('hello')
+
+    assert _redraw(bar, 11).startswith('\r')
+    bar.finish()
+
+
+def test_line_breaks_ignore_diff_redraw() -> None:
+    bar = progressbar.ProgressBar(
+        fd=io.StringIO(), max_value=10, line_breaks=True, diff_redraw=True
+    ).start()
+    bar.update(1, force=True)
+    bar.update(2, force=True)
+
+    lines = typing.cast(io.StringIO, bar.fd).getvalue().splitlines()
+    assert all('\x1b' not in line for line in lines)
+    bar.finish()
+
+
+def test_unpickled_bar_rewrites_the_whole_line(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = diff_bar().start()
+    _redraw(bar, 10)
+
+    assert bar._last_line is not None
+    assert bar._state.__getstate__()['_last_line'] is None
+    bar.finish()
+
+
+def test_multibar_turns_diff_redraw_off(
+    diff_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    multibar = progressbar.MultiBar(fd=io.StringIO())
+    bar = diff_bar()
+    multibar['a'] = bar
+
+    assert not bar.diff_redraw
@@ -1,8 +1,16 @@
-from datetime import timedelta
+from __future__ import annotations
+
+import collections.abc
+import io
+import pickle
+import time
+import typing
+from datetime import datetime, timedelta
 
 import pytest
 
 import progressbar
+import progressbar.bar as bar_module
 
 
 @pytest.mark.parametrize(
@@ -55,6 +63,130 @@ def test_intervals(monkeypatch, interval) -> None:
     assert bar.last_update_time == last_update_time
 
     # We should need an update if we're beyond the poll_interval
-    bar._last_update_time -= 2
+    updates = bar.updates
+    bar._last_update_ns -= 2 * 10**9
     bar.update(3)
-    assert bar.last_update_time != last_update_time
+    assert bar.updates == updates + 1
+
+
+def test_timestamps_are_integer_nanoseconds(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=10).start()
+    bar.update(5, force=True)
+
+    assert isinstance(bar._start_ns, int)
+    assert isinstance(bar._last_update_ns, int)
+    assert bar._end_ns is None
+    bar.finish()
+    assert isinstance(bar._end_ns, int)
+
+
+def test_views_are_built_once_per_timestamp(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=10).start()
+
+    assert bar.start_time is bar.start_time
+    assert isinstance(bar.start_time, datetime)
+    assert abs(bar.start_time - datetime.now()) < timedelta(seconds=1)
+    bar.finish()
+
+
+def test_assigned_datetime_round_trips(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=10).start()
+    start = datetime(2020, 1, 2, 3, 4, 5, 678901)
+    bar.start_time = start
+    bar._start_time_view = None  # Force the conversion back
+
+    assert bar.start_time == start
+    bar.start_time = None
+    assert bar.start_time is None
+
+    bar.set_last_update_time(start)
+    assert bar.get_last_update_time() is start
+    assert isinstance(
+        progressbar.ProgressBar.start_time, bar_module._ClockTime
+    )
+
+
+def test_initial_start_time_is_used(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    start = datetime.now() - timedelta(minutes=5)
+    bar = make_bar(max_value=10, start_time=start).start()
+
+    assert bar.start_time is start
+    assert bar.data()['total_seconds_elapsed'] == pytest.approx(300, abs=1)
+    bar.finish()
+
+
+def test_elapsed_fields_use_integer_arithmetic(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = make_bar(max_value=10).start()
+    elapsed = timedelta(days=1, hours=2, minutes=3, seconds=4.5)
+    elapsed_ns = elapsed // timedelta(microseconds=1) * 1000
+    bar._start_ns = bar._last_update_ns - elapsed_ns  # type: ignore[operator]
+    data = bar.data()
+
+    assert data['time_elapsed'] == elapsed
+    assert data['total_seconds_elapsed'] == elapsed.total_seconds()
+    assert data['days_elapsed'] == elapsed.total_seconds() / 86400
+    # Like `timedelta.seconds`, hours and minutes skip the microseconds
+    assert data['hours_elapsed'] == pytest.approx(2 + 3 / 60 + 4 / 3600)
+    assert data['minutes_elapsed'] == pytest.approx(3 + 4 / 60)
+    assert data['seconds_elapsed'] == 4.5
+    bar.finish()
+
+
+def test_redraw_reads_the_clock_once(
+    make_bar: collections.abc.Callable[..., typing.Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bar = make_bar(max_value=10).start()
+    reads: list[int] = []
+    real = time.perf_counter_ns
+
+    def counting() -> int:
+        reads.append(1)
+        return real()
+
+    monkeypatch.setattr(bar_module.time, 'perf_counter_ns', counting)
+    bar.update(5, force=True)
+
+    assert len(reads) == 1
+    bar.finish()
+
+
+def test_unpickled_bar_keeps_its_wall_clock_times(
+    make_bar: collections.abc.Callable[..., typing.Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bar = make_bar(max_value=10).start()
+    state = dict(bar.__getstate__())
+    # The streams can't be pickled, the hot state record can
+    state['_state'] = pickle.loads(pickle.dumps(state['_state']))
+
+    # Another process: same wall clock, different perf-counter origin
+    real = time.perf_counter_ns
+    monkeypatch.setattr(time, 'perf_counter_ns', lambda: real() - 10**12)
+    restored = progressbar.ProgressBar.__new__(progressbar.ProgressBar)
+    restored.__setstate__(state)
+
+    assert restored._start_ns != bar._start_ns
+    assert abs(restored.start_time - bar.start_time) < timedelta(seconds=1)
+    assert restored.end_time is None
+    bar.finish()
+
+
+def test_fast_bar_elapsed_stops_at_end_time() -> None:
+    bar = progressbar.FastProgressBar(fd=io.StringIO(), max_value=10)
+    assert bar._fast_elapsed() == 0.0
+
+    bar.start()
+    bar.start_time = datetime(2020, 1, 1)
+    bar.end_time = datetime(2020, 1, 1, 0, 0, 30)
+    assert bar._fast_elapsed() == 30.0
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import collections.abc
+import io
 import time
+import typing
 
 import pytest
 from python_utils import converters
 
 import progressbar
+from progressbar import utils
 
 
 @pytest.mark.parametrize(
@@ -31,3 +35,104 @@ def test_markers(name, markers: bytes | str, as_unicode) -> None:
     bar._MINIMUM_UPDATE_INTERVAL = 1e-12
     for _i in bar(iter(range(24))):
         time.sleep(0.001)
+
+
+@pytest.mark.parametrize(
+    'value, width',
+    [
+        ('', 0),
+        ('abc', 3),
+        (b'\x1b[31mabc\x1b[0m', 3),
+        ('\x1b[31m進捗\x1b[0m', 4),
+        ('\uff46\uff55\uff4c\uff4c', 8),  # fullwidth 'full'
+        ('🟩', 2),
+        ('é', 1),
+        ('👍️', 2),
+        ('a‍b', 2),
+        ('█▏', 2),
+    ],
+)
+def test_display_width(value: str | bytes, width: int) -> None:
+    assert utils.display_width(value) == width
+
+
+def test_non_ascii_widths_are_cached() -> None:
+    utils._unicode_width.cache_clear()
+    utils.display_width('進捗 abc')
+    utils.display_width('進捗 abc')
+    utils.display_width('ascii is not cached')
+
+    info = utils._unicode_width.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.fixture
+def format_line(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., str]:
+    """Return a function formatting a bar's line halfway."""
+
+    def format_line(**kwargs: typing.Any) -> str:
+        bar = make_bar(
+            max_value=10, term_width=40, enable_colors=False, **kwargs
+        )
+        bar.start()
+        bar.update(5, force=True)
+        line = bar._format_line()
+        bar.finish()
+        return line
+
+    return format_line
+
+
+@pytest.mark.parametrize('left_justify', [True, False])
+def test_wide_label_fills_the_line(
+    format_line: collections.abc.Callable[..., str], left_justify: bool
+) -> None:
+    line = format_line(
+        widgets=['進捗: ', progressbar.Bar(), ' ', progressbar.Counter()],
+        left_justify=left_justify,
+    )
+
+    assert utils.display_width(line) == 40
+    assert line.startswith('進捗: |')
+
+
+def test_wide_padding_follows_the_justification(
+    format_line: collections.abc.Callable[..., str],
+) -> None:
+    line = format_line(widgets=['進捗'], left_justify=False)
+
+    assert line == ' ' * 36 + '進捗'
+
+
+def test_wide_marker_fills_the_bar() -> None:
+    for value, filled in ((0, 0), (5, 9), (10, 19)):
+        bar = progressbar.ProgressBar(
+            fd=io.StringIO(),
+            max_value=10,
+            term_width=40,
+            enable_colors=False,
+            widgets=[progressbar.Bar(marker='🟩')],
+        ).start()
+        bar.update(value, force=True)
+        line = bar._format_line()
+        bar.finish()
+
+        assert utils.display_width(line) == 40
+        assert line.count('🟩') == filled
+
+
+def test_wide_range_markers_fill_their_share(
+    format_line: collections.abc.Callable[..., str],
+) -> None:
+    widget = progressbar.MultiRangeBar(
+        'ranges', markers=['🟩', '#'], left='', right=''
+    )
+
+    line = format_line(widgets=[widget], variables={'ranges': [1, 1]})
+    assert line == '🟩' * 10 + '#' * 20
+
+    # An odd share leaves one column for a space
+    line = format_line(widgets=['.', widget], variables={'ranges': [1, 1]})
+    assert line == '.' + '🟩' * 9 + ' ' + '#' * 20
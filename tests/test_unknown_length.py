@@ -44,7 +44,7 @@ def test_unknown_length_redraws_on_value_change() -> None:
     pb.previous_value = 2
     pb.value = 3
     # Make sure the min_poll_interval rate limit is not what blocks us
-    pb._last_update_timer -= 10
+    pb._last_update_ns -= 10 * 10**9
     assert pb._needs_update() is True
 
     pb.finish()
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import collections
+import collections.abc
+import functools
 import io
 import time
+import typing
 from datetime import timedelta
 
 import pytest
 
 import progressbar
+from progressbar import widgets
 
 
 def test_create_wrapper() -> None:
@@ -483,3 +488,409 @@ def test_granular_bar_unknown_length() -> None:
     # percent=0 means no marker characters filled in -- the whole width is
     # padded with the lowest (empty) marker.
     assert rendered == ' ' * 10, repr(rendered)
+
+
+class CountingBar(progressbar.Bar):
+    """A `Bar` that counts its `check_size` calls."""
+
+    checks = 0
+
+    def check_size(self, progress: typing.Any) -> bool:
+        CountingBar.checks += 1
+        return super().check_size(progress)
+
+
+@pytest.fixture
+def layout_bar(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., typing.Any]:
+    CountingBar.checks = 0
+    return functools.partial(
+        make_bar,
+        max_value=10,
+        term_width=40,
+        enable_colors=False,
+        line_breaks=False,
+        widgets=['[', CountingBar(), ']', ' ', progressbar.Percentage()],
+    )
+
+
+def _last_line(bar: progressbar.ProgressBar) -> str:
+    return bar.fd.getvalue().split('\r')[-1]  # type: ignore[attr-defined]
+
+
+def test_layout_is_reused_across_redraws(
+    layout_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = layout_bar().start()
+    layout = bar._layout
+    for i in range(10):
+        bar.update(i, force=True)
+
+    assert bar._layout is layout
+    assert CountingBar.checks == 1
+    bar.finish()
+
+
+def test_layout_matches_uncached_rendering(
+    layout_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = layout_bar().start()
+    bar.update(5, force=True)
+
+    assert _last_line(bar) == '[|' + '#' * 15 + ' ' * 16 + '|]  50%'
+    bar.finish()
+
+
+def test_term_width_change_rebuilds_layout(
+    layout_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = layout_bar().start()
+    layout = bar._layout
+    bar.term_width = 60
+    bar.update(5, force=True)
+
+    assert bar._layout is not layout
+    assert len(_last_line(bar)) == 60
+    bar.finish()
+
+
+def test_resize_drops_layout(
+    layout_bar: collections.abc.Callable[..., typing.Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bar = layout_bar().start()
+    monkeypatch.setattr(
+        progressbar.utils, 'get_terminal_size', lambda: (50, 20)
+    )
+    bar._handle_resize()
+
+    assert bar._layout is None
+    bar.update(5, force=True)
+    assert bar._layout is not None
+    assert bar._layout.term_width == 50
+    bar.finish()
+
+
+def test_inserted_widget_rebuilds_layout(
+    layout_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = layout_bar().start()
+    bar.widgets.insert(0, 'label: ')
+    bar.update(5, force=True)
+
+    assert _last_line(bar).startswith('label: [')
+    bar.finish()
+
+
+def test_skipped_widget_before_auto_width_widget() -> None:
+    bar = progressbar.ProgressBar(
+        fd=io.StringIO(),
+        max_value=10,
+        term_width=40,
+        enable_colors=False,
+        line_breaks=False,
+        widgets=[
+            progressbar.Percentage(min_width=100),
+            '|',
+            progressbar.Bar(marker='=', left='', right=''),
+            '|',
+        ],
+    ).start()
+    bar.update(5, force=True)
+
+    assert _last_line(bar) == '|' + '=' * 19 + ' ' * 19 + '|'
+    bar.finish()
+
+
+@pytest.fixture
+def bar_widgets(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., list[typing.Any]]:
+    """Return a function giving the widgets a new bar renders with."""
+
+    def bar_widgets(*widgets_: typing.Any) -> list[typing.Any]:
+        return make_bar(widgets=widgets_).widgets
+
+    return bar_widgets
+
+
+def test_copies_share_the_configuration(
+    bar_widgets: collections.abc.Callable[..., list[typing.Any]],
+) -> None:
+    bar = progressbar.Bar(
+        marker='#',
+        gradient_colors=dict(fg=progressbar.terminal.colors.gradient),
+    )
+    copy, other = bar_widgets(bar, bar)
+
+    assert copy is not bar
+    assert copy is not other
+    assert copy.marker is bar.marker
+    assert copy._gradient_colors is bar._gradient_colors
+
+
+def test_copy_fields_are_not_shared(
+    bar_widgets: collections.abc.Callable[..., list[typing.Any]],
+) -> None:
+    simple = progressbar.SimpleProgress()
+    (copy,) = bar_widgets(simple)
+    copy.max_width_cache['key'] = 1
+
+    assert 'key' not in simple.max_width_cache
+    assert copy.format is simple.format
+
+
+def test_smoothing_eta_copies_estimate_independently(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    eta = progressbar.SmoothingETA()
+    first = make_bar(widgets=[eta], max_value=100)
+    second = make_bar(widgets=[eta], max_value=100)
+    first_eta: typing.Any
+    second_eta: typing.Any
+    (first_eta,) = first.widgets
+    (second_eta,) = second.widgets
+
+    assert first_eta.smoothing_algorithm is not eta.smoothing_algorithm
+    assert first_eta.smoothing_algorithm is not second_eta.smoothing_algorithm
+
+    first.start()
+    second.start()
+    first.update(90, force=True)
+    second.update(10, force=True)
+
+    assert typing.cast(typing.Any, eta.smoothing_algorithm).value is None
+    assert first_eta.smoothing_algorithm.value == 45
+    assert second_eta.smoothing_algorithm.value == 5
+
+
+def test_format_custom_text_copies_get_their_own_mapping() -> None:
+    text = progressbar.FormatCustomText('%(name)s', dict(name='a'))
+    copy = typing.cast(progressbar.FormatCustomText, text._copy_for_bar())
+    copy.update_mapping(name='b')
+
+    assert text.mapping == dict(name='a')
+    assert copy.format is text.format
+
+
+def test_foreign_init_is_deep_copied(
+    bar_widgets: collections.abc.Callable[..., list[typing.Any]],
+) -> None:
+    class Remembering(progressbar.Counter):
+        def __init__(self) -> None:
+            super().__init__()
+            self.seen: list[int] = []
+
+    class Declared(Remembering):
+        copy_fields = ('seen',)
+
+    for widget in (Remembering(), Declared()):
+        (copy,) = bar_widgets(widget)
+        copy.seen.append(1)
+
+        assert widget.seen == []
+
+    # Without an `__init__` of its own there is nothing new to protect
+    class Renamed(progressbar.Counter):
+        pass
+
+    assert widgets._shares_configuration(Renamed)
+    assert not widgets._shares_configuration(Remembering)
+    assert widgets._shares_configuration(Declared)
+
+
+def test_other_widgets_are_copied_as_before(
+    bar_widgets: collections.abc.Callable[..., list[typing.Any]],
+) -> None:
+    def function(progress: typing.Any, data: typing.Any) -> str:
+        return ''
+
+    custom = progressbar.FormatCustomText('%(x)s', dict(x=1))
+    label = 'label'
+    copied_function, shared, same_label = bar_widgets(function, custom, label)
+
+    assert copied_function is function
+    assert shared is custom
+    assert same_label is label
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> collections.Counter[int]:
+    """Count `FormatWidgetMixin.__call__` calls per widget."""
+    counter: collections.Counter[int] = collections.Counter()
+    original = widgets.FormatWidgetMixin.__call__
+
+    def counting_call(
+        self: typing.Any, *args: typing.Any, **kwargs: typing.Any
+    ):
+        counter[id(self)] += 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(widgets.FormatWidgetMixin, '__call__', counting_call)
+    return counter
+
+
+@pytest.fixture
+def memo_bar(
+    make_bar: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., typing.Any]:
+    """Return a function creating a bar with the given widgets."""
+
+    def memo_bar(*widget_list: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return make_bar(
+            max_value=100,
+            term_width=60,
+            enable_colors=False,
+            line_breaks=False,
+            widgets=list(widget_list),
+            **kwargs,
+        )
+
+    return memo_bar
+
+
+def _last_text(bar: typing.Any) -> str:
+    return bar.fd.getvalue().split('\r')[-1].strip()
+
+
+def test_static_label_is_rendered_once(
+    memo_bar: collections.abc.Callable[..., typing.Any],
+    calls: collections.Counter[int],
+) -> None:
+    bar = memo_bar(
+        widgets.FormatLabel('static'), ' ', widgets.Counter()
+    ).start()
+    label, counter = bar.widgets[0], bar.widgets[2]
+    for i in range(1, 6):
+        bar.update(i, force=True)
+
+    assert calls[id(label)] == 1
+    assert calls[id(counter)] == 6
+    assert _last_text(bar) == 'static 5'
+    bar.finish()
+
+
+def test_unchanged_value_reuses_output(
+    memo_bar: collections.abc.Callable[..., typing.Any],
+    calls: collections.Counter[int],
+) -> None:
+    bar = memo_bar(widgets.Counter(), ' ', widgets.Percentage()).start()
+    counter, percentage = bar.widgets[0], bar.widgets[2]
+    for _ in range(3):
+        bar.update(10, force=True)
+
+    assert calls[id(counter)] == 2
+    assert calls[id(percentage)] == 2
+    assert _last_text(bar) == '10  10%'
+    bar.finish()
+
+
+def test_variable_change_rerenders(
+    memo_bar: collections.abc.Callable[..., typing.Any],
+    calls: collections.Counter[int],
+) -> None:
+    bar = memo_bar(widgets.Variable('loss'), variables={'loss': 1}).start()
+    variable = bar.widgets[0]
+    bar.update(force=True)
+    bar.update(loss=0.5)
+
+    assert calls[id(variable)] == 0  # Variable formats by itself
+    assert _last_text(bar) == 'loss:    0.5'
+    bar.finish()
+
+
+def test_postfix_mutated_in_place_rerenders(
+    memo_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    postfix = {'loss': 1}
+    bar = memo_bar(widgets.Postfix(), variables={'postfix': postfix}).start()
+    postfix['loss'] = 2
+    bar.update(force=True)
+
+    assert _last_text(bar) == 'loss=2'
+    bar.finish()
+
+
+def test_int_and_float_values_are_different(
+    memo_bar: collections.abc.Callable[..., typing.Any],
+    calls: collections.Counter[int],
+) -> None:
+    bar = memo_bar(widgets.FormatLabel('%(value)s')).start()
+    bar.update(1, force=True)
+    bar.update(1.0, force=True)
+
+    assert _last_text(bar) == '1.0'
+    bar.finish()
+
+
+def test_overridden_call_is_not_memoized(
+    memo_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    class Clock(widgets.FormatLabel):
+        ticks = 0
+
+        def __call__(
+            self, progress: typing.Any, data: typing.Any, format=None
+        ):
+            Clock.ticks += 1
+            return str(Clock.ticks)
+
+    bar = memo_bar(Clock('static')).start()
+    assert bar.widgets[0].get_data_fields() is None
+    bar.update(force=True)
+    bar.update(force=True)
+
+    assert _last_text(bar) == '3'
+    bar.finish()
+
+
+@pytest.mark.parametrize(
+    'widget, expected',
+    [
+        (widgets.FormatLabel('static'), ()),
+        (widgets.FormatLabel('%(elapsed)s'), ('total_seconds_elapsed',)),
+        (widgets.Counter(), ('value',)),
+        (widgets.Percentage(), ('percentage',)),
+        (widgets.Postfix(), ('variables.postfix',)),
+        (widgets.Variable('loss'), ('variables.loss',)),
+        (widgets.Timer(), ('total_seconds_elapsed',)),
+        (widgets.ETA(), None),
+        (widgets.SimpleProgress(), None),
+        (widgets.FormatLabel('%s'), None),
+        (widgets.FormatLabel('{}', new_style=True), None),
+        (widgets.FormatLabel('{0', new_style=True), None),
+        (widgets.FormatLabel('{value:{0}}', new_style=True), None),
+        (
+            widgets.FormatLabel(
+                '{variables[loss]:{width}} {dynamic_messages}',
+                new_style=True,
+            ),
+            ('variables.loss', 'width', 'dynamic_messages'),
+        ),
+        (widgets.Percentage(na='{0}', new_style=True), None),
+    ],
+)
+def test_declared_data_fields(
+    widget: widgets.WidgetBase,
+    expected: tuple[str, ...] | None,
+) -> None:
+    assert widget.get_data_fields() == expected
+
+
+def test_variable_with_positional_format_is_not_memoized() -> None:
+    widget = widgets.Variable('loss', format='{}')
+    assert widget.get_data_fields() is None
+
+
+def test_missing_field_is_not_memoized(
+    memo_bar: collections.abc.Callable[..., typing.Any],
+) -> None:
+    bar = memo_bar(widgets.Postfix('missing'), ' ', widgets.Counter()).start()
+    bar.variables.pop('missing')
+    bar.update(5, force=True)
+
+    assert bar._layout is not None
+    assert bar._layout.memo[0] is None
+    assert _last_text(bar) == '5'
+    bar.finish()
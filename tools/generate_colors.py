@@ -19,12 +19,13 @@ Usage (rewrites the file in place)::
 
     python tools/generate_colors.py progressbar/terminal/colors.py
 
-The generator parses the *current* file to recover the ordered
-``(binding, RGB, name, xterm)`` tuples, so name/order fidelity is
-guaranteed however the file happens to be reflowed. It is idempotent:
-running it twice produces a byte-identical file, because the HSL column is
-always recomputed from RGB and never read back. Pass ``--check`` to verify
-that without writing (exit status 1 if the file is stale).
+The generator parses the *current* ``_XTERM`` table to recover the ordered
+``(binding, name, RGB)`` rows, the xterm index being the row's position, so
+name/order fidelity is guaranteed however the file happens to be reflowed.
+It is idempotent: running it twice produces a byte-identical file, because
+the HSL columns are always recomputed from RGB and never read back. Pass
+``--check`` to verify that without writing (exit status 1 if the file is
+stale).
 """
 
 from __future__ import annotations
@@ -42,9 +43,11 @@ if str(_REPO_ROOT) not in sys.path:
 
 from progressbar.terminal.base import HSL, RGB  # noqa: E402
 
-#: Maximum line length (matches ``ruff.toml``); longer calls are wrapped one
-#: argument per line, exactly as ``ruff format`` would.
+#: Maximum line length (matches ``ruff.toml``). Every row fits on one line,
+#: which is what ``ruff format`` leaves alone.
 LINE_LENGTH: int = 79
+#: The name of the table in colors.py.
+TABLE: str = '_XTERM'
 
 
 class Entry(typing.NamedTuple):
@@ -68,103 +71,66 @@ def _str_constant(node: ast.expr) -> str:
     return node.value
 
 
-def _is_register_call(node: ast.stmt) -> bool:
-    return (
-        isinstance(node, ast.Assign)
-        and len(node.targets) == 1
-        and isinstance(node.targets[0], ast.Name)
-        and isinstance(node.value, ast.Call)
-        and isinstance(node.value.func, ast.Attribute)
-        and node.value.func.attr == 'register'
-        and isinstance(node.value.func.value, ast.Name)
-        and node.value.func.value.id == 'Colors'
-    )
-
-
-def _parse_rgb(node: ast.expr) -> RGB:
-    if not (
-        isinstance(node, ast.Call)
-        and isinstance(node.func, ast.Name)
-        and node.func.id == 'RGB'
-        and len(node.args) == 3
-    ):
-        raise ValueError(f'expected an RGB(...) call, got {ast.dump(node)}')
-    return RGB(*(_int_constant(arg) for arg in node.args))
+def _table_node(tree: ast.Module) -> ast.Tuple:
+    for node in tree.body:
+        if (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == TABLE
+            and isinstance(node.value, ast.Tuple)
+        ):
+            return node.value
+    raise ValueError(f'no {TABLE} = (...) table found')
 
 
 def parse_entries(source: str) -> tuple[list[Entry], str, str]:
     """Extract the ordered colour entries plus the file header and footer.
 
-    The header is everything before the first ``Colors.register`` assignment
-    and the footer everything after the last one; both are copied verbatim so
-    the non-generated aliases and gradients survive untouched.
+    The header is everything before the first row of the ``_XTERM`` table
+    and the footer everything after the last one; both are copied verbatim
+    so the lookup code and the gradients survive untouched.
     """
-    tree = ast.parse(source)
-    register_nodes = [
-        typing.cast('ast.Assign', node)
-        for node in tree.body
-        if _is_register_call(node)
-    ]
-    if not register_nodes:
-        raise ValueError('no Colors.register(...) assignments found')
-
-    first, last = register_nodes[0], register_nodes[-1]
-    # The register block must be one contiguous run; a stray statement in the
-    # middle would be silently dropped by the header/footer split below.
-    for node in tree.body:
-        if (
-            first.lineno <= node.lineno <= last.lineno
-            and not _is_register_call(node)
-        ):
-            raise ValueError(
-                f'unexpected non-register statement at line {node.lineno}',
-            )
+    rows = _table_node(ast.parse(source)).elts
+    if not rows:
+        raise ValueError(f'{TABLE} has no rows')
 
     entries: list[Entry] = []
-    for node in register_nodes:
-        call = typing.cast('ast.Call', node.value)
-        if len(call.args) != 4 or call.keywords:
-            raise ValueError(
-                f'unexpected register signature at line {node.lineno}',
-            )
-        target = typing.cast('ast.Name', node.targets[0])
+    for xterm, row in enumerate(rows):
+        if not isinstance(row, ast.Tuple) or len(row.elts) != 8:
+            raise ValueError(f'unexpected table row at line {row.lineno}')
+        binding, name, *rgb = row.elts[:5]
         entries.append(
             Entry(
-                binding=target.id,
-                rgb=_parse_rgb(call.args[0]),
-                name=_str_constant(call.args[2]),
-                xterm=_int_constant(call.args[3]),
+                binding=_str_constant(binding),
+                rgb=RGB(*(_int_constant(value) for value in rgb)),
+                name=_str_constant(name),
+                xterm=xterm,
             ),
         )
 
     lines = source.splitlines(keepends=True)
-    header = ''.join(lines[: first.lineno - 1])
-    footer = ''.join(lines[last.end_lineno :])
+    header = ''.join(lines[: rows[0].lineno - 1])
+    footer = ''.join(lines[typing.cast(int, rows[-1].end_lineno) :])
     return entries, header, footer
 
 
 def render_entry(entry: Entry) -> str:
-    """Render one register call, wrapping only when it exceeds the limit."""
+    """Render one table row; the xterm index is the row's position."""
     hsl = HSL.from_rgb(entry.rgb)
-    rgb_src = f'RGB({entry.rgb.red}, {entry.rgb.green}, {entry.rgb.blue})'
     # ``from_rgb`` rounds to ints; render them as ints (no trailing ``.0``).
-    hsl_src = (
-        f'HSL({int(hsl.hue)}, {int(hsl.saturation)}, {int(hsl.lightness)})'
-    )
-    args = f'{rgb_src}, {hsl_src}, {entry.name!r}, {entry.xterm}'
-    single = f'{entry.binding} = Colors.register({args})'
-    if len(single) <= LINE_LENGTH:
-        return single + '\n'
-
-    # Black/ruff style: one argument per line with a magic trailing comma.
-    return (
-        f'{entry.binding} = Colors.register(\n'
-        f'    {rgb_src},\n'
-        f'    {hsl_src},\n'
-        f'    {entry.name!r},\n'
-        f'    {entry.xterm},\n'
-        ')\n'
+    values = (
+        entry.rgb.red,
+        entry.rgb.green,
+        entry.rgb.blue,
+        int(hsl.hue),
+        int(hsl.saturation),
+        int(hsl.lightness),
     )
+    row = f'    ({entry.binding!r}, {entry.name!r}, '
+    row += ', '.join(map(str, values)) + '),'
+    if len(row) > LINE_LENGTH:
+        raise ValueError(f'{entry.binding} does not fit on one line')
+    return row + '\n'
 
 
 def render(source: str) -> str: